@@ -0,0 +1,93 @@
+"""Per-click cost of catalog navigation: linear scans vs. the database/schema index.
+
+Builds a synthetic catalog and times one database -> schema -> node navigation
+step the way explore() used to do it (sorting and filtering all nodes on every
+selection) and with the index built by ``Catalog`` on load.
+
+Usage:
+    python benchmarks/bench_catalog_index.py [--nodes 200000] [--clicks 50]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from dbt_cloud.demo.catalog import Catalog, NodeType
+
+
+def make_catalog_dict(n_nodes: int, n_databases: int, n_schemas: int) -> dict:
+    nodes = {}
+    for i in range(n_nodes):
+        unique_id = f"model.project.model_{i}"
+        nodes[unique_id] = {
+            "unique_id": unique_id,
+            "metadata": {
+                "type": "BASE TABLE",
+                "database": f"database_{i % n_databases}",
+                "schema": f"schema_{i % n_schemas}",
+                "name": f"model_{i}",
+                "comment": None,
+                "owner": "dbt",
+            },
+            "columns": {
+                "id": {"type": "INT64", "index": 1, "name": "id", "comment": None}
+            },
+            "stats": {},
+        }
+    return {"metadata": {}, "nodes": nodes, "sources": {}}
+
+
+def navigate_by_scanning(catalog: Catalog, rng: random.Random):
+    nodes = list(catalog.nodes.values())
+    databases = sorted(set(map(lambda x: x.database, nodes)))
+    database = rng.choice(databases)
+    nodes_filtered = list(filter(lambda x: x.database == database, nodes))
+    schemas = sorted(set(map(lambda x: x.schema, nodes_filtered)))
+    schema = rng.choice(schemas)
+    nodes_filtered = list(filter(lambda x: x.schema == schema, nodes_filtered))
+    return sorted(nodes_filtered)
+
+
+def navigate_by_index(catalog: Catalog, rng: random.Random):
+    database = rng.choice(catalog.get_databases(NodeType.NODE))
+    schema = rng.choice(catalog.get_schemas(NodeType.NODE, database))
+    return catalog.get_nodes(NodeType.NODE, database, schema)
+
+
+def measure(navigate, catalog: Catalog, clicks: int) -> list:
+    rng = random.Random(0)
+    latencies = []
+    for _ in range(clicks):
+        start = time.perf_counter()
+        navigate(catalog, rng)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=200_000)
+    parser.add_argument("--databases", type=int, default=4)
+    parser.add_argument("--schemas", type=int, default=50)
+    parser.add_argument("--clicks", type=int, default=50)
+    args = parser.parse_args()
+
+    catalog_dict = make_catalog_dict(args.nodes, args.databases, args.schemas)
+    start = time.perf_counter()
+    catalog = Catalog.model_validate(catalog_dict)
+    print(f"load + index {args.nodes} nodes: {time.perf_counter() - start:.2f} s")
+
+    for name, navigate in [
+        ("scan", navigate_by_scanning),
+        ("index", navigate_by_index),
+    ]:
+        latencies = measure(navigate, catalog, args.clicks)
+        print(
+            f"{name:<6} mean {statistics.mean(latencies):9.3f} ms  "
+            f"median {statistics.median(latencies):9.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Peak and retained memory of the catalog loaders.
+
+Writes a synthetic catalog.json and loads it with ``load_catalog`` (pydantic
+models) and ``load_catalog_streaming`` (compact nodes), tracing allocations with
+tracemalloc.
+
+Usage:
+    python benchmarks/bench_catalog_memory.py [--nodes 20000] [--columns 20]
+"""
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from bench_catalog_search import make_catalog_dict
+
+from dbt_cloud.demo.catalog import load_catalog, load_catalog_streaming
+
+
+def measure(load, path: str):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    catalog = load(path)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalog
+    return elapsed, retained, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--columns", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.json")
+        with open(path, "w") as f:
+            json.dump(make_catalog_dict(args.nodes, args.columns), f)
+        size = os.path.getsize(path)
+        print(f"catalog.json: {size / 2**20:.1f} MiB")
+        for name, load in [
+            ("pydantic", load_catalog),
+            ("streaming", load_catalog_streaming),
+        ]:
+            elapsed, retained, peak = measure(load, path)
+            print(
+                f"{name:<10} {elapsed:6.2f} s  "
+                f"peak {peak / 2**20:8.1f} MiB ({peak / size:4.1f}x file)  "
+                f"retained {retained / 2**20:8.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
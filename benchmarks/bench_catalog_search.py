@@ -0,0 +1,88 @@
+"""Build time and query latency of the catalog search index.
+
+Builds a synthetic catalog with names and comments drawn from a small word list
+and times ``Catalog.search`` for exact, prefix, multi-term and misspelled queries.
+
+Usage:
+    python benchmarks/bench_catalog_search.py [--nodes 50000] [--columns 6]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from dbt_cloud.demo.catalog import Catalog
+
+WORDS = [
+    "customer", "order", "payment", "invoice", "product", "session", "event",
+    "account", "user", "address", "shipment", "refund", "campaign", "channel",
+    "revenue", "discount", "subscription", "inventory", "warehouse", "supplier",
+    "status", "amount", "created", "updated", "country", "currency", "region",
+]  # fmt: skip
+
+QUERIES = ["customer", "cust", "payment amount", "warehous", "subscripton", "zzz"]
+
+
+def make_name(rng: random.Random, n_words: int) -> str:
+    return "_".join(rng.choice(WORDS) for _ in range(n_words))
+
+
+def make_catalog_dict(n_nodes: int, n_columns: int) -> dict:
+    rng = random.Random(0)
+    nodes = {}
+    for i in range(n_nodes):
+        unique_id = f"model.project.node_{i}"
+        columns = {}
+        for index in range(1, n_columns + 1):
+            name = f"{make_name(rng, 2)}_{index}"
+            columns[name] = {
+                "type": "STRING",
+                "index": index,
+                "name": name,
+                "comment": f"The {make_name(rng, 1)} of the {make_name(rng, 1)}",
+            }
+        nodes[unique_id] = {
+            "unique_id": unique_id,
+            "metadata": {
+                "type": "BASE TABLE",
+                "database": "analytics",
+                "schema": f"schema_{i % 50}",
+                "name": f"{make_name(rng, 3)}_{i}",
+                "comment": None,
+            },
+            "columns": columns,
+            "stats": {},
+        }
+    return {"metadata": {}, "nodes": nodes, "sources": {}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--columns", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    catalog = Catalog.model_validate(make_catalog_dict(args.nodes, args.columns))
+    start = time.perf_counter()
+    catalog.search("warmup")
+    print(
+        f"index {args.nodes} nodes / {args.nodes * args.columns} columns: "
+        f"{time.perf_counter() - start:.2f} s"
+    )
+
+    for query in QUERIES:
+        latencies = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = catalog.search(query)
+            latencies.append((time.perf_counter() - start) * 1000)
+        print(
+            f"{query!r:<18} median {statistics.median(latencies):8.2f} ms  "
+            f"top: {results[0].node.name if results else '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Encoding and decoding time of a large run list with each JSON backend.
+
+Times json_to_dict() on the response body and dict_to_json() with indentation
+(the default CLI output) and without it (--compact) for the json and orjson
+backends.
+
+Usage:
+    python benchmarks/bench_serde.py [--runs 20000] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import time
+
+from dbt_cloud import serde
+
+
+def make_run_list(n_runs: int) -> dict:
+    runs = [
+        {
+            "id": i,
+            "account_id": 123456,
+            "job_definition_id": i % 100,
+            "status": 10,
+            "status_humanized": "Success",
+            "git_sha": "0123456789abcdef0123456789abcdef01234567",
+            "created_at": "2024-01-01 00:00:00.000000+00:00",
+            "duration": "00:01:23",
+            "in_progress": False,
+            "is_complete": True,
+            "trigger": {"id": i, "cause": "Triggered via API", "schema_override": None},
+            "href": f"https://cloud.getdbt.com/#/accounts/123456/runs/{i}/",
+        }
+        for i in range(n_runs)
+    ]
+    return {"status": {"code": 200}, "data": runs, "extra": {"pagination": {}}}
+
+
+def median_ms(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    value = make_run_list(args.runs)
+    body = serde.JsonBackend().dumpb(value)
+    print(f"run list: {args.runs} runs, {len(body) / 2**20:.1f} MiB")
+    backends = ["json"] + (["orjson"] if serde.orjson is not None else [])
+    for name in backends:
+        serde.configure_json_backend(name)
+        for label, function in [
+            ("decode", lambda: serde.json_to_dict(body)),
+            ("encode", lambda: serde.dict_to_json(value)),
+            ("encode compact", lambda: serde.dict_to_json_line(value)),
+        ]:
+            print(f"{name:<7} {label:<15} {median_ms(function, args.repeat):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Per-request latency of one-off requests vs. the shared keep-alive session.
+
+Starts a local HTTP/1.1 stand-in for the dbt Cloud API and times the same GET
+with module-level ``requests.get`` (new connection per request) and with
+``DbtCloudCommand.request`` (pooled connection).
+
+Usage:
+    python benchmarks/bench_session.py [--requests 500]
+"""
+
+import argparse
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from dbt_cloud.command.command import DbtCloudCommand
+
+BODY = b'{"status": {"code": 200}, "data": []}'
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure(send, n: int) -> list:
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        send().raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(name: str, latencies: list):
+    print(
+        f"{name:<12} mean {statistics.mean(latencies):6.3f} ms  "
+        f"median {statistics.median(latencies):6.3f} ms  "
+        f"p95 {sorted(latencies)[int(len(latencies) * 0.95)]:6.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/api/v2/accounts/1/runs/"
+    command = DbtCloudCommand(api_token="benchmark", dbt_cloud_host="127.0.0.1")
+
+    try:
+        report("unpooled", measure(lambda: requests.get(url), args.requests))
+        report("pooled", measure(lambda: command.request("get", url), args.requests))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Startup time of the dbt-cloud CLI.
+
+Times `import dbt_cloud.cli` with ``python -X importtime`` and the wall clock time
+of ``dbt-cloud --help`` and ``dbt-cloud run --help``, and lists the slowest
+imports. With ``--max-ms``, exits non-zero if the import takes longer, so that
+the benchmark can guard against startup regressions (e.g. a command module
+imported eagerly from dbt_cloud/cli/__init__.py).
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--top 10] [--max-ms 150]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+def import_times(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def time_command(args: list, repeat: int) -> float:
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(args, capture_output=True, check=True)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    import_ms = statistics.median(
+        import_times("dbt_cloud.cli")["dbt_cloud.cli"] for _ in range(args.repeat)
+    )
+    print(f"import dbt_cloud.cli   median {import_ms:8.1f} ms")
+    times = import_times("dbt_cloud.cli")
+    del times["dbt_cloud.cli"]
+    for name, ms in sorted(times.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"  {name:<40} {ms:8.1f} ms")
+
+    cli = [sys.executable, "-c", "from dbt_cloud.cli import dbt_cloud; dbt_cloud()"]
+    for command in (["--help"], ["run", "--help"], ["run", "get", "--help"]):
+        ms = time_command(cli + command, args.repeat)
+        print(f"dbt-cloud {' '.join(command):<14} median {ms:8.1f} ms")
+
+    if args.max_ms is not None and import_ms > args.max_ms:
+        print(f"import dbt_cloud.cli took {import_ms:.1f} ms > {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Decoding time and peak memory of a large tool result, with and without shaping.
+
+Writes a synthetic run list response (runs with run steps and their logs, like
+run_list with include_related) to a file and decodes it fully with json.load
+and with shape_result() using a field projection, an item limit and a byte
+budget, tracing allocations with tracemalloc in a second, untimed pass.
+
+Usage:
+    python benchmarks/bench_tool_results.py [--runs 2000] [--log-size 5000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from dbt_cloud.tools import ResultShape, shape_result
+
+
+def make_run_list(n_runs: int, log_size: int) -> dict:
+    runs = [
+        {
+            "id": i,
+            "job_definition_id": i % 20,
+            "status": 10,
+            "status_humanized": "Success",
+            "created_at": "2024-01-01 00:00:00.000000+00:00",
+            "trigger": {"cause": f"Scheduled run {i}", "git_sha": None},
+            "run_steps": [
+                {
+                    "index": step,
+                    "name": f"Invoke dbt with `dbt run --select model_{step}`",
+                    "status_humanized": "Success",
+                    "logs": "x" * log_size,
+                    "debug_logs": "y" * log_size,
+                }
+                for step in range(1, 4)
+            ],
+        }
+        for i in range(n_runs)
+    ]
+    return {
+        "status": {"code": 200},
+        "data": runs,
+        "extra": {"pagination": {"count": n_runs, "total_count": n_runs}},
+    }
+
+
+def measure(decode, path: str):
+    # Timed without tracemalloc, which slows down allocations a lot
+    gc.collect()
+    start = time.perf_counter()
+    with open(path) as f:
+        result = decode(f)
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    with open(path) as f:
+        result = decode(f)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--log-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    shape = ResultShape(
+        fields=["id", "status_humanized", "trigger.cause", "run_steps.name"],
+        max_items=50,
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "runs.json")
+        with open(path, "w") as f:
+            json.dump(make_run_list(args.runs, args.log_size), f)
+        print(f"response: {os.path.getsize(path) / 2**20:.1f} MiB")
+        for name, decode in [
+            ("json.load", json.load),
+            ("fields", lambda f: shape_result(f, ResultShape(fields=shape.fields))),
+            ("fields+limit", lambda f: shape_result(f, shape)),
+            ("max_bytes", lambda f: shape_result(f, ResultShape(max_bytes=2**20))),
+        ]:
+            elapsed, peak, size = measure(decode, path)
+            print(
+                f"{name:<13} {elapsed * 1000:8.1f} ms  "
+                f"peak {peak / 2**20:8.1f} MiB  result {size / 1024:9.1f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Per-call cost of get_openai_tools() and get_anthropic_tools().
+
+Compares generating the tool definitions from the command models on every call
+(as before the cache) with the cached definitions, for all tools and for a
+small include-set.
+
+Usage:
+    python benchmarks/bench_tools_schema.py [--repeat 2000]
+"""
+
+import argparse
+import timeit
+
+from dbt_cloud import tools
+
+
+def generate(tool_format: str, include=None) -> list:
+    return [
+        tools._build_tool_definition(name, cls, tool_format)
+        for name, cls in tools.TOOL_REGISTRY.items()
+        if include is None or name in include
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    for include in [None, ["job_get", "run_get", "run_list"]]:
+        label = "all tools" if include is None else f"{len(include)} tools"
+        for tool_format, cached in [
+            ("openai", tools.get_openai_tools),
+            ("anthropic", tools.get_anthropic_tools),
+        ]:
+            for name, call in [
+                ("uncached", lambda: generate(tool_format, include)),
+                ("cached", lambda: cached(include)),
+            ]:
+                seconds = timeit.timeit(call, number=args.repeat) / args.repeat
+                print(
+                    f"{label:<10} {tool_format:<10} {name:<9} "
+                    f"{seconds * 1e6:9.1f} us/call"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+from dbt_cloud.field import get_env
+
+DEFAULT_CACHE_MAX_SIZE = 1024**3
+
+
+def get_cache_home() -> str:
+    """Returns the user's dbt-cloud cache directory (~/.cache/dbt-cloud by default)."""
+    cache_home = get_env("XDG_CACHE_HOME", allow_none=True) or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "dbt-cloud")
+
+
+def get_default_cache_dir() -> str:
+    return os.path.join(get_cache_home(), "artifacts")
+
+
+class ArtifactCache:
+    """A size-bounded, content-addressed on-disk cache for run artifacts.
+
+    Artifact contents are stored once per SHA-256 digest under `objects/`, and every
+    cache key (e.g. host, account, run, step and path) points to a digest through a
+    small file under `refs/`. Identical artifacts of different runs are therefore
+    stored only once. When the objects exceed `max_size` bytes, the least recently
+    used ones are evicted; refs to evicted objects are removed when they are next
+    looked up. All writes go through a temporary file and a rename, so the cache
+    can be shared by concurrent processes.
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_CACHE_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self.objects_dir = os.path.join(directory, "objects")
+        self.refs_dir = os.path.join(directory, "refs")
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+    def _ref_path(self, key: str) -> str:
+        return os.path.join(self.refs_dir, key)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest)
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the path of the cached file for key, or None on a cache miss."""
+        try:
+            with open(self._ref_path(key)) as f:
+                object_path = self._object_path(f.read().strip())
+            os.utime(object_path)
+        except FileNotFoundError:
+            self._remove(self._ref_path(key))
+            return None
+        return object_path
+
+    @contextmanager
+    def writer(self, key: str) -> Iterator[BinaryIO]:
+        """Yields a binary file to write the content of key into.
+
+        The content is added to the cache only if the with block completes without
+        an exception.
+        """
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.refs_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.objects_dir, suffix=".tmp")
+        try:
+            with _HashingWriter(os.fdopen(fd, "wb")) as f:
+                yield f
+            os.replace(temp_path, self._object_path(f.hexdigest()))
+        except BaseException:
+            self._remove(temp_path)
+            raise
+        self._write_ref(key, f.hexdigest())
+        self.evict()
+
+    def _write_ref(self, key: str, digest: str):
+        fd, temp_path = tempfile.mkstemp(dir=self.refs_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(digest)
+        os.replace(temp_path, self._ref_path(key))
+
+    def evict(self):
+        """Removes the least recently used objects until the cache fits in max_size."""
+        objects = []
+        for entry in os.scandir(self.objects_dir):
+            if entry.name.endswith(".tmp"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            objects.append((stat.st_mtime, stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in objects)
+        for _, size, path in sorted(objects):
+            if total_size <= self.max_size:
+                break
+            self._remove(path)
+            total_size -= size
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class _HashingWriter:
+    """Wraps a binary file and computes the SHA-256 digest of everything written."""
+
+    def __init__(self, file: BinaryIO):
+        self._file = file
+        self._hash = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._hash.update(data)
+        return self._file.write(data)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._file.close()
+
+
+def get_artifact_cache() -> Optional[ArtifactCache]:
+    """Returns the artifact cache, or None if caching is disabled.
+
+    The cache is configured from the DBT_CLOUD_CACHE_DIR (default:
+    ~/.cache/dbt-cloud/artifacts) and DBT_CLOUD_CACHE_MAX_SIZE (bytes, default 1 GiB)
+    environment variables. A max size of 0 disables the cache.
+    """
+    max_size = int(get_env("DBT_CLOUD_CACHE_MAX_SIZE", default=DEFAULT_CACHE_MAX_SIZE))
+    if max_size <= 0:
+        return None
+    directory = get_env("DBT_CLOUD_CACHE_DIR", allow_none=True)
+    return ArtifactCache(
+        directory=os.path.expanduser(directory or get_default_cache_dir()),
+        max_size=max_size,
+    )
@@ -0,0 +1,153 @@
+import os
+import logging
+import click
+from dbt_cloud.cli.lazy import LazyGroup
+
+# The commands of each group live in a module of this package and are imported
+# only when used, which keeps the startup of the CLI fast (see
+# benchmarks/bench_startup.py).
+
+
+@click.group(help="The dbt Cloud command line interface.")
+@click.option(
+    "--compact",
+    is_flag=True,
+    envvar="DBT_CLOUD_COMPACT_OUTPUT",
+    help="Print JSON output on one line without indentation (for machine consumers).",
+)
+def dbt_cloud(compact):
+    import http.client as http_client
+    from dbt_cloud.serde import set_compact_output
+
+    set_compact_output(compact)
+
+    level = os.environ.get("LOG_LEVEL", "INFO").upper()
+    logging.basicConfig(level=level)
+    requests_logger = logging.getLogger("requests.packages.urllib3")
+    requests_logger.setLevel(level)
+    requests_logger.propagate = True
+    if level == "DEBUG":
+        http_client.HTTPConnection.debuglevel = 1
+
+
+@dbt_cloud.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": "dbt_cloud.cli.job:create",
+        "delete": "dbt_cloud.cli.job:delete",
+        "delete-all": "dbt_cloud.cli.job:delete_all",
+        "export": "dbt_cloud.cli.job:export",
+        "get": "dbt_cloud.cli.job:get",
+        "import": "dbt_cloud.cli.job:import_job",
+        "list": "dbt_cloud.cli.job:list",
+        "run": "dbt_cloud.cli.job:run",
+        "run-many": "dbt_cloud.cli.job:run_many",
+    },
+    help="Interact with dbt Cloud jobs.",
+)
+def job():
+    pass
+
+
+@dbt_cloud.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "cancel": "dbt_cloud.cli.run:cancel",
+        "cancel-all": "dbt_cloud.cli.run:cancel_all",
+        "download-artifacts": "dbt_cloud.cli.run:download_artifacts",
+        "get": "dbt_cloud.cli.run:get",
+        "get-artifact": "dbt_cloud.cli.run:get_artifact",
+        "list": "dbt_cloud.cli.run:list",
+        "list-artifacts": "dbt_cloud.cli.run:list_artifacts",
+    },
+    help="Interact with dbt Cloud job runs.",
+    name="run",
+)
+def job_run():
+    pass
+
+
+@dbt_cloud.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": "dbt_cloud.cli.project:create",
+        "delete": "dbt_cloud.cli.project:delete",
+        "get": "dbt_cloud.cli.project:get",
+        "list": "dbt_cloud.cli.project:list",
+        "update": "dbt_cloud.cli.project:update",
+    },
+    help="Interact with dbt Cloud projects.",
+)
+def project():
+    pass
+
+
+@dbt_cloud.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": "dbt_cloud.cli.environment:create",
+        "delete": "dbt_cloud.cli.environment:delete",
+        "get": "dbt_cloud.cli.environment:get",
+        "list": "dbt_cloud.cli.environment:list",
+    },
+    help="Interact with dbt Cloud environments.",
+)
+def environment():
+    pass
+
+
+@dbt_cloud.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "create": "dbt_cloud.cli.connection:create",
+        "delete": "dbt_cloud.cli.connection:delete",
+        "get": "dbt_cloud.cli.connection:get",
+        "list": "dbt_cloud.cli.connection:list",
+    },
+    help="Interact with dbt Cloud database connections.",
+)
+def connection():
+    pass
+
+
+@dbt_cloud.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "get": "dbt_cloud.cli.account:get",
+        "list": "dbt_cloud.cli.account:list",
+    },
+    help="Interact with dbt Cloud accounts.",
+)
+def account():
+    pass
+
+
+@dbt_cloud.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "get": "dbt_cloud.cli.audit_log:get",
+    },
+    help="Interact with dbt Cloud audit logs (Enterprise only).",
+)
+def audit_log():
+    pass
+
+
+@dbt_cloud.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "query": "dbt_cloud.cli.metadata:query",
+    },
+    help="Interact with the dbt Cloud Metadata API.",
+)
+def metadata():
+    pass
+
+
+@dbt_cloud.group(
+    cls=LazyGroup,
+    lazy_subcommands={"data-catalog": "dbt_cloud.demo:data_catalog"},
+    help="Demo applications",
+)
+def demo():
+    pass
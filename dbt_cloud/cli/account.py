@@ -0,0 +1,17 @@
+import click
+from dbt_cloud.command import DbtCloudAccountListCommand, DbtCloudAccountGetCommand
+from dbt_cloud.cli.utils import execute_and_print
+
+
+@click.command(help=DbtCloudAccountListCommand.get_description())
+@DbtCloudAccountListCommand.click_options
+def list(**kwargs):
+    command = DbtCloudAccountListCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
+
+
+@click.command(help=DbtCloudAccountGetCommand.get_description())
+@DbtCloudAccountGetCommand.click_options
+def get(**kwargs):
+    command = DbtCloudAccountGetCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
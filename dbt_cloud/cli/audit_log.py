@@ -0,0 +1,11 @@
+import click
+from dbt_cloud.command import DbtCloudAuditLogGetCommand
+from dbt_cloud.cli.utils import list_and_print, pagination_options
+
+
+@click.command(help=DbtCloudAuditLogGetCommand.get_description())
+@DbtCloudAuditLogGetCommand.click_options
+@pagination_options
+def get(paginate, concurrency, output, **kwargs):
+    command = DbtCloudAuditLogGetCommand.from_click_options(**kwargs)
+    list_and_print(command, paginate, concurrency, output)
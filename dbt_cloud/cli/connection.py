@@ -0,0 +1,70 @@
+import click
+from dbt_cloud.command import (
+    DbtCloudConnectionCreateCommand,
+    DbtCloudConnectionDeleteCommand,
+    DbtCloudConnectionGetCommand,
+    DbtCloudConnectionListCommand,
+)
+from dbt_cloud.cli.utils import (
+    _assert_write_access,
+    execute_and_print,
+    list_and_print,
+    pagination_options,
+)
+
+
+@click.command(
+    help=DbtCloudConnectionCreateCommand.get_description(),
+    context_settings={"ignore_unknown_options": True, "allow_extra_args": True},
+)
+@click.pass_context
+@DbtCloudConnectionCreateCommand.click_options
+def create(ctx, **kwargs):
+    _assert_write_access()
+    keys = ctx.args[::2]  # Every even element is a key
+    values = ctx.args[1::2]  # Every odd element is a value
+
+    def _coerce(v):
+        if v.lower() == "true":
+            return True
+        if v.lower() == "false":
+            return False
+        try:
+            return int(v)
+        except ValueError:
+            pass
+        try:
+            return float(v)
+        except ValueError:
+            pass
+        return v
+
+    kwargs["details"] = {
+        key.lstrip("-").replace("-", "_"): _coerce(value)
+        for key, value in zip(keys, values)
+    }
+    command = DbtCloudConnectionCreateCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
+
+
+@click.command(help=DbtCloudConnectionDeleteCommand.get_description())
+@DbtCloudConnectionDeleteCommand.click_options
+def delete(**kwargs):
+    _assert_write_access()
+    command = DbtCloudConnectionDeleteCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
+
+
+@click.command(help=DbtCloudConnectionGetCommand.get_description())
+@DbtCloudConnectionGetCommand.click_options
+def get(**kwargs):
+    command = DbtCloudConnectionGetCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
+
+
+@click.command(help=DbtCloudConnectionListCommand.get_description())
+@DbtCloudConnectionListCommand.click_options
+@pagination_options
+def list(paginate, concurrency, output, **kwargs):
+    command = DbtCloudConnectionListCommand.from_click_options(**kwargs)
+    list_and_print(command, paginate, concurrency, output)
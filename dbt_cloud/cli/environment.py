@@ -0,0 +1,44 @@
+import click
+from dbt_cloud.command import (
+    DbtCloudEnvironmentListCommand,
+    DbtCloudEnvironmentGetCommand,
+    DbtCloudEnvironmentCreateCommand,
+    DbtCloudEnvironmentDeleteCommand,
+)
+from dbt_cloud.cli.utils import (
+    _assert_write_access,
+    execute_and_print,
+    list_and_print,
+    pagination_options,
+)
+
+
+@click.command(help=DbtCloudEnvironmentListCommand.get_description())
+@DbtCloudEnvironmentListCommand.click_options
+@pagination_options
+def list(paginate, concurrency, output, **kwargs):
+    command = DbtCloudEnvironmentListCommand.from_click_options(**kwargs)
+    list_and_print(command, paginate, concurrency, output)
+
+
+@click.command(help=DbtCloudEnvironmentGetCommand.get_description())
+@DbtCloudEnvironmentGetCommand.click_options
+def get(**kwargs):
+    command = DbtCloudEnvironmentGetCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
+
+
+@click.command(help=DbtCloudEnvironmentCreateCommand.get_description())
+@DbtCloudEnvironmentCreateCommand.click_options
+def create(**kwargs):
+    _assert_write_access()
+    command = DbtCloudEnvironmentCreateCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
+
+
+@click.command(help=DbtCloudEnvironmentDeleteCommand.get_description())
+@DbtCloudEnvironmentDeleteCommand.click_options
+def delete(**kwargs):
+    _assert_write_access()
+    command = DbtCloudEnvironmentDeleteCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
@@ -0,0 +1,388 @@
+import sys
+import time
+import click
+import requests
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dbt_cloud.command import (
+    DbtCloudRunStatus,
+    DbtCloudJobGetCommand,
+    DbtCloudJobCreateCommand,
+    DbtCloudJobDeleteCommand,
+    DbtCloudJobRunCommand,
+    DbtCloudAccountCommand,
+    DbtCloudRunGetCommand,
+    DbtCloudRunListCommand,
+    DbtCloudJobListCommand,
+)
+from dbt_cloud.command.command import REQUEST_FIELDS
+from dbt_cloud.polling import (
+    MIN_POLL_INTERVAL,
+    AdaptivePollInterval,
+    get_expected_duration,
+    wait_for_runs,
+)
+from dbt_cloud.serde import json_to_dict, dict_to_json
+from dbt_cloud.field import PythonLiteralOption
+from dbt_cloud.cli.utils import (
+    _assert_write_access,
+    execute_and_print,
+    execute_concurrently,
+    list_and_print,
+    pagination_options,
+)
+
+
+@click.command(help=DbtCloudJobRunCommand.get_description())
+@DbtCloudJobRunCommand.click_options
+@click.option(
+    f"--wait/--no-wait",
+    default=False,
+    help="Wait for the process to finish before returning from the API call.",
+)
+@click.option(
+    "--poll-min",
+    default=1.0,
+    type=click.FloatRange(min=MIN_POLL_INTERVAL),
+    help="Shortest interval in seconds between run status polls when waiting.",
+)
+@click.option(
+    "--poll-max",
+    default=30.0,
+    type=click.FloatRange(min=MIN_POLL_INTERVAL),
+    help="Longest interval in seconds between run status polls when waiting.",
+)
+@click.option(
+    "-f",
+    "--file",
+    default="-",
+    type=click.File("w"),
+    help="Response export file path.",
+)
+def run(wait, poll_min, poll_max, file, **kwargs):
+    _assert_write_access()
+    command = DbtCloudJobRunCommand.from_click_options(**kwargs)
+    response = command.execute()
+    started_at = time.monotonic()
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as e:
+        file.write(dict_to_json(response.json()))
+        click.echo(str(e), err=True)
+        sys.exit(1)
+
+    if wait:
+        run_id = response.json()["data"]["id"]
+        base_kwargs = command.model_dump(include={*REQUEST_FIELDS, "account_id"})
+        run_get_command = DbtCloudRunGetCommand(**base_kwargs, run_id=run_id)
+        poll_interval = AdaptivePollInterval(
+            poll_min=poll_min,
+            poll_max=poll_max,
+            expected_duration=get_expected_duration(
+                DbtCloudRunListCommand(**base_kwargs, job_id=str(command.job_id))
+            ),
+        )
+        while True:
+            response = run_get_command.execute()
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                file.write(dict_to_json(response.json()))
+                click.echo(str(e), err=True)
+                sys.exit(1)
+            status = DbtCloudRunStatus(response.json()["data"]["status"])
+            click.echo(
+                f"Job {command.job_id} run {run_id}: {status.name} ...", err=True
+            )
+            if status == DbtCloudRunStatus.SUCCESS:
+                break
+            elif status in (DbtCloudRunStatus.ERROR, DbtCloudRunStatus.CANCELLED):
+                href = response.json()["data"]["href"]
+                click.echo(
+                    f"Job run failed with {status.name} status. For more information, see {href}.",
+                    err=True,
+                )
+                file.write(dict_to_json(response.json()))
+                sys.exit(1)
+            time.sleep(poll_interval.next_interval(time.monotonic() - started_at))
+
+    file.write(dict_to_json(response.json()))
+
+
+def _parse_job_id(value, param_hint: str) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        raise click.BadParameter(f"{value!r} is not a job ID.", param_hint=param_hint)
+
+
+@click.command(
+    help="Triggers many dbt Cloud jobs concurrently and optionally waits for all of them."
+)
+@DbtCloudAccountCommand.click_options
+@click.option(
+    "--job-ids",
+    cls=PythonLiteralOption,
+    default=None,
+    help="List of job IDs to run (e.g., '[43167, 49663]').",
+)
+@click.option(
+    "--job-ids-file",
+    type=click.File("r"),
+    default=None,
+    help="File with one job ID per line ('-' reads from stdin).",
+)
+@click.option(
+    "--cause",
+    default="Triggered via API",
+    help="A text description of the reason for running the jobs",
+)
+@click.option(
+    f"--wait/--no-wait",
+    default=False,
+    help="Wait for all runs to finish before returning.",
+)
+@click.option(
+    "--concurrency",
+    default=8,
+    type=click.IntRange(min=1),
+    help="Number of jobs to trigger concurrently.",
+)
+@click.option(
+    "--poll-min",
+    default=1.0,
+    type=click.FloatRange(min=MIN_POLL_INTERVAL),
+    help="Shortest interval in seconds between run status polls when waiting.",
+)
+@click.option(
+    "--poll-max",
+    default=30.0,
+    type=click.FloatRange(min=MIN_POLL_INTERVAL),
+    help="Longest interval in seconds between run status polls when waiting.",
+)
+@click.option(
+    "-f",
+    "--file",
+    default="-",
+    type=click.File("w"),
+    help="Response export file path.",
+)
+def run_many(
+    job_ids,
+    job_ids_file,
+    cause,
+    wait,
+    concurrency,
+    poll_min,
+    poll_max,
+    file,
+    **kwargs,
+):
+    _assert_write_access()
+    if job_ids is None:
+        job_ids = []
+    elif isinstance(job_ids, str) or not isinstance(job_ids, Iterable):
+        job_ids = [job_ids]
+    job_ids = [_parse_job_id(job_id, "'--job-ids'") for job_id in job_ids]
+    for line in job_ids_file or []:
+        if line.strip():
+            job_ids.append(_parse_job_id(line.strip(), "'--job-ids-file'"))
+    if not job_ids:
+        raise click.UsageError("Provide job IDs with --job-ids or --job-ids-file.")
+    base_command = DbtCloudAccountCommand.from_click_options(**kwargs)
+    base_kwargs = base_command.model_dump()
+
+    def trigger(job_id):
+        command = DbtCloudJobRunCommand(**base_kwargs, job_id=job_id, cause=cause)
+        try:
+            response = command.execute()
+            response.raise_for_status()
+        except requests.RequestException as e:
+            click.echo(f"Job {job_id} could not be triggered: {e}", err=True)
+            return None
+        run = response.json()["data"]
+        click.echo(f"Job {job_id} run {run['id']}: triggered ...", err=True)
+        return run
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        triggered_runs = [*executor.map(trigger, job_ids)]
+    runs = [run for run in triggered_runs if run is not None]
+    is_success = len(runs) == len(job_ids)
+
+    if wait and runs:
+        latest_runs = {run["id"]: run for run in runs}
+
+        def on_update(run):
+            run = latest_runs[run["id"]] = {**latest_runs[run["id"]], **run}
+            if "error" in run:
+                state = run["error"]
+            else:
+                state = f"{DbtCloudRunStatus(run['status']).name} ..."
+            click.echo(
+                f"Job {run['job_definition_id']} run {run['id']}: {state}", err=True
+            )
+
+        try:
+            completed_runs = wait_for_runs(
+                DbtCloudRunListCommand(**base_kwargs),
+                run_ids=[*latest_runs],
+                poll_interval=AdaptivePollInterval(
+                    poll_min=poll_min, poll_max=poll_max
+                ),
+                on_update=on_update,
+            )
+        except requests.RequestException as e:
+            click.echo(str(e), err=True)
+            file.write(dict_to_json([*latest_runs.values()]))
+            sys.exit(1)
+        runs = [
+            {**latest_runs[run_id], **completed_runs[run_id]} for run_id in latest_runs
+        ]
+        is_success = is_success and all(
+            "error" not in run
+            and DbtCloudRunStatus(run["status"]) == DbtCloudRunStatus.SUCCESS
+            for run in runs
+        )
+
+    file.write(dict_to_json(runs))
+    if not is_success:
+        sys.exit(1)
+
+
+@click.command(help=DbtCloudJobListCommand.get_description())
+@DbtCloudJobListCommand.click_options
+@pagination_options
+def list(paginate, concurrency, output, **kwargs):
+    command = DbtCloudJobListCommand.from_click_options(**kwargs)
+    list_and_print(command, paginate, concurrency, output)
+
+
+@click.command(help=DbtCloudJobGetCommand.get_description())
+@DbtCloudJobGetCommand.click_options
+def get(**kwargs):
+    command = DbtCloudJobGetCommand.from_click_options(**kwargs)
+    execute_and_print(command)
+
+
+@click.command(help=DbtCloudJobCreateCommand.get_description())
+@DbtCloudJobCreateCommand.click_options
+def create(**kwargs):
+    _assert_write_access()
+    command = DbtCloudJobCreateCommand.from_click_options(**kwargs)
+    execute_and_print(command)
+
+
+@click.command(help=DbtCloudJobDeleteCommand.get_description())
+@DbtCloudJobDeleteCommand.click_options
+def delete(**kwargs):
+    _assert_write_access()
+    command = DbtCloudJobDeleteCommand.from_click_options(**kwargs)
+    execute_and_print(command)
+
+
+@click.command(
+    help="Delete all jobs on the account (only the jobs in the page selected by "
+    "--limit and --offset if either is given)."
+)
+@DbtCloudJobListCommand.click_options
+@click.option(
+    "--keep-jobs",
+    cls=PythonLiteralOption,
+    default=[],
+    help="List of job IDs to exclude from deletion.",
+)
+@click.option("--dry-run", is_flag=True, help="Execute as a dry run.")
+@click.option(
+    "-y", "--yes", "assume_yes", is_flag=True, help="Automatic yes to prompts."
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Number of jobs to delete concurrently.",
+)
+@click.option(
+    "-f",
+    "--file",
+    default="-",
+    type=click.File("w"),
+    help="Response export file path.",
+)
+def delete_all(keep_jobs, dry_run, file, assume_yes, concurrency, **kwargs):
+    _assert_write_access()
+    list_command = DbtCloudJobListCommand.from_click_options(**kwargs)
+    try:
+        if list_command.limit is None and list_command.offset is None:
+            job_dicts = list_command.iter_items()
+        else:
+            response = list_command.execute()
+            response.raise_for_status()
+            job_dicts = response.json()["data"]
+        job_ids_to_delete = [
+            job_dict["id"] for job_dict in job_dicts if job_dict["id"] not in keep_jobs
+        ]
+    except requests.HTTPError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    click.echo(f"Jobs to delete: {job_ids_to_delete}", err=True)
+    results = []
+    if not dry_run:
+        base_kwargs = list_command.model_dump(include={*REQUEST_FIELDS, "account_id"})
+        delete_commands = {
+            job_id: DbtCloudJobDeleteCommand(**base_kwargs, job_id=job_id)
+            for job_id in job_ids_to_delete
+            if assume_yes or click.confirm(f"Delete job {job_id}?")
+        }
+        for job_id, response_dict, error in execute_concurrently(
+            delete_commands, concurrency=concurrency
+        ):
+            if error is None:
+                click.echo(f"Job {job_id} was deleted.", err=True)
+            else:
+                click.echo(f"Job {job_id} could not be deleted: {error}", err=True)
+            results.append(
+                {
+                    "job_id": job_id,
+                    "is_success": error is None,
+                    "error": error,
+                    "response": response_dict,
+                }
+            )
+    file.write(dict_to_json(results))
+    if any(not result["is_success"] for result in results):
+        sys.exit(1)
+
+
+@click.command(help="Exports a dbt Cloud job as JSON to a file.")
+@DbtCloudJobGetCommand.click_options
+@click.option(
+    "-f",
+    "--file",
+    default="-",
+    type=click.File("w"),
+    help="Export file path.",
+)
+def export(file, **kwargs):
+    command = DbtCloudJobGetCommand.from_click_options(**kwargs)
+    response = command.execute()
+    response.raise_for_status()
+    job_dict = response.json()["data"]
+    job_dict.pop("id")
+    file.write(dict_to_json(job_dict))
+
+
+@click.command(help="Imports a dbt Cloud job from exported JSON.", name="import")
+@DbtCloudAccountCommand.click_options
+@click.option(
+    "-f",
+    "--file",
+    default="-",
+    type=click.File("r"),
+    help="Import file path.",
+)
+def import_job(file, **kwargs):
+    _assert_write_access()
+    base_command = DbtCloudAccountCommand.from_click_options(**kwargs)
+    job_create_kwargs = {**json_to_dict(file.read()), **base_command.model_dump()}
+    command = DbtCloudJobCreateCommand(**job_create_kwargs)
+    execute_and_print(command)
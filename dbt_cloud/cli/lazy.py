@@ -0,0 +1,32 @@
+import importlib
+import click
+
+
+class LazyGroup(click.Group):
+    """A click group that imports its subcommands only when they are used.
+
+    Subcommands are given as a dict of command name to 'module:attribute' import
+    path, so that e.g. `dbt-cloud --help` or `dbt-cloud run get` do not import
+    and build every command of the CLI.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy subcommand {cmd_name} ({self.lazy_subcommands[cmd_name]}) is not a click command"
+            )
+        return command
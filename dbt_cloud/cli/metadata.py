@@ -0,0 +1,19 @@
+import click
+from dbt_cloud.command import DbtCloudMetadataQueryCommand
+from dbt_cloud.cli.utils import execute_and_print
+
+
+@click.command(help=DbtCloudMetadataQueryCommand.get_description())
+@click.option(
+    "-f",
+    "--file",
+    default="-",
+    type=click.File("r"),
+    help="Read query from file.",
+)
+@DbtCloudMetadataQueryCommand.click_options
+def query(file, **kwargs):
+    command = DbtCloudMetadataQueryCommand.from_click_options(
+        query=file.read(), **kwargs
+    )
+    execute_and_print(command)
@@ -0,0 +1,53 @@
+import click
+from dbt_cloud.command import (
+    DbtCloudProjectGetCommand,
+    DbtCloudProjectListCommand,
+    DbtCloudProjectCreateCommand,
+    DbtCloudProjectDeleteCommand,
+    DbtCloudProjectUpdateCommand,
+)
+from dbt_cloud.cli.utils import (
+    _assert_write_access,
+    execute_and_print,
+    list_and_print,
+    pagination_options,
+)
+
+
+@click.command(help=DbtCloudProjectGetCommand.get_description())
+@DbtCloudProjectGetCommand.click_options
+def get(**kwargs):
+    command = DbtCloudProjectGetCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
+
+
+@click.command(help=DbtCloudProjectListCommand.get_description())
+@DbtCloudProjectListCommand.click_options
+@pagination_options
+def list(paginate, concurrency, output, **kwargs):
+    command = DbtCloudProjectListCommand.from_click_options(**kwargs)
+    list_and_print(command, paginate, concurrency, output)
+
+
+@click.command(help=DbtCloudProjectCreateCommand.get_description())
+@DbtCloudProjectCreateCommand.click_options
+def create(**kwargs):
+    _assert_write_access()
+    command = DbtCloudProjectCreateCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
+
+
+@click.command(help=DbtCloudProjectDeleteCommand.get_description())
+@DbtCloudProjectDeleteCommand.click_options
+def delete(**kwargs):
+    _assert_write_access()
+    command = DbtCloudProjectDeleteCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
+
+
+@click.command(help=DbtCloudProjectUpdateCommand.get_description())
+@DbtCloudProjectUpdateCommand.click_options
+def update(**kwargs):
+    _assert_write_access()
+    command = DbtCloudProjectUpdateCommand.from_click_options(**kwargs)
+    response = execute_and_print(command)
@@ -0,0 +1,367 @@
+import os
+import sys
+import fnmatch
+import click
+import requests
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dbt_cloud.command import (
+    DbtCloudRunGetCommand,
+    DbtCloudRunListArtifactsCommand,
+    DbtCloudRunGetArtifactCommand,
+    DbtCloudRunListCommand,
+    DbtCloudRunCancelCommand,
+)
+from dbt_cloud.command.command import REQUEST_FIELDS
+from dbt_cloud.command.run.get_artifact import DEFAULT_CHUNK_SIZE
+from dbt_cloud.compression import COMPRESSION_SUFFIXES, compressed_writer
+from dbt_cloud.exc import DbtCloudException
+from dbt_cloud.serde import dict_to_json, dict_to_json_line
+from dbt_cloud.cli.utils import (
+    _assert_write_access,
+    execute_and_print,
+    format_size,
+    DownloadProgress,
+    execute_concurrently,
+    list_and_print,
+    pagination_options,
+    without_options,
+)
+
+
+@click.command(help=DbtCloudRunCancelCommand.get_description())
+@DbtCloudRunCancelCommand.click_options
+def cancel(**kwargs):
+    _assert_write_access()
+    command = DbtCloudRunCancelCommand.from_click_options(**kwargs)
+    execute_and_print(command)
+
+
+@click.command(help="Cancel all running jobs by status.")
+@without_options("limit", "offset")
+@DbtCloudRunListCommand.click_options
+@click.option("--dry-run", is_flag=True, help="Execute as a dry run.")
+@click.option(
+    "-y", "--yes", "assume_yes", is_flag=True, help="Automatic yes to prompts."
+)
+@click.option(
+    "--concurrency",
+    default=8,
+    type=click.IntRange(min=1),
+    help="Number of runs to cancel concurrently.",
+)
+@click.option(
+    "--output",
+    default="json",
+    type=click.Choice(["json", "ndjson"]),
+    help="Output format. ndjson writes each run's result on its own line as soon as it is cancelled.",
+)
+@click.option(
+    "-f",
+    "--file",
+    default="-",
+    type=click.File("w"),
+    help="Response export file path.",
+)
+def cancel_all(dry_run, file, assume_yes, concurrency, output, **kwargs):
+    _assert_write_access()
+    list_command = DbtCloudRunListCommand.from_click_options(**kwargs)
+    try:
+        run_ids_to_cancel = [
+            run_dict["id"]
+            for run_dict in list_command.iter_items(concurrency=concurrency)
+        ]
+    except requests.HTTPError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    click.echo(f"Runs to cancel: {run_ids_to_cancel}", err=True)
+    results = []
+    is_success = True
+    if not dry_run:
+        base_kwargs = list_command.model_dump(include={*REQUEST_FIELDS, "account_id"})
+        cancel_commands = {
+            run_id: DbtCloudRunCancelCommand(**base_kwargs, run_id=run_id)
+            for run_id in run_ids_to_cancel
+            if assume_yes or click.confirm(f"Cancel run {run_id}?")
+        }
+        results_done = 0
+        for run_id, response_dict, error in execute_concurrently(
+            cancel_commands, concurrency=concurrency
+        ):
+            results_done += 1
+            progress = f"[{results_done}/{len(cancel_commands)}]"
+            if error is None:
+                click.echo(f"{progress} Run {run_id} has been cancelled.", err=True)
+            else:
+                click.echo(
+                    f"{progress} Run {run_id} could not be cancelled: {error}",
+                    err=True,
+                )
+            result = {
+                "run_id": run_id,
+                "is_success": error is None,
+                "error": error,
+                "response": response_dict,
+            }
+            is_success = is_success and error is None
+            if output == "ndjson":
+                file.write(dict_to_json_line(result) + "\n")
+                file.flush()
+            else:
+                results.append(result)
+    if output == "json":
+        file.write(dict_to_json(results))
+    if not is_success:
+        sys.exit(1)
+
+
+@click.command(help=DbtCloudRunGetCommand.get_description())
+@DbtCloudRunGetCommand.click_options
+def get(**kwargs):
+    command = DbtCloudRunGetCommand.from_click_options(**kwargs)
+    execute_and_print(command)
+
+
+@click.command(help=DbtCloudRunListArtifactsCommand.get_description())
+@DbtCloudRunListArtifactsCommand.click_options
+def list_artifacts(**kwargs):
+    command = DbtCloudRunListArtifactsCommand.from_click_options(**kwargs)
+    execute_and_print(command)
+
+
+@click.command(help=DbtCloudRunListCommand.get_description())
+@DbtCloudRunListCommand.click_options
+@pagination_options
+def list(paginate, concurrency, output, **kwargs):
+    command = DbtCloudRunListCommand.from_click_options(**kwargs)
+    list_and_print(command, paginate, concurrency, output)
+
+
+@click.command(help=DbtCloudRunGetArtifactCommand.get_description())
+@DbtCloudRunGetArtifactCommand.click_options
+@click.option(
+    "-f",
+    "--file",
+    default="-",
+    type=click.Path(dir_okay=False, allow_dash=True),
+    help="Export file path. Interrupted downloads to a file are resumed from a .part file.",
+)
+@click.option(
+    "--chunk-size",
+    default=DEFAULT_CHUNK_SIZE,
+    type=click.IntRange(min=1),
+    help="Number of bytes to read into memory at a time while downloading.",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=True,
+    help="Use the local artifact cache for runs in a terminal state (see DBT_CLOUD_CACHE_DIR).",
+)
+@click.option(
+    "--compress",
+    "compression",
+    default=None,
+    type=click.Choice([*COMPRESSION_SUFFIXES]),
+    help="Compress the artifact on disk with gzip or zstd (zstd requires the zstandard package).",
+)
+@click.option(
+    "--progress/--no-progress",
+    default=None,
+    help="Show download progress on stderr (default: when stderr is a terminal).",
+)
+def get_artifact(file, chunk_size, use_cache, compression, progress, **kwargs):
+    command = DbtCloudRunGetArtifactCommand.from_click_options(**kwargs)
+    if progress is None:
+        progress = sys.stderr.isatty()
+    on_progress = DownloadProgress(command.path) if progress else None
+    try:
+        if file == "-":
+            with click.open_file(file, "wb") as stdout, compressed_writer(
+                stdout, compression
+            ) as writer:
+                command.download(
+                    writer,
+                    chunk_size=chunk_size,
+                    on_progress=on_progress,
+                    use_cache=use_cache,
+                )
+        else:
+            command.download_to_path(
+                file,
+                chunk_size=chunk_size,
+                on_progress=on_progress,
+                use_cache=use_cache,
+                compression=compression,
+            )
+    except (requests.RequestException, DbtCloudException) as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    finally:
+        if on_progress is not None:
+            on_progress.finish()
+
+
+def _download_artifact(
+    command: DbtCloudRunGetArtifactCommand,
+    output_dir: str,
+    chunk_size: int,
+    use_cache: bool,
+    compression: Optional[str] = None,
+    run_is_complete: Optional[bool] = None,
+):
+    """Downloads an artifact into output_dir, keeping its path under target/.
+
+    Returns (local_path, size, error) where error is None on success. A partial
+    download is kept as a .part file and resumed by the next attempt.
+    """
+    relative_path = os.path.normpath(command.path)
+    if os.path.isabs(relative_path) or relative_path.split(os.sep)[0] == os.pardir:
+        return (
+            None,
+            None,
+            f"Refusing to write outside the output directory: {command.path}",
+        )
+    local_path = os.path.join(output_dir, relative_path)
+    if compression is not None:
+        local_path += COMPRESSION_SUFFIXES[compression]
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    try:
+        command.download_to_path(
+            local_path,
+            chunk_size=chunk_size,
+            use_cache=use_cache,
+            run_is_complete=run_is_complete,
+            compression=compression,
+        )
+    except (requests.RequestException, DbtCloudException, OSError) as e:
+        return local_path, None, str(e)
+    return local_path, os.path.getsize(local_path), None
+
+
+@click.command(
+    help="Downloads the artifacts of a completed run concurrently into a directory."
+)
+@DbtCloudRunListArtifactsCommand.click_options
+@click.option(
+    "--include",
+    "include_patterns",
+    multiple=True,
+    help="Glob pattern of artifact paths to download (e.g., '*.json'). Can be given multiple times. Defaults to all artifacts.",
+)
+@click.option(
+    "-o",
+    "--output-dir",
+    default="target",
+    type=click.Path(file_okay=False, writable=True),
+    help="Directory to download the artifacts into.",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Number of artifacts to download concurrently.",
+)
+@click.option(
+    "--chunk-size",
+    default=DEFAULT_CHUNK_SIZE,
+    type=click.IntRange(min=1),
+    help="Number of bytes to read into memory at a time while downloading.",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=True,
+    help="Use the local artifact cache for runs in a terminal state (see DBT_CLOUD_CACHE_DIR).",
+)
+@click.option(
+    "--compress",
+    "compression",
+    default=None,
+    type=click.Choice([*COMPRESSION_SUFFIXES]),
+    help="Compress the artifacts on disk with gzip or zstd, adding a .gz or .zst suffix (zstd requires the zstandard package).",
+)
+@click.option(
+    "-f",
+    "--file",
+    default="-",
+    type=click.File("w"),
+    help="Response export file path.",
+)
+def download_artifacts(
+    include_patterns,
+    output_dir,
+    concurrency,
+    chunk_size,
+    use_cache,
+    compression,
+    file,
+    **kwargs,
+):
+    list_command = DbtCloudRunListArtifactsCommand.from_click_options(**kwargs)
+    response = list_command.execute()
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    paths = [
+        path
+        for path in response.json()["data"]
+        if not include_patterns
+        or any(fnmatch.fnmatch(path, pattern) for pattern in include_patterns)
+    ]
+    click.echo(f"Artifacts to download: {paths}", err=True)
+    base_kwargs = list_command.model_dump(
+        include={*REQUEST_FIELDS, "account_id", "run_id", "step"}
+    )
+    get_commands = {
+        path: DbtCloudRunGetArtifactCommand(**base_kwargs, path=path) for path in paths
+    }
+    # Look up the run status once instead of once per artifact
+    run_is_complete = (
+        next(iter(get_commands.values())).is_run_complete()
+        if use_cache and get_commands
+        else None
+    )
+    results = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(
+                _download_artifact,
+                command,
+                output_dir,
+                chunk_size,
+                use_cache,
+                compression,
+                run_is_complete,
+            ): path
+            for path, command in get_commands.items()
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            local_path, size, error = future.result()
+            progress = f"[{len(results) + 1}/{len(paths)}]"
+            if error is None:
+                click.echo(
+                    f"{progress} {path} -> {local_path} ({format_size(size)})",
+                    err=True,
+                )
+            else:
+                click.echo(
+                    f"{progress} {path} could not be downloaded: {error}", err=True
+                )
+            results.append(
+                {
+                    "path": path,
+                    "local_path": local_path,
+                    "size": size,
+                    "is_success": error is None,
+                    "error": error,
+                }
+            )
+    order = {path: i for i, path in enumerate(paths)}
+    results.sort(key=lambda result: order[result["path"]])
+    file.write(dict_to_json(results))
+    if not all(result["is_success"] for result in results):
+        sys.exit(1)
@@ -0,0 +1,172 @@
+import os
+import sys
+import time
+import click
+import requests
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dbt_cloud.serde import dict_to_json, dict_to_json_line
+
+
+def _assert_write_access():
+    """Exit with a clear error if DBT_CLOUD_READONLY is set to a truthy value."""
+    if os.environ.get("DBT_CLOUD_READONLY", "").lower() in ("1", "true", "yes"):
+        click.echo(
+            "Error: readonly mode is enabled (DBT_CLOUD_READONLY=true). "
+            "Unset DBT_CLOUD_READONLY to allow mutating commands.",
+            err=True,
+        )
+        sys.exit(1)
+
+
+def execute_and_print(command, **kwargs):
+    response = command.execute(**kwargs)
+    click.echo(dict_to_json(response.json()))
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    return response
+
+
+def print_pages(pages, output: str = "json"):
+    """Prints the data of list response pages as they arrive.
+
+    With output "json" the pages are merged into the last response, and with
+    "ndjson" every item is printed on its own line without buffering.
+    """
+    data = []
+    try:
+        for response in pages:
+            response.raise_for_status()
+            response_dict = response.json()
+            if output == "ndjson":
+                for item in response_dict["data"]:
+                    click.echo(dict_to_json_line(item))
+            else:
+                data.extend(response_dict["data"])
+    except requests.HTTPError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    if output == "json":
+        response_dict["data"] = data
+        pagination = response_dict.get("extra", {}).get("pagination")
+        if pagination:
+            pagination["count"] = len(data)
+        click.echo(dict_to_json(response_dict))
+
+
+def format_size(num_bytes: float) -> str:
+    """Formats a number of bytes for humans (e.g. '12.3 MiB')."""
+    for unit in ("B", "KiB", "MiB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GiB"
+
+
+class DownloadProgress:
+    """Prints the progress of a download on a single stderr line."""
+
+    def __init__(self, name: str, interval: float = 0.2):
+        self.name = name
+        self.interval = interval
+        self._printed_at = 0.0
+        self._line = ""
+
+    def __call__(self, downloaded: int, total_size: Optional[int]):
+        now = time.monotonic()
+        if now - self._printed_at < self.interval and downloaded != total_size:
+            return
+        self._printed_at = now
+        self._line = f"{self.name}: {format_size(downloaded)}"
+        if total_size:
+            self._line += (
+                f" / {format_size(total_size)} ({downloaded / total_size:.0%})"
+            )
+        click.echo(f"\r{self._line}", nl=False, err=True)
+
+    def finish(self):
+        if self._line:
+            click.echo("", err=True)
+
+
+def _execute_and_check(command):
+    try:
+        response = command.execute()
+    except requests.RequestException as e:
+        return None, str(e)
+    try:
+        response_dict = response.json()
+    except ValueError:
+        response_dict = None
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as e:
+        return response_dict, str(e)
+    return response_dict, None
+
+
+def execute_concurrently(commands: dict, concurrency: int):
+    """Executes commands in a bounded thread pool and yields results as they complete.
+
+    The commands are given as a dict by key (e.g. job ID). Yields (key, response_dict,
+    error) tuples where error is None on success, so that one failed request does
+    not stop the others.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(_execute_and_check, command): key
+            for key, command in commands.items()
+        }
+        for future in as_completed(futures):
+            yield (futures[future], *future.result())
+
+
+def list_and_print(command, paginate: bool, concurrency: int, output: str):
+    if paginate:
+        print_pages(command.iter_pages(concurrency=concurrency), output=output)
+    elif output == "ndjson":
+        print_pages([command.execute()], output=output)
+    else:
+        execute_and_print(command)
+
+
+def without_options(*names):
+    """Removes options added by a click_options decorator below it.
+
+    For composite commands that do not use some fields of the command whose
+    options they take, e.g. limit and offset of a list command that is paginated.
+    """
+
+    def decorator(function):
+        function.__click_params__ = [
+            param for param in function.__click_params__ if param.name not in names
+        ]
+        return function
+
+    return decorator
+
+
+def pagination_options(function):
+    """Adds --paginate, --concurrency and --output options to a list command."""
+    function = click.option(
+        "--output",
+        default="json",
+        type=click.Choice(["json", "ndjson"]),
+        help="Output format. ndjson prints one item per line as soon as its page arrives.",
+    )(function)
+    function = click.option(
+        "--concurrency",
+        default=4,
+        type=click.IntRange(min=1),
+        help="Number of pages to fetch concurrently when paginating.",
+    )(function)
+    function = click.option(
+        "--paginate",
+        default=False,
+        is_flag=True,
+        help="Return all results using pagination (ignores limit and offset).",
+    )(function)
+    return function
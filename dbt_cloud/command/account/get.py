@@ -1,4 +1,3 @@
-import requests
 from pydantic import PrivateAttr
 from dbt_cloud.command.command import DbtCloudAccountCommand
 
@@ -8,8 +7,10 @@ class DbtCloudAccountGetCommand(DbtCloudAccountCommand):
 
     _api_version: str = PrivateAttr("v2")
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
-            url=self.api_url, headers=self.request_headers, timeout=self.timeout
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
+            url=self.api_url,
+            headers=self.request_headers,
+            timeout=self.timeout,
         )
-        return response
@@ -1,4 +1,3 @@
-import requests
 from dbt_cloud.command.command import DbtCloudCommand
 
 
@@ -9,8 +8,10 @@ class DbtCloudAccountListCommand(DbtCloudCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/accounts/"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
-            url=self.api_url, headers=self.request_headers, timeout=self.timeout
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
+            url=self.api_url,
+            headers=self.request_headers,
+            timeout=self.timeout,
         )
-        return response
@@ -1,7 +1,6 @@
-import requests
 from typing import Optional
 from pydantic import Field, PrivateAttr
-from dbt_cloud.command.command import DbtCloudAccountCommand
+from dbt_cloud.command.command import DbtCloudAccountCommand, REQUEST_FIELDS
 
 
 class DbtCloudAuditLogGetCommand(DbtCloudAccountCommand):
@@ -31,13 +30,13 @@ class DbtCloudAuditLogGetCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/audit-logs/"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
             url=self.api_url,
             headers=self.request_headers,
             params=self.get_payload(
-                exclude=["api_token", "dbt_cloud_host", "account_id", "timeout"],
+                exclude=[*REQUEST_FIELDS, "account_id"],
             ),
             timeout=self.timeout,
         )
-        return response
@@ -1,17 +1,190 @@
+import asyncio
 import click
-from collections import OrderedDict
-from typing import Union, get_args, get_origin
+import json
+import logging
+import random
+import threading
+import time
+import weakref
+import requests
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Iterator, Optional, Union, get_args, get_origin
 from mergedeep import merge
 from pydantic import model_validator, BaseModel, Field, PrivateAttr
 from pydantic_core import PydanticUndefined
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from dbt_cloud.exc import DbtCloudException
+from dbt_cloud.ratelimit import get_rate_limiter
 from dbt_cloud.serde import json_to_dict
 from dbt_cloud.field import (
     API_TOKEN_FIELD,
     ACCOUNT_ID_FIELD,
     PROJECT_ID_FIELD,
     DBT_CLOUD_HOST_FIELD,
+    MAX_RETRIES_FIELD,
+    RETRY_BACKOFF_FIELD,
+    get_env,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+MAX_BACKOFF = 60.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# Fields that configure the HTTP request rather than its payload.
+REQUEST_FIELDS = [
+    "api_token",
+    "dbt_cloud_host",
+    "timeout",
+    "max_retries",
+    "retry_backoff",
+]
+
+_session = None
+_session_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+
+class JsonResponse(requests.Response):
+    """A response whose json() decodes the body with the configured JSON backend."""
+
+    def json(self, **kwargs):
+        if kwargs:
+            return super().json(**kwargs)
+        try:
+            return json_to_dict(self.content)
+        except json.JSONDecodeError as e:
+            raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+class JsonHTTPAdapter(HTTPAdapter):
+    def build_response(self, req, resp) -> JsonResponse:
+        response = super().build_response(req, resp)
+        response.__class__ = JsonResponse
+        return response
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Creates an HTTP session that keeps up to pool_size connections alive per host."""
+    session = requests.Session()
+    # Ask for every compression urllib3 can decode here (gzip and deflate, plus br
+    # and zstd when brotli or zstandard are installed)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    adapter = JsonHTTPAdapter(pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Returns the process-wide HTTP session shared by all commands.
+
+    The pool size is read from the DBT_CLOUD_POOL_SIZE environment variable when
+    the session is first created.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = int(get_env("DBT_CLOUD_POOL_SIZE", DEFAULT_POOL_SIZE))
+                _session = create_session(pool_size=pool_size)
+    return _session
+
+
+def configure_session(pool_size: int) -> requests.Session:
+    """Replaces the process-wide HTTP session with one using the given pool size."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = create_session(pool_size=pool_size)
+    return _session
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise DbtCloudException(
+            "The async API requires the httpx package "
+            "(pip install 'dbt-cloud-cli[async]')"
+        )
+    return httpx
+
+
+def create_async_client(pool_size: int = DEFAULT_POOL_SIZE) -> "httpx.AsyncClient":
+    """Creates an async HTTP client that keeps up to pool_size connections alive.
+
+    Like the requests session, the number of concurrent connections is not capped;
+    concurrency is bounded by the callers and the rate limiter.
+    """
+    httpx = _import_httpx()
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=None, max_keepalive_connections=pool_size)
+    )
+
+
+def get_async_client() -> "httpx.AsyncClient":
+    """Returns the async HTTP client shared by all commands in the running event loop.
+
+    httpx clients cannot be shared between event loops, so one client is created
+    per loop, with the pool size read from the DBT_CLOUD_POOL_SIZE environment
+    variable.
+    """
+    loop = asyncio.get_running_loop()
+    with _session_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            pool_size = int(get_env("DBT_CLOUD_POOL_SIZE", DEFAULT_POOL_SIZE))
+            client = _async_clients[loop] = create_async_client(pool_size=pool_size)
+    return client
+
+
+async def close_async_client():
+    """Closes the async HTTP client of the running event loop, if one was created."""
+    with _session_lock:
+        client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def is_retryable_status(status_code: int, idempotent: bool) -> bool:
+    return status_code == 429 or (idempotent and status_code in RETRY_STATUS_CODES)
+
+
+def _drop_none(values: Optional[dict]) -> Optional[dict]:
+    # requests leaves out params and headers set to None, httpx does not
+    if values is None:
+        return None
+    return {key: value for key, value in values.items() if value is not None}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
 
 def _unwrap_optional(annotation):
     """Unwrap Optional[X] to X; return annotation unchanged otherwise."""
@@ -121,6 +294,8 @@ class DbtCloudCommand(ClickBaseModel):
         default=30,
         description="HTTP request timeout in seconds.",
     )
+    max_retries: int = MAX_RETRIES_FIELD
+    retry_backoff: float = RETRY_BACKOFF_FIELD
     _api_version: str = PrivateAttr("v3")
 
     @property
@@ -131,9 +306,175 @@ class DbtCloudCommand(ClickBaseModel):
     def api_url(self) -> str:
         return f"https://{self.dbt_cloud_host}/api/{self._api_version}"
 
+    def request(
+        self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs
+    ) -> requests.Response:
+        """Sends an HTTP request through the shared keep-alive session.
+
+        Every attempt first waits for the process-wide rate limiter, if enabled.
+
+        Rate limited (429) responses and connect timeouts are retried up to
+        max_retries times because the API never processed the request. Transient
+        server errors and other connection errors are only retried for idempotent
+        requests (by default all but POST) so that e.g. a job run is not triggered
+        twice. The delay between retries honors the Retry-After header (up to
+        MAX_BACKOFF seconds) and falls back to jittered exponential backoff.
+        """
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        rate_limiter = get_rate_limiter()
+        while True:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                response = get_session().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                is_retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+                if attempt >= self.max_retries or not is_retryable:
+                    raise
+                delay = self.get_retry_delay(attempt)
+                reason = str(e)
+            else:
+                if attempt >= self.max_retries or not is_retryable_status(
+                    response.status_code, idempotent
+                ):
+                    return response
+                delay = self.get_retry_delay(
+                    attempt, parse_retry_after(response.headers.get("Retry-After"))
+                )
+                reason = f"HTTP {response.status_code}"
+                response.close()
+            attempt += 1
+            logger.warning(
+                f"{method} {url} failed ({reason}), retrying in {delay:.1f} seconds "
+                f"(retry {attempt}/{self.max_retries})."
+            )
+            time.sleep(delay)
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> "httpx.Response":
+        """Sends an HTTP request through the event loop's shared async client.
+
+        The async counterpart of request(), with the same rate limiting and retry
+        behaviour; waiting for the rate limiter or a retry does not block the event
+        loop. Takes the keyword arguments of request() (params, headers, json and
+        timeout) and returns an httpx.Response.
+        """
+        httpx = _import_httpx()
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        for key in ("params", "headers"):
+            if key in kwargs:
+                kwargs[key] = _drop_none(kwargs[key])
+        client = get_async_client()
+        request = client.build_request(method, url, **kwargs)
+        attempt = 0
+        rate_limiter = get_rate_limiter()
+        while True:
+            if rate_limiter is not None:
+                await asyncio.sleep(rate_limiter.reserve())
+            try:
+                response = await client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                is_retryable = idempotent or isinstance(e, httpx.ConnectTimeout)
+                if attempt >= self.max_retries or not is_retryable:
+                    raise
+                delay = self.get_retry_delay(attempt)
+                reason = str(e) or type(e).__name__
+            else:
+                if attempt >= self.max_retries or not is_retryable_status(
+                    response.status_code, idempotent
+                ):
+                    return response
+                delay = self.get_retry_delay(
+                    attempt, parse_retry_after(response.headers.get("Retry-After"))
+                )
+                reason = f"HTTP {response.status_code}"
+                await response.aclose()
+            attempt += 1
+            logger.warning(
+                f"{method} {url} failed ({reason}), retrying in {delay:.1f} seconds "
+                f"(retry {attempt}/{self.max_retries})."
+            )
+            await asyncio.sleep(delay)
+
+    def get_request_kwargs(self, **kwargs) -> dict:
+        """Returns the arguments of request() that execute the command."""
+        raise NotImplementedError
+
+    def execute(self, **kwargs) -> requests.Response:
+        return self.request(**self.get_request_kwargs(**kwargs))
+
+    async def aexecute(self, **kwargs) -> "httpx.Response":
+        """Executes the command without blocking the event loop (requires httpx)."""
+        return await self.arequest(**self.get_request_kwargs(**kwargs))
+
+    def get_retry_delay(
+        self, attempt: int, retry_after: Optional[float] = None
+    ) -> float:
+        """Returns the delay before a retry, preferring the server's Retry-After.
+
+        Like the backoff, the delay is capped at MAX_BACKOFF seconds, so that a
+        long Retry-After does not block the command for an unbounded time.
+        """
+        if retry_after is not None:
+            return min(retry_after, MAX_BACKOFF)
+        return random.uniform(0, min(self.retry_backoff * 2**attempt, MAX_BACKOFF))
+
+    def iter_pages(
+        self, concurrency: int = 1, page_size: int = 100
+    ) -> Iterator[requests.Response]:
+        """Yields all pages of a list endpoint in API order (ignores limit and offset).
+
+        The first page tells the total number of items, so the remaining pages are
+        fetched concurrently by at most `concurrency` workers.
+        """
+        if not {"offset", "limit"} <= type(self).model_fields.keys():
+            raise DbtCloudException(
+                f"{type(self).__name__} does not support pagination."
+            )
+        response = self._get_page(offset=0, limit=page_size)
+        yield response
+        pagination = response.json().get("extra", {}).get("pagination")
+        if not pagination or pagination["count"] == 0:
+            return
+        offsets = range(
+            pagination["count"], pagination["total_count"], pagination["count"]
+        )
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = deque()
+            for offset in offsets:
+                if len(pending) >= concurrency:
+                    yield pending.popleft().result()
+                pending.append(
+                    executor.submit(self._get_page, offset=offset, limit=page_size)
+                )
+            while pending:
+                yield pending.popleft().result()
+
+    def iter_items(self, concurrency: int = 1, page_size: int = 100) -> Iterator:
+        """Yields the items of all pages of a list endpoint in API order."""
+        for response in self.iter_pages(concurrency=concurrency, page_size=page_size):
+            yield from response.json()["data"]
+
+    def _get_page(self, offset: int, limit: int) -> requests.Response:
+        page_command = self.model_copy(update={"offset": offset, "limit": limit})
+        response = page_command.execute()
+        response.raise_for_status()
+        return response
+
     def get_payload(
         self,
-        exclude=["api_token", "dbt_cloud_host", "timeout"],
+        exclude=REQUEST_FIELDS,
         exclude_empty: bool = False,
     ) -> dict:
         payload_dict = self.model_dump(mode="json", exclude=set(exclude))
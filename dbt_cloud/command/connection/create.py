@@ -1,4 +1,3 @@
-import requests
 from typing import Optional, Union
 from pydantic import Field, field_validator, BaseModel
 from dbt_cloud.command.command import DbtCloudProjectCommand
@@ -49,11 +48,11 @@ class DbtCloudConnectionCreateCommand(DbtCloudProjectCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/connections/"
 
-    def execute(self) -> requests.Response:
-        response = requests.post(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="post",
             url=self.api_url,
             headers=self.request_headers,
             json=self.get_payload(),
             timeout=self.timeout,
         )
-        return response
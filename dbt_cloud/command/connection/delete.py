@@ -1,4 +1,3 @@
-import requests
 from pydantic import Field
 from dbt_cloud.command.command import DbtCloudProjectCommand
 
@@ -14,8 +13,10 @@ class DbtCloudConnectionDeleteCommand(DbtCloudProjectCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/connections/{self.connection_id}/"
 
-    def execute(self) -> requests.Response:
-        response = requests.delete(
-            url=self.api_url, headers=self.request_headers, timeout=self.timeout
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="delete",
+            url=self.api_url,
+            headers=self.request_headers,
+            timeout=self.timeout,
         )
-        return response
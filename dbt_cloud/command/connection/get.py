@@ -1,4 +1,3 @@
-import requests
 from pydantic import Field
 from dbt_cloud.command.command import DbtCloudProjectCommand
 
@@ -12,8 +11,10 @@ class DbtCloudConnectionGetCommand(DbtCloudProjectCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/connections/{self.connection_id}/"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
-            url=self.api_url, headers=self.request_headers, timeout=self.timeout
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
+            url=self.api_url,
+            headers=self.request_headers,
+            timeout=self.timeout,
         )
-        return response
@@ -1,4 +1,3 @@
-import requests
 from enum import Enum
 from typing import Optional
 from pydantic import Field
@@ -88,11 +87,11 @@ class DbtCloudEnvironmentCreateCommand(DbtCloudProjectCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/environments"
 
-    def execute(self) -> requests.Response:
-        response = requests.post(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="post",
             url=self.api_url,
             headers=self.request_headers,
             json=self.get_payload(exclude_empty=True),
             timeout=self.timeout,
         )
-        return response
@@ -1,4 +1,3 @@
-import requests
 from pydantic import Field
 from dbt_cloud.command.command import DbtCloudProjectCommand
 
@@ -14,8 +13,10 @@ class DbtCloudEnvironmentDeleteCommand(DbtCloudProjectCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/environments/{self.environment_id}/"
 
-    def execute(self) -> requests.Response:
-        response = requests.delete(
-            url=self.api_url, headers=self.request_headers, timeout=self.timeout
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="delete",
+            url=self.api_url,
+            headers=self.request_headers,
+            timeout=self.timeout,
         )
-        return response
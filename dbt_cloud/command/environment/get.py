@@ -1,4 +1,3 @@
-import requests
 from dbt_cloud.command.command import DbtCloudProjectCommand
 from dbt_cloud.field import ACCOUNT_ID_FIELD, ENVIRONMENT_ID_FIELD
 
@@ -13,8 +12,10 @@ class DbtCloudEnvironmentGetCommand(DbtCloudProjectCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/environments/{self.environment_id}/"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
-            url=self.api_url, headers=self.request_headers, timeout=self.timeout
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
+            url=self.api_url,
+            headers=self.request_headers,
+            timeout=self.timeout,
         )
-        return response
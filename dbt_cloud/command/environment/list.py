@@ -1,4 +1,3 @@
-import requests
 from typing import Optional
 from pydantic import Field
 from dbt_cloud.command.command import DbtCloudProjectCommand
@@ -20,8 +19,9 @@ class DbtCloudEnvironmentListCommand(DbtCloudProjectCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/environments"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
             url=self.api_url,
             headers=self.request_headers,
             params={
@@ -32,4 +32,3 @@ class DbtCloudEnvironmentListCommand(DbtCloudProjectCommand):
             },
             timeout=self.timeout,
         )
-        return response
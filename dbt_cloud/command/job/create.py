@@ -1,4 +1,3 @@
-import requests
 from enum import Enum
 from typing import Optional, List
 from pydantic import Field, PrivateAttr
@@ -145,11 +144,11 @@ class DbtCloudJobCreateCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/jobs/"
 
-    def execute(self) -> requests.Response:
-        response = requests.post(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="post",
             url=self.api_url,
             headers=self.request_headers,
             json=self.get_payload(),
             timeout=self.timeout,
         )
-        return response
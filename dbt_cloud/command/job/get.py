@@ -1,4 +1,3 @@
-import requests
 from typing import Optional
 from pydantic import Field, PrivateAttr
 from dbt_cloud.command.command import DbtCloudAccountCommand
@@ -19,11 +18,11 @@ class DbtCloudJobGetCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/jobs/{self.job_id}"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
             url=self.api_url,
             headers=self.request_headers,
             params={"include_related": self.include_related},
             timeout=self.timeout,
         )
-        return response
@@ -1,8 +1,7 @@
-import requests
 from typing import Optional
 from pydantic import Field, PrivateAttr
 from dbt_cloud.command.command import DbtCloudAccountCommand
-from dbt_cloud.field import LIMIT_FIELD
+from dbt_cloud.field import LIMIT_FIELD, OFFSET_FIELD
 
 
 class DbtCloudJobListCommand(DbtCloudAccountCommand):
@@ -14,6 +13,7 @@ class DbtCloudJobListCommand(DbtCloudAccountCommand):
         description="Field to order the result by. Use - to indicate reverse order.",
     )
     limit: Optional[int] = LIMIT_FIELD
+    offset: Optional[int] = OFFSET_FIELD
     project_id: Optional[str] = Field(
         default=None, description="Filter jobs by project ID."
     )
@@ -22,15 +22,16 @@ class DbtCloudJobListCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/jobs"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
             url=self.api_url,
             headers=self.request_headers,
             params={
                 "order_by": self.order_by,
                 "project_id": self.project_id,
                 "limit": self.limit,
+                "offset": self.offset,
             },
             timeout=self.timeout,
         )
-        return response
@@ -1,4 +1,3 @@
-import requests
 from typing import Optional, List
 from pydantic import Field, field_validator, PrivateAttr
 from dbt_cloud.command.command import DbtCloudAccountCommand
@@ -73,11 +72,11 @@ class DbtCloudJobRunCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/jobs/{self.job_id}/run/"
 
-    def execute(self) -> requests.Response:
-        response = requests.post(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="post",
             url=self.api_url,
             headers=self.request_headers,
             json=self.get_payload(),
             timeout=self.timeout,
         )
-        return response
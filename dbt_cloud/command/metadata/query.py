@@ -1,4 +1,3 @@
-import requests
 from pydantic import Field
 from dbt_cloud.command.command import DbtCloudAccountCommand
 
@@ -16,11 +15,12 @@ class DbtCloudMetadataQueryCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"https://metadata.{self.dbt_cloud_host}/graphql"
 
-    def execute(self) -> requests.Response:
-        response = requests.post(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="post",
             url=self.api_url,
             headers=self.request_headers,
             json={"query": self.query},
             timeout=self.timeout,
+            idempotent=True,
         )
-        return response
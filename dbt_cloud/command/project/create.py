@@ -1,4 +1,3 @@
-import requests
 from typing import Optional
 from pydantic import Field
 from dbt_cloud.command.command import DbtCloudAccountCommand
@@ -39,11 +38,11 @@ class DbtCloudProjectCreateCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/projects"
 
-    def execute(self) -> requests.Response:
-        response = requests.post(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="post",
             url=self.api_url,
             headers=self.request_headers,
             json=self.get_payload(exclude_empty=True),
             timeout=self.timeout,
         )
-        return response
@@ -1,4 +1,3 @@
-import requests
 from pydantic import Field, PrivateAttr
 from dbt_cloud.command.command import DbtCloudAccountCommand
 
@@ -15,8 +14,10 @@ class DbtCloudProjectDeleteCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/projects/{self.project_id}/"
 
-    def execute(self) -> requests.Response:
-        response = requests.delete(
-            url=self.api_url, headers=self.request_headers, timeout=self.timeout
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="delete",
+            url=self.api_url,
+            headers=self.request_headers,
+            timeout=self.timeout,
         )
-        return response
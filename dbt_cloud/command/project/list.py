@@ -1,4 +1,3 @@
-import requests
 from typing import Optional
 from dbt_cloud.command.command import DbtCloudAccountCommand
 from dbt_cloud.field import LIMIT_FIELD, OFFSET_FIELD
@@ -14,11 +13,11 @@ class DbtCloudProjectListCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/projects"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
             url=self.api_url,
             headers=self.request_headers,
             params={"limit": self.limit, "offset": self.offset},
             timeout=self.timeout,
         )
-        return response
@@ -1,4 +1,3 @@
-import requests
 from pydantic import Field
 from dbt_cloud.command.project.create import DbtCloudProjectCreateCommand
 
@@ -12,14 +11,15 @@ class DbtCloudProjectUpdateCommand(DbtCloudProjectCreateCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/{self.project_id}"
 
-    def execute(self) -> requests.Response:
+    def get_request_kwargs(self) -> dict:
         payload = self.get_payload(exclude_empty=True)
         # Rename project_id to id
         payload["id"] = payload.pop("project_id")
-        response = requests.post(
+        return dict(
+            method="post",
             url=self.api_url,
             headers=self.request_headers,
             json=payload,
             timeout=self.timeout,
+            idempotent=True,
         )
-        return response
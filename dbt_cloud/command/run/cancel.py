@@ -1,4 +1,3 @@
-import requests
 from enum import IntEnum
 from pydantic import PrivateAttr
 from dbt_cloud.command.command import DbtCloudAccountCommand
@@ -24,8 +23,11 @@ class DbtCloudRunCancelCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/runs/{self.run_id}/cancel/"
 
-    def execute(self) -> requests.Response:
-        response = requests.post(
-            url=self.api_url, headers=self.request_headers, timeout=self.timeout
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="post",
+            url=self.api_url,
+            headers=self.request_headers,
+            timeout=self.timeout,
+            idempotent=True,
         )
-        return response
@@ -1,5 +1,4 @@
 import json
-import requests
 from enum import IntEnum
 from typing import Optional, List
 from pydantic import Field, PrivateAttr
@@ -16,6 +15,11 @@ class DbtCloudRunStatus(IntEnum):
     CANCELLED = 30
 
 
+TERMINAL_STATUSES = frozenset(
+    {DbtCloudRunStatus.SUCCESS, DbtCloudRunStatus.ERROR, DbtCloudRunStatus.CANCELLED}
+)
+
+
 class DbtCloudRunGetCommand(DbtCloudAccountCommand):
     """Returns the details of a dbt Cloud run."""
 
@@ -30,8 +34,9 @@ class DbtCloudRunGetCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/runs/{self.run_id}"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
             url=self.api_url,
             headers=self.request_headers,
             params={
@@ -43,4 +48,3 @@ class DbtCloudRunGetCommand(DbtCloudAccountCommand):
             },
             timeout=self.timeout,
         )
-        return response
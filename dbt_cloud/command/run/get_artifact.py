@@ -1,9 +1,29 @@
+import json
+import os
+import time
+import shutil
+import logging
 import requests
-from typing import Optional
+from typing import BinaryIO, Callable, Iterable, List, Optional, Tuple
 from pydantic import Field, PrivateAttr
-from dbt_cloud.command.command import DbtCloudAccountCommand
+from dbt_cloud.cache import ArtifactCache, get_artifact_cache
+from dbt_cloud.compression import compress_file
+from dbt_cloud.command.command import DbtCloudAccountCommand, REQUEST_FIELDS
+from dbt_cloud.command.run.get import (
+    DbtCloudRunGetCommand,
+    DbtCloudRunStatus,
+    TERMINAL_STATUSES,
+)
+from dbt_cloud.exc import IncompleteDownloadError
 from dbt_cloud.field import RUN_ID_FIELD
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Suffix of the file next to a .part file that tells which artifact it belongs to
+PART_META_SUFFIX = ".meta"
+
 
 class DbtCloudRunGetArtifactCommand(DbtCloudAccountCommand):
     """Fetches an artifact file from a completed run."""
@@ -27,11 +47,317 @@ class DbtCloudRunGetArtifactCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/runs/{self.run_id}/artifacts/{self.path}"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
+    def get_request_kwargs(
+        self, stream: bool = False, headers: Optional[dict] = None
+    ) -> dict:
+        return dict(
+            method="get",
             url=self.api_url,
-            headers=self.request_headers,
+            headers={**self.request_headers, **(headers or {})},
             params={"step": self.step, "include_related": self.include_related},
             timeout=self.timeout,
+            stream=stream,
+        )
+
+    @property
+    def cache_key(self) -> str:
+        return ArtifactCache.make_key(
+            self.dbt_cloud_host, self.account_id, self.run_id, self.step, self.path
+        )
+
+    def is_run_complete(self) -> bool:
+        """Returns True if the run is in a terminal state, so its artifacts are final."""
+        run_get_command = DbtCloudRunGetCommand(
+            **self.model_dump(include={*REQUEST_FIELDS, "account_id", "run_id"})
         )
+        try:
+            response = run_get_command.execute()
+            response.raise_for_status()
+            status = DbtCloudRunStatus(response.json()["data"]["status"])
+        except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+            logger.debug("Could not get the status of run %s: %s", self.run_id, e)
+            return False
+        return status in TERMINAL_STATUSES
+
+    def download(
+        self,
+        file: BinaryIO,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        use_cache: bool = True,
+        run_is_complete: Optional[bool] = None,
+    ) -> Optional[requests.Response]:
+        """Streams the artifact to a binary file without holding it in memory.
+
+        on_progress is called after every chunk with the number of bytes written so
+        far and the total size (None if the server does not send Content-Length).
+        Raises requests.HTTPError before writing anything if the request fails.
+
+        If use_cache is True and the artifact cache is enabled (see
+        dbt_cloud.cache.get_artifact_cache), a cached copy is used without any
+        requests. Artifacts of runs in a terminal state are added to the cache while
+        they are downloaded. The run status is looked up on a cache miss unless it is
+        given as run_is_complete. Returns the response, or None if the artifact was
+        read from the cache.
+        """
+        cache = get_artifact_cache() if use_cache else None
+        if cache is None:
+            return self._download(file, chunk_size, on_progress)
+        cache_key = self.cache_key
+        cached_path = cache.get(cache_key)
+        if cached_path is not None:
+            logger.debug(
+                "Reading %s of run %s from %s", self.path, self.run_id, cached_path
+            )
+            with open(cached_path, "rb") as cached_file:
+                _copy(
+                    iter(lambda: cached_file.read(chunk_size), b""),
+                    [file],
+                    total_size=os.path.getsize(cached_path),
+                    on_progress=on_progress,
+                )
+            return None
+        if run_is_complete is None:
+            run_is_complete = self.is_run_complete()
+        if not run_is_complete:
+            return self._download(file, chunk_size, on_progress)
+        with cache.writer(cache_key) as cache_file:
+            return self._download(file, chunk_size, on_progress, cache_file)
+
+    def download_to_path(
+        self,
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        use_cache: bool = True,
+        run_is_complete: Optional[bool] = None,
+        compression: Optional[str] = None,
+    ):
+        """Downloads the artifact to a local file, resuming interrupted downloads.
+
+        The artifact is written to `<path>.part` and moved to path only once its
+        size matches the size announced by the server. Next to it, `<path>.part.meta`
+        records the artifact (host, account, run, step and path) and its ETag or
+        Last-Modified validator. If a .part file of the same artifact is left over
+        from an earlier attempt, only the rest of the artifact is requested with
+        Range and If-Range headers; if the artifact has changed since, or the server
+        ignores the range, the full artifact is sent and replaces the partial file.
+        A .part file of another artifact, or without a validator, is discarded.
+        Downloads interrupted by connection errors are resumed up to max_retries
+        times. Caching works as in download().
+
+        With compression set to 'gzip' or 'zstd', the completed download is
+        compressed into path (see dbt_cloud.compression).
+        """
+        cache = get_artifact_cache() if use_cache else None
+        part_path = f"{path}.part"
+        cached_path = cache.get(self.cache_key) if cache is not None else None
+        if cached_path is not None:
+            logger.debug(
+                "Copying %s of run %s from %s", self.path, self.run_id, cached_path
+            )
+            compress_file(cached_path, path, compression, chunk_size)
+            if on_progress is not None:
+                size = os.path.getsize(cached_path)
+                on_progress(size, size)
+            return
+        self._download_resumable(part_path, chunk_size, on_progress)
+        if cache is not None:
+            if run_is_complete is None:
+                run_is_complete = self.is_run_complete()
+            if run_is_complete:
+                with open(part_path, "rb") as f, cache.writer(
+                    self.cache_key
+                ) as cache_file:
+                    shutil.copyfileobj(f, cache_file, chunk_size)
+        if compression is None:
+            os.replace(part_path, path)
+        else:
+            compress_file(part_path, path, compression, chunk_size)
+            os.remove(part_path)
+        _remove(f"{part_path}{PART_META_SUFFIX}")
+
+    def _download_resumable(
+        self,
+        part_path: str,
+        chunk_size: int,
+        on_progress: Optional[Callable[[int, Optional[int]], None]],
+    ):
+        attempt = 0
+        while True:
+            try:
+                return self._download_range(part_path, chunk_size, on_progress)
+            except (
+                requests.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                IncompleteDownloadError,
+            ) as e:
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                delay = self.get_retry_delay(attempt, retry_after=None)
+                logger.warning(
+                    "Download of %s was interrupted (%s), resuming in %.1f seconds (retry %s/%s)",
+                    self.path,
+                    e,
+                    delay,
+                    attempt,
+                    self.max_retries,
+                )
+                time.sleep(delay)
+
+    def _download_range(
+        self,
+        part_path: str,
+        chunk_size: int,
+        on_progress: Optional[Callable[[int, Optional[int]], None]],
+    ):
+        offset = 0
+        headers = {}
+        if os.path.exists(part_path):
+            validator = self._get_resume_validator(part_path)
+            if validator is None:
+                logger.debug("Discarding %s of another download", part_path)
+                _remove(part_path)
+            else:
+                offset = os.path.getsize(part_path)
+        if offset:
+            # Byte ranges refer to the encoded body, so resume the artifact as is
+            headers = {
+                "Accept-Encoding": "identity",
+                "Range": f"bytes={offset}-",
+                "If-Range": validator,
+            }
+        with self.execute(stream=True, headers=headers) as response:
+            if offset and response.status_code == 416:
+                # The partial file does not match the artifact, so start over
+                logger.debug("Range of %s is not satisfiable, restarting", part_path)
+                _remove(part_path)
+                return self._download_range(part_path, chunk_size, on_progress)
+            response.raise_for_status()
+            is_partial = response.status_code == 206
+            if is_partial:
+                start, total_size = parse_content_range(
+                    response.headers.get("Content-Range")
+                )
+                if start != offset:
+                    raise IncompleteDownloadError(
+                        f"Expected a range starting at byte {offset} of {self.path}, got {start}"
+                    )
+            else:
+                offset = 0
+                total_size = _get_content_length(response)
+                self._write_part_meta(part_path, response)
+            # Content-Length of a compressed response is the compressed size, which
+            # is checked against the number of bytes received instead
+            is_encoded = not is_partial and _is_encoded(response)
+            with open(part_path, "ab" if offset else "wb") as f:
+                _copy(
+                    response.iter_content(chunk_size=chunk_size),
+                    [f],
+                    total_size=None if is_encoded else total_size,
+                    on_progress=on_progress,
+                    written=offset,
+                )
+                size = response.raw.tell() if is_encoded else f.tell()
+        if total_size is not None and size != total_size:
+            raise IncompleteDownloadError(
+                f"Downloaded {size} of {total_size} bytes of {self.path}"
+            )
+
+    def _get_resume_validator(self, part_path: str) -> Optional[str]:
+        """Returns the If-Range validator of a partial download of this artifact.
+
+        Returns None if the .part file belongs to another artifact or there is no
+        validator to make sure the artifact has not changed since.
+        """
+        try:
+            with open(f"{part_path}{PART_META_SUFFIX}") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or meta.get("key") != self.cache_key:
+            return None
+        return meta.get("validator")
+
+    def _write_part_meta(self, part_path: str, response: requests.Response):
+        etag = response.headers.get("ETag")
+        # If-Range only accepts strong ETags
+        if etag is None or etag.startswith("W/"):
+            etag = None
+        meta = {
+            "key": self.cache_key,
+            "validator": etag or response.headers.get("Last-Modified"),
+        }
+        with open(f"{part_path}{PART_META_SUFFIX}", "w") as f:
+            json.dump(meta, f)
+
+    def _download(
+        self,
+        file: BinaryIO,
+        chunk_size: int,
+        on_progress: Optional[Callable[[int, Optional[int]], None]],
+        *tee_files: BinaryIO,
+    ) -> requests.Response:
+        with self.execute(stream=True) as response:
+            response.raise_for_status()
+            total_size = (
+                None if _is_encoded(response) else _get_content_length(response)
+            )
+            _copy(
+                response.iter_content(chunk_size=chunk_size),
+                [file, *tee_files],
+                total_size=total_size,
+                on_progress=on_progress,
+            )
         return response
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _get_content_length(response: requests.Response) -> Optional[int]:
+    content_length = response.headers.get("Content-Length")
+    return int(content_length) if content_length else None
+
+
+def _is_encoded(response: requests.Response) -> bool:
+    """Returns True if the response body is compressed for transfer."""
+    return response.headers.get("Content-Encoding", "identity") != "identity"
+
+
+def _copy(
+    chunks: Iterable[bytes],
+    files: List[BinaryIO],
+    total_size: Optional[int] = None,
+    on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    written: int = 0,
+):
+    """Writes every chunk to all files and reports the progress."""
+    for chunk in chunks:
+        for f in files:
+            f.write(chunk)
+        written += len(chunk)
+        if on_progress is not None:
+            on_progress(written, total_size)
+
+
+def parse_content_range(value: Optional[str]) -> Tuple[int, Optional[int]]:
+    """Parses a Content-Range header such as 'bytes 100-199/200' to (start, total).
+
+    total is None if the server does not know the complete size ('bytes 100-199/*').
+    """
+    try:
+        unit, byte_range = value.split(" ", 1)
+        range_part, total = byte_range.split("/", 1)
+        start = int(range_part.split("-", 1)[0])
+        total = None if total == "*" else int(total)
+    except (AttributeError, ValueError):
+        unit = None
+    if unit != "bytes":
+        raise IncompleteDownloadError(f"Invalid Content-Range header: {value!r}")
+    return start, total
@@ -1,4 +1,3 @@
-import requests
 from enum import Enum
 from typing import Optional
 from pydantic import Field, PrivateAttr
@@ -56,12 +55,13 @@ class DbtCloudRunListCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/runs"
 
-    def execute(self, pagination_token: str = None) -> requests.Response:
+    def get_request_kwargs(self, pagination_token: str = None) -> dict:
         if self.status is None:
             status = None
         else:
             status = self.status.as_number()
-        response = requests.get(
+        return dict(
+            method="get",
             url=self.api_url,
             headers={
                 "x-dbt-continuation-token": pagination_token,
@@ -77,4 +77,3 @@ class DbtCloudRunListCommand(DbtCloudAccountCommand):
             },
             timeout=self.timeout,
         )
-        return response
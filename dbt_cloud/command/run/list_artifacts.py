@@ -1,4 +1,3 @@
-import requests
 from typing import Optional
 from pydantic import Field, PrivateAttr
 from dbt_cloud.command.command import DbtCloudAccountCommand
@@ -10,6 +9,10 @@ class DbtCloudRunListArtifactsCommand(DbtCloudAccountCommand):
 
     _api_version: str = PrivateAttr("v2")
     run_id: int = RUN_ID_FIELD
+    step: Optional[int] = Field(
+        None,
+        description="The index of the Step in the Run to list artifacts for. The first step in the run has the index 1. If the step parameter is omitted, then this endpoint will return the artifacts compiled for the last step in the run.",
+    )
     include_related: Optional[str] = Field(
         default=None,
         description="Comma-separated list of related objects to include in the response.",
@@ -19,11 +22,11 @@ class DbtCloudRunListArtifactsCommand(DbtCloudAccountCommand):
     def api_url(self) -> str:
         return f"{super().api_url}/runs/{self.run_id}/artifacts"
 
-    def execute(self) -> requests.Response:
-        response = requests.get(
+    def get_request_kwargs(self) -> dict:
+        return dict(
+            method="get",
             url=self.api_url,
             headers=self.request_headers,
-            params={"include_related": self.include_related},
+            params={"step": self.step, "include_related": self.include_related},
             timeout=self.timeout,
         )
-        return response
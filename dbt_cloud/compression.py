@@ -0,0 +1,93 @@
+import gzip
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+from dbt_cloud.exc import DbtCloudException
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover (optional dependency)
+    zstandard = None
+
+# File name suffixes of the supported on-disk compressions
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _require_zstandard():
+    if zstandard is None:
+        raise DbtCloudException(
+            "zstd compression requires the zstandard package "
+            "(pip install 'dbt-cloud-cli[zstd]')"
+        )
+
+
+@contextmanager
+def compressed_writer(file: BinaryIO, compression: Optional[str]) -> Iterator[BinaryIO]:
+    """Yields a binary file that compresses everything written to it into `file`.
+
+    The compressed stream is finished when the with block exits; `file` itself is
+    left open. A compression of None writes to `file` as is.
+    """
+    if compression is None:
+        yield file
+    elif compression == "gzip":
+        with gzip.GzipFile(fileobj=file, mode="wb", mtime=0) as writer:
+            yield writer
+    elif compression == "zstd":
+        _require_zstandard()
+        with zstandard.ZstdCompressor().stream_writer(file, closefd=False) as writer:
+            yield writer
+    else:
+        raise ValueError(f"Unsupported compression: {compression}")
+
+
+def compress_file(
+    source_path: str,
+    target_path: str,
+    compression: Optional[str],
+    chunk_size: int = 1024 * 1024,
+):
+    """Writes a compressed copy of source_path to target_path.
+
+    The copy is written to a temporary file next to target_path and renamed into
+    place, so target_path never contains a partially compressed file.
+    """
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(target_path) or ".", suffix=".tmp"
+    )
+    try:
+        with open(source_path, "rb") as source, os.fdopen(fd, "wb") as target:
+            with compressed_writer(target, compression) as writer:
+                shutil.copyfileobj(source, writer, chunk_size)
+        os.replace(temp_path, target_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def open_artifact(path: str) -> BinaryIO:
+    """Opens an artifact file for reading, decompressing gzip and zstd files.
+
+    The compression is detected from the first bytes of the file, so compressed
+    artifacts are read transparently whatever their file name.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(ZSTD_MAGIC))
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(path, "rb")
+    if magic == ZSTD_MAGIC:
+        _require_zstandard()
+        return zstandard.open(path, "rb")
+    return open(path, "rb")
+
+
+def read_artifact(path: str) -> bytes:
+    """Returns the decompressed content of an artifact file."""
+    with open_artifact(path) as f:
+        return f.read()
@@ -1,9 +1,21 @@
+import io
+import os
+import re
+import sys
+import heapq
 import click
-from enum import Enum
+import logging
+import pickle
+import tempfile
+from enum import Enum, IntEnum
 from pathlib import Path
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from collections import Counter, defaultdict
+from typing import Optional, Dict, Any, Iterable, List, NamedTuple, Set, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+from dbt_cloud.cache import ArtifactCache, get_cache_home
 from dbt_cloud.command.command import ClickBaseModel
+from dbt_cloud.compression import open_artifact, read_artifact
+from dbt_cloud.serde import JsonStreamReader, dict_to_json_line, json_to_dict
 
 
 class Stats(BaseModel):
@@ -31,13 +43,8 @@ class Column(BaseModel):
         return f"{self.name} (type: {self.type}, index: {self.index}, comment: {self.comment})"
 
 
-class Node(BaseModel):
-    """Represents a node in the Catalog."""
-
-    unique_id: str
-    metadata: Dict[str, Optional[str]]
-    columns: Dict[str, Column]
-    stats: Dict[str, Stats]
+class NodeAccessors:
+    """Accessors shared by Node and CompactNode."""
 
     @property
     def name(self):
@@ -65,24 +72,424 @@ class Node(BaseModel):
         return f"{self.name} (type: {self.type}, schema: {self.schema}, database: {self.database})"
 
 
+class Node(NodeAccessors, BaseModel):
+    """Represents a node in the Catalog."""
+
+    unique_id: str
+    metadata: Dict[str, Optional[str]]
+    columns: Dict[str, Column]
+    stats: Dict[str, Stats]
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class CompactColumn(NamedTuple):
+    """A tuple-backed Column used by the low-memory catalog loader."""
+
+    type: str
+    index: int
+    name: str
+    comment: Optional[str] = None
+
+    def __str__(self):
+        return f"{self.name} (type: {self.type}, index: {self.index}, comment: {self.comment})"
+
+
+class CompactNode(NodeAccessors):
+    """A slotted Node used by the low-memory catalog loader.
+
+    Columns are kept as a tuple of CompactColumns, repeated metadata values (e.g.
+    database and schema names) are interned and stats are kept as JSON text that
+    is parsed into Stats models only when accessed.
+    """
+
+    __slots__ = ("unique_id", "metadata", "_columns", "_stats_json")
+
+    def __init__(
+        self,
+        unique_id: str,
+        metadata: Dict[str, Optional[str]],
+        columns: Tuple[CompactColumn, ...],
+        stats_json: str,
+    ):
+        self.unique_id = unique_id
+        self.metadata = metadata
+        self._columns = columns
+        self._stats_json = stats_json
+
+    @classmethod
+    def from_dict(cls, value: dict) -> "CompactNode":
+        return cls(
+            unique_id=value["unique_id"],
+            metadata={
+                key: _intern(metadata_value)
+                for key, metadata_value in value["metadata"].items()
+            },
+            columns=tuple(
+                CompactColumn(
+                    type=_intern(column["type"]),
+                    index=column["index"],
+                    name=column["name"],
+                    comment=_intern(column.get("comment")),
+                )
+                for column in value["columns"].values()
+            ),
+            stats_json=dict_to_json_line(value["stats"]),
+        )
+
+    @property
+    def columns(self) -> Dict[str, CompactColumn]:
+        return {column.name: column for column in self._columns}
+
+    @property
+    def stats(self) -> Dict[str, Stats]:
+        return {
+            key: Stats(**stats) for key, stats in json_to_dict(self._stats_json).items()
+        }
+
+    def __getstate__(self):
+        return (self.unique_id, self.metadata, self._columns, self._stats_json)
+
+    def __setstate__(self, state):
+        self.unique_id, self.metadata, self._columns, self._stats_json = state
+
+
+class NodeType(Enum):
+    SOURCE = "source"
+    NODE = "node"
+
+
+# Nodes by schema by database, with databases and schemas in sorted order
+NodeIndex = Dict[str, Dict[str, List[Node]]]
+
+
+def build_node_index(nodes: Iterable[Node]) -> NodeIndex:
+    """Groups nodes by database and schema and sorts each group by node name."""
+    grouped = defaultdict(lambda: defaultdict(list))
+    for node in nodes:
+        grouped[node.database][node.schema].append(node)
+    return {
+        database: {
+            schema: sorted(grouped[database][schema]) for schema in sorted(schemas)
+        }
+        for database, schemas in sorted(grouped.items())
+    }
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Splits text into lowercase alphanumeric tokens (snake_case is split too)."""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f" {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchField(IntEnum):
+    """Searchable parts of a node, valued by how much a match in them counts."""
+
+    NODE_NAME = 8
+    COLUMN_NAME = 4
+    NODE_COMMENT = 2
+    COLUMN_COMMENT = 1
+
+
+class SearchResult(NamedTuple):
+    score: float
+    node: Node
+    columns: List[str]
+
+    def __str__(self):
+        if self.columns:
+            return f"{self.node} [columns: {', '.join(self.columns)}]"
+        return str(self.node)
+
+
+class CatalogSearchIndex:
+    """An in-memory inverted index over node names, column names and comments.
+
+    Every token maps to the nodes it occurs in, weighted by the most important
+    field it occurs in. Query terms match tokens exactly, by prefix or by
+    substring, and fuzzily by trigram similarity if nothing else matches (e.g.
+    misspelled names). Candidate tokens are found through a trigram index of
+    the vocabulary instead of a scan of it.
+    """
+
+    MIN_SIMILARITY = 0.3
+
+    def __init__(self, nodes: Iterable[Node]):
+        self.nodes: List[Node] = []
+        # token -> {node position: weight of the best field the token occurs in}
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        for node in nodes:
+            position = len(self.nodes)
+            self.nodes.append(node)
+            self._add(node.name, position, SearchField.NODE_NAME)
+            self._add(node.metadata.get("comment"), position, SearchField.NODE_COMMENT)
+            for column in node.columns.values():
+                self._add(column.name, position, SearchField.COLUMN_NAME)
+                self._add(column.comment, position, SearchField.COLUMN_COMMENT)
+        for token in self._postings:
+            for trigram in _trigrams(token):
+                self._trigram_index[trigram].add(token)
+
+    def _add(self, text: Optional[str], position: int, field: SearchField):
+        for token in tokenize(text):
+            postings = self._postings[token]
+            if postings.get(position, 0) < field:
+                postings[position] = field
+
+    def _match_tokens(self, term: str) -> Dict[str, float]:
+        """Returns the vocabulary tokens matching a query term with match quality."""
+        term_trigrams = _trigrams(term)
+        overlaps = Counter()
+        for trigram in term_trigrams:
+            overlaps.update(self._trigram_index.get(trigram, ()))
+        matches, fuzzy_matches = {}, {}
+        for token, overlap in overlaps.items():
+            if token == term:
+                matches[token] = 1.0
+            elif token.startswith(term):
+                matches[token] = 0.8
+            elif term in token:
+                matches[token] = 0.6
+            else:
+                similarity = overlap / (
+                    len(term_trigrams) + len(_trigrams(token)) - overlap
+                )
+                if similarity >= self.MIN_SIMILARITY:
+                    fuzzy_matches[token] = 0.5 * similarity
+        # Fall back to fuzzy matches only if the term does not occur as such
+        return matches or fuzzy_matches
+
+    def _score_term(self, matches: Dict[str, float]) -> Dict[int, float]:
+        scores = {}
+        for token, quality in matches.items():
+            for position, weight in self._postings[token].items():
+                score = quality * weight
+                if score > scores.get(position, 0.0):
+                    scores[position] = score
+        return scores
+
+    def search(self, query: str, limit: int = 20) -> List[SearchResult]:
+        """Returns the nodes matching every term of the query, best matches first."""
+        term_matches = [self._match_tokens(term) for term in tokenize(query)]
+        if not term_matches:
+            return []
+        # Start from the most selective term to keep the intersection small
+        term_matches.sort(
+            key=lambda matches: sum(len(self._postings[token]) for token in matches)
+        )
+        scores = self._score_term(term_matches[0])
+        for matches in term_matches[1:]:
+            if not scores:
+                break
+            term_scores = self._score_term(matches)
+            scores = {
+                position: score + term_scores[position]
+                for position, score in scores.items()
+                if position in term_scores
+            }
+        ranked = heapq.nlargest(
+            limit, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+        matched_tokens = set().union(*term_matches)
+        return [
+            SearchResult(
+                score,
+                self.nodes[position],
+                self._matched_columns(self.nodes[position], matched_tokens),
+            )
+            for position, score in ranked
+        ]
+
+    @staticmethod
+    def _matched_columns(node: Node, tokens: Set[str]) -> List[str]:
+        return [
+            column.name
+            for column in node.columns.values()
+            if tokens.intersection(tokenize(column.name))
+            or tokens.intersection(tokenize(column.comment))
+        ]
+
+
 class Catalog(BaseModel):
-    """Represents a dbt catalog.json artifact."""
+    """Represents a dbt catalog.json artifact.
+
+    Nodes are indexed by database and schema when the catalog is loaded, so that
+    navigating the catalog takes dictionary lookups instead of scans of all nodes.
+
+    The nodes and sources are CompactNodes instead of Nodes if the catalog was
+    loaded with load_catalog_streaming.
+    """
 
     metadata: Dict
     nodes: Dict[str, Node]
     sources: Dict[str, Node]
     errors: Optional[Dict] = None
+    _index: Dict[NodeType, NodeIndex] = PrivateAttr(default_factory=dict)
+    _search_index: Optional[CatalogSearchIndex] = PrivateAttr(default=None)
 
-
-class NodeType(Enum):
-    SOURCE = "source"
-    NODE = "node"
+    def model_post_init(self, __context):
+        self._index = {
+            NodeType.SOURCE: build_node_index(self.sources.values()),
+            NodeType.NODE: build_node_index(self.nodes.values()),
+        }
+
+    def get_databases(self, node_type: NodeType) -> List[str]:
+        return list(self._index[node_type])
+
+    def get_schemas(self, node_type: NodeType, database: str) -> List[str]:
+        return list(self._index[node_type][database])
+
+    def get_nodes(self, node_type: NodeType, database: str, schema: str) -> List[Node]:
+        return self._index[node_type][database][schema]
+
+    def search(self, query: str, limit: int = 20) -> List[SearchResult]:
+        """Searches node and column names and comments of both nodes and sources.
+
+        The search index is built on the first search and reused afterwards.
+        """
+        if self._search_index is None:
+            self._search_index = CatalogSearchIndex(
+                [*self.nodes.values(), *self.sources.values()]
+            )
+        return self._search_index.search(query, limit=limit)
+
+
+SEARCH_CHOICE = "search"
+SNAPSHOT_VERSION = 3
+
+logger = logging.getLogger(__name__)
+
+
+def _get_file_signature(path: Path) -> tuple:
+    stat = os.stat(path)
+    return (SNAPSHOT_VERSION, stat.st_mtime_ns, stat.st_size)
+
+
+def get_snapshot_dir() -> Path:
+    return Path(get_cache_home(), "catalog-snapshots")
+
+
+def get_snapshot_path(path: Path, low_memory: bool = False) -> Path:
+    """Returns the path of the snapshot of a catalog file in the user's cache.
+
+    Snapshots are keyed by the resolved path of the catalog file and whether it
+    was loaded with load_catalog_streaming (low_memory).
+    """
+    key = ArtifactCache.make_key(str(Path(path).resolve()), low_memory)
+    return get_snapshot_dir() / key
+
+
+def _is_private(path: Path) -> bool:
+    """Tells if path is owned by the current user and not writable by others."""
+    if not hasattr(os, "getuid"):
+        return True
+    stat = os.stat(path)
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def load_catalog(path: Path) -> Catalog:
+    """Parses a catalog file into a Catalog of pydantic models."""
+    return Catalog.model_validate_json(read_artifact(path))
+
+
+def load_catalog_streaming(path: Path) -> Catalog:
+    """Parses a catalog file into a Catalog of CompactNodes with little memory.
+
+    The file is decoded one node at a time instead of as a whole, and every node is
+    converted into a CompactNode right away, so the peak memory use stays close
+    to the size of the compact catalog. The nodes are not validated by pydantic.
+    """
+    fields = {"metadata": {}, "nodes": {}, "sources": {}, "errors": None}
+    with open_artifact(path) as binary_file, io.TextIOWrapper(
+        binary_file, encoding="utf-8"
+    ) as file:
+        reader = JsonStreamReader(file)
+        for key in reader.iter_object():
+            if key in ("nodes", "sources"):
+                fields[key] = {
+                    unique_id: CompactNode.from_dict(reader.read_value())
+                    for unique_id in reader.iter_object()
+                }
+            elif key in fields:
+                fields[key] = reader.read_value()
+            else:
+                reader.read_value()
+    return Catalog.model_construct(**fields)
+
+
+def load_catalog_snapshot(path: Path, low_memory: bool = False) -> Optional[Catalog]:
+    """Returns the snapshot of the catalog file at path if it is up to date.
+
+    The snapshot is a pickle of the parsed catalog, tagged with the modification
+    time and size of the catalog file it was created from. Snapshots are only read
+    from the user's cache directory (see get_snapshot_path), and only if the
+    directory and the snapshot are not writable by other users, as unpickling a
+    file can execute arbitrary code. Returns None if there is no matching snapshot
+    or the catalog file has changed since.
+    """
+    snapshot_path = get_snapshot_path(path, low_memory)
+    try:
+        if not (_is_private(snapshot_path.parent) and _is_private(snapshot_path)):
+            logger.debug("Ignoring catalog snapshot %s of another user", snapshot_path)
+            return None
+        with open(snapshot_path, "rb") as f:
+            signature = pickle.load(f)
+            if signature != _get_file_signature(path):
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable catalog snapshot %s: %s", snapshot_path, e)
+        return None
+
+
+def save_catalog_snapshot(
+    path: Path,
+    catalog: Catalog,
+    signature: Optional[tuple] = None,
+    low_memory: bool = False,
+):
+    """Saves a snapshot of the parsed catalog (see load_catalog_snapshot).
+
+    Pass the signature of the catalog file taken before it was parsed, so that a
+    file modified during parsing is not mistaken for the parsed one.
+    """
+    snapshot_path = get_snapshot_path(path, low_memory)
+    signature = signature or _get_file_signature(path)
+    try:
+        os.makedirs(snapshot_path.parent, mode=0o700, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=snapshot_path.parent, suffix=".tmp")
+    except OSError as e:
+        logger.debug("Cannot write catalog snapshot %s: %s", snapshot_path, e)
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(signature, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, snapshot_path)
+    except OSError as e:
+        logger.debug("Cannot write catalog snapshot %s: %s", snapshot_path, e)
+        os.remove(temp_path)
 
 
 class CatalogExploreCommand(ClickBaseModel):
     """An inteactive application for exploring catalog artifacts."""
 
-    file: Path = Field(default="catalog.json", description="Catalog file path.")
+    file: Path = Field(
+        default="catalog.json",
+        description="Catalog file path. gzip and zstd compressed files are read transparently.",
+    )
     title: str = Field(
         default="Data Catalog", description="ASCII art title for the app."
     )
@@ -90,9 +497,45 @@ class CatalogExploreCommand(ClickBaseModel):
         default="rand-large",
         description="ASCII art title font (see https://github.com/sepandhaghighi/art#try-art-in-your-browser for a list of available fonts)",
     )
+    low_memory: bool = Field(
+        default=False,
+        description="Stream the catalog file into compact nodes to use a fraction of the memory (nodes are not validated).",
+        json_schema_extra={"is_flag": True},
+    )
+    no_snapshot: bool = Field(
+        default=False,
+        description="Do not read or write the parsed catalog snapshot (kept in ~/.cache/dbt-cloud/catalog-snapshots).",
+        json_schema_extra={"is_flag": True},
+    )
+    search_limit: int = Field(
+        default=20, description="Number of best matches to list in search mode."
+    )
+    _catalog: Optional[Catalog] = PrivateAttr(default=None)
 
     def get_catalog(self) -> Catalog:
-        return Catalog.model_validate_json(Path(self.file).read_text())
+        """Returns the parsed catalog, which is loaded only once per command.
+
+        A snapshot of the parsed catalog is kept in the user's cache directory so
+        that later sessions skip parsing unless the catalog file has changed.
+        """
+        if self._catalog is None:
+            catalog = (
+                None
+                if self.no_snapshot
+                else load_catalog_snapshot(self.file, self.low_memory)
+            )
+            if catalog is None:
+                signature = _get_file_signature(self.file)
+                if self.low_memory:
+                    catalog = load_catalog_streaming(self.file)
+                else:
+                    catalog = load_catalog(self.file)
+                if not self.no_snapshot:
+                    save_catalog_snapshot(
+                        self.file, catalog, signature, self.low_memory
+                    )
+            self._catalog = catalog
+        return self._catalog
 
     def print_title(self):
         from art import tprint
@@ -109,11 +552,15 @@ class CatalogExploreCommand(ClickBaseModel):
                 inquirer.List(
                     "node_type",
                     message="Select node type to explore",
-                    choices=[node_type.value for node_type in NodeType],
+                    choices=[node_type.value for node_type in NodeType]
+                    + [SEARCH_CHOICE],
                 )
             ]
-            node_type = NodeType(inquirer.prompt(node_type_options)["node_type"])
-            self.explore(node_type=node_type)
+            choice = inquirer.prompt(node_type_options)["node_type"]
+            if choice == SEARCH_CHOICE:
+                self.search()
+            else:
+                self.explore(node_type=NodeType(choice))
             if not click.confirm("Explore another node type?"):
                 break
 
@@ -122,43 +569,66 @@ class CatalogExploreCommand(ClickBaseModel):
         import inquirer
 
         catalog = self.get_catalog()
-        if node_type == NodeType.SOURCE:
-            nodes = list(catalog.sources.values())
-        else:
-            nodes = list(catalog.nodes.values())
 
         while True:
-            databases = sorted(set(map(lambda x: x.database, nodes)))
+            databases = catalog.get_databases(node_type)
             database_options = [
                 inquirer.List("database", message="Select database", choices=databases)
             ]
             database = inquirer.prompt(database_options)["database"]
-            nodes_filtered = list(filter(lambda x: x.database == database, nodes))
 
-            schemas = sorted(set(map(lambda x: x.schema, nodes_filtered)))
+            schemas = catalog.get_schemas(node_type, database)
             schema_options = [
                 inquirer.List("schema", message="Select schema", choices=schemas)
             ]
             schema = inquirer.prompt(schema_options)["schema"]
-            nodes_filtered = list(filter(lambda x: x.schema == schema, nodes_filtered))
 
             node_options = [
                 inquirer.List(
-                    "node", message="Select node", choices=sorted(nodes_filtered)
+                    "node",
+                    message="Select node",
+                    choices=catalog.get_nodes(node_type, database, schema),
                 )
             ]
             node = inquirer.prompt(node_options)["node"]
-            click.echo(f"{node.name} columns:")
-            for column in node.columns.values():
-                click.echo(f"- {column}")
-            click.echo("")
-            for stats in node.stats.values():
-                if stats.id == "has_stats":
-                    continue
-                click.echo(stats)
+            self.print_node(node)
             if not click.confirm(f"Explore another {node_type.value}?"):
                 break
 
+    def search(self):
+        """Interactive search of nodes by node and column names and comments"""
+        import inquirer
+
+        catalog = self.get_catalog()
+        while True:
+            query = click.prompt("Search for")
+            results = catalog.search(query, limit=self.search_limit)
+            if not results:
+                click.echo(f"No nodes match '{query}'.")
+            else:
+                result_options = [
+                    inquirer.List(
+                        "result",
+                        message=f"Select node ({len(results)} best matches)",
+                        choices=results,
+                    )
+                ]
+                result = inquirer.prompt(result_options)["result"]
+                self.print_node(result.node)
+            if not click.confirm("Search again?"):
+                break
+
+    @staticmethod
+    def print_node(node: Node):
+        click.echo(f"{node.name} columns:")
+        for column in node.columns.values():
+            click.echo(f"- {column}")
+        click.echo("")
+        for stats in node.stats.values():
+            if stats.id == "has_stats":
+                continue
+            click.echo(stats)
+
 
 @click.command(help=CatalogExploreCommand.get_description())
 @CatalogExploreCommand.click_options
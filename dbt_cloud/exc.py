@@ -1,2 +1,6 @@
 class DbtCloudException(Exception):
     pass
+
+
+class IncompleteDownloadError(DbtCloudException):
+    pass
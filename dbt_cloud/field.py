@@ -26,6 +26,17 @@ DBT_CLOUD_HOST_FIELD = Field(
     description="dbt Cloud Host (defaults to 'cloud.getdbt.com' unless DBT_CLOUD_HOST environment variable is set)",
 )
 
+MAX_RETRIES_FIELD = Field(
+    default_factory=lambda: int(get_env("DBT_CLOUD_MAX_RETRIES", default=0)),
+    ge=0,
+    description="Maximum number of retries for rate limited (429) and transient server error (5xx) responses (default: DBT_CLOUD_MAX_RETRIES environment variable or 0)",
+)
+RETRY_BACKOFF_FIELD = Field(
+    default_factory=lambda: float(get_env("DBT_CLOUD_RETRY_BACKOFF", default=1.0)),
+    ge=0,
+    description="Base delay in seconds for jittered exponential backoff between retries (default: DBT_CLOUD_RETRY_BACKOFF environment variable or 1.0)",
+)
+
 API_TOKEN_FIELD = Field(
     default_factory=lambda: get_env("DBT_CLOUD_API_TOKEN"),
     description="API authentication key (default: DBT_CLOUD_API_TOKEN environment variable)",
@@ -0,0 +1,186 @@
+import statistics
+import time
+import requests
+from typing import Callable, Dict, Iterable, Iterator, Optional
+from dbt_cloud.command import (
+    DbtCloudRunGetCommand,
+    DbtCloudRunListCommand,
+    DbtCloudRunStatus,
+)
+from dbt_cloud.command.command import REQUEST_FIELDS
+from dbt_cloud.command.run.get import TERMINAL_STATUSES
+from dbt_cloud.command.run.list import DbtCloudRunStatus as DbtCloudRunListStatus
+
+# Shortest interval in seconds between status polls, so that polling never
+# turns into a busy loop against the API
+MIN_POLL_INTERVAL = 0.5
+
+
+class AdaptivePollInterval:
+    """Computes the delay between status polls of a run.
+
+    Polls start at `poll_min` seconds and back off in proportion to the age of the
+    run, up to `poll_max` seconds. If the run is expected to take
+    `expected_duration` seconds (e.g. based on previous runs of the job), a poll is
+    scheduled for the expected finish and polling speeds up again after it.
+    """
+
+    def __init__(
+        self,
+        poll_min: float = 1.0,
+        poll_max: float = 30.0,
+        expected_duration: Optional[float] = None,
+        backoff_ratio: float = 0.1,
+    ):
+        self.poll_min = max(poll_min, MIN_POLL_INTERVAL)
+        self.poll_max = max(poll_max, self.poll_min)
+        self.expected_duration = expected_duration
+        self.backoff_ratio = backoff_ratio
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.poll_min), self.poll_max)
+
+    def next_interval(self, elapsed: float) -> float:
+        """Returns the number of seconds to wait when the run is `elapsed` seconds old."""
+        if not self.expected_duration:
+            return self._clamp(elapsed * self.backoff_ratio)
+        remaining = self.expected_duration - elapsed
+        if remaining > 0:
+            return self._clamp(min(elapsed * self.backoff_ratio, remaining))
+        # The run is overdue, so start over from fast polls
+        return self._clamp(-remaining * self.backoff_ratio)
+
+
+def parse_duration(value: str) -> float:
+    """Parses a run duration such as '00:01:50' or '1 day, 02:00:00' to seconds."""
+    days = 0
+    if "," in value:
+        days_part, value = value.split(",", 1)
+        days = int(days_part.split()[0])
+    hours, minutes, seconds = value.strip().split(":")
+    return days * 86400 + int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def get_expected_duration(
+    list_command: DbtCloudRunListCommand, sample_size: int = 5
+) -> Optional[float]:
+    """Returns the median duration in seconds of the latest successful runs of a job.
+
+    Returns None if there are no previous runs or the history cannot be fetched.
+    """
+    history_command = list_command.model_copy(
+        update={
+            "status": DbtCloudRunListStatus.SUCCEEDED,
+            "order_by": "-id",
+            "offset": 0,
+            "limit": sample_size,
+        }
+    )
+    try:
+        response = history_command.execute()
+        response.raise_for_status()
+        durations = [parse_duration(run["duration"]) for run in response.json()["data"]]
+    except (requests.RequestException, KeyError, TypeError, ValueError):
+        return None
+    if not durations:
+        return None
+    return statistics.median(durations)
+
+
+def iter_latest_runs(
+    list_command: DbtCloudRunListCommand,
+    min_run_id: int,
+    page_size: int = 100,
+    max_pages: Optional[int] = None,
+) -> Iterator[dict]:
+    """Yields the runs of the account newest first until runs older than min_run_id.
+
+    Stops after max_pages pages if given.
+    """
+    offset = 0
+    pages = 0
+    while max_pages is None or pages < max_pages:
+        page_command = list_command.model_copy(
+            update={"order_by": "-id", "offset": offset, "limit": page_size}
+        )
+        response = page_command.execute()
+        response.raise_for_status()
+        pages += 1
+        runs = response.json()["data"]
+        yield from runs
+        if not runs or runs[-1]["id"] <= min_run_id:
+            return
+        offset += len(runs)
+
+
+def _get_run(list_command: DbtCloudRunListCommand, run_id: int) -> Optional[dict]:
+    """Returns the run with the given ID, or None if it does not exist."""
+    command = DbtCloudRunGetCommand(
+        **list_command.model_dump(include={*REQUEST_FIELDS, "account_id"}),
+        run_id=run_id,
+    )
+    response = command.execute()
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()["data"]
+
+
+def wait_for_runs(
+    list_command: DbtCloudRunListCommand,
+    run_ids: Iterable[int],
+    poll_interval: AdaptivePollInterval,
+    on_update: Optional[Callable[[dict], None]] = None,
+) -> Dict[int, dict]:
+    """Waits until all runs are complete and returns the last seen run dicts by ID.
+
+    The statuses of all pending runs are looked up together by listing the latest
+    runs of the account, which usually takes a single request per poll instead of
+    one request per run. The listing is cut off after as many pages as there are
+    pending runs, and the pending runs it did not reach are looked up one by one.
+    A run that cannot be found any more (e.g. because it was deleted) is no longer
+    waited for and gets an ``error`` entry. on_update is called whenever the
+    status of a run changes or it is not found.
+    """
+    runs = {}
+    pending = set(run_ids)
+
+    def update(run: dict):
+        previous = runs.get(run["id"])
+        runs[run["id"]] = run
+        if on_update and (
+            previous is None
+            or previous.get("status") != run.get("status")
+            or "error" in run
+        ):
+            on_update(run)
+        if "error" in run or DbtCloudRunStatus(run["status"]) in TERMINAL_STATUSES:
+            pending.discard(run["id"])
+
+    def not_found(run_id: int):
+        update({**runs.get(run_id, {"id": run_id}), "error": "Run not found."})
+
+    started_at = time.monotonic()
+    while pending:
+        unresolved = set(pending)
+        lowest_run_id = None
+        for run in iter_latest_runs(
+            list_command, min_run_id=min(pending), max_pages=len(pending)
+        ):
+            lowest_run_id = run["id"]
+            if run["id"] in unresolved:
+                unresolved.discard(run["id"])
+                update(run)
+        for run_id in sorted(unresolved):
+            if lowest_run_id is not None and lowest_run_id < run_id:
+                # The listing went past the run without finding it
+                not_found(run_id)
+                continue
+            run = _get_run(list_command, run_id)
+            if run is None:
+                not_found(run_id)
+            else:
+                update(run)
+        if pending:
+            time.sleep(poll_interval.next_interval(time.monotonic() - started_at))
+    return runs
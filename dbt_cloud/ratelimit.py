@@ -0,0 +1,129 @@
+import json
+import math
+import os
+import threading
+import time
+from typing import Optional
+from dbt_cloud.field import get_env
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover (Windows)
+    fcntl = None
+
+
+class TokenBucket:
+    """A token bucket shared by all threads of a process.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per second.
+    Callers reserve a token and wait until it is theirs, so concurrent callers are
+    spaced out evenly instead of all being rejected by the API at once.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst or max(math.ceil(rate), 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens: float, updated: float, now: float):
+        tokens = min(self.burst, tokens + (now - updated) * self.rate) - 1
+        delay = max(-tokens / self.rate, 0.0)
+        return tokens, delay
+
+    def reserve(self) -> float:
+        """Takes a token and returns the number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, delay = self._take(self._tokens, self._updated, now)
+            self._updated = now
+        return delay
+
+    def acquire(self):
+        """Blocks until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class FileTokenBucket(TokenBucket):
+    """A token bucket shared by all processes on the host through a locked state file."""
+
+    def __init__(self, path: str, rate: float, burst: Optional[int] = None):
+        if fcntl is None:
+            raise RuntimeError("Sharing the rate limit between processes needs fcntl")
+        super().__init__(rate=rate, burst=burst)
+        self.path = path
+
+    def reserve(self) -> float:
+        with self._lock, open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read())
+                    tokens, updated = state["tokens"], state["updated"]
+                except (ValueError, KeyError):
+                    tokens, updated = float(self.burst), time.time()
+                now = time.time()
+                tokens, delay = self._take(tokens, min(updated, now), now)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({"tokens": tokens, "updated": now}))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return delay
+
+
+_rate_limiter = None
+_rate_limiter_configured = False
+_rate_limiter_lock = threading.Lock()
+
+
+def create_rate_limiter(
+    rate: Optional[float], burst: Optional[int] = None, path: Optional[str] = None
+) -> Optional[TokenBucket]:
+    """Creates a rate limiter allowing `rate` requests per second, or None if rate is not set.
+
+    When `path` is given, the limit is shared with other processes using the same file.
+    """
+    if not rate:
+        return None
+    if path:
+        return FileTokenBucket(path=os.path.expanduser(path), rate=rate, burst=burst)
+    return TokenBucket(rate=rate, burst=burst)
+
+
+def get_rate_limiter() -> Optional[TokenBucket]:
+    """Returns the process-wide rate limiter, or None if rate limiting is disabled.
+
+    The limiter is configured from the DBT_CLOUD_RATE_LIMIT (requests per second),
+    DBT_CLOUD_RATE_LIMIT_BURST and DBT_CLOUD_RATE_LIMIT_FILE environment variables.
+    """
+    global _rate_limiter, _rate_limiter_configured
+    if not _rate_limiter_configured:
+        with _rate_limiter_lock:
+            if not _rate_limiter_configured:
+                burst = get_env("DBT_CLOUD_RATE_LIMIT_BURST", allow_none=True)
+                _rate_limiter = create_rate_limiter(
+                    rate=float(get_env("DBT_CLOUD_RATE_LIMIT", default=0)),
+                    burst=int(burst) if burst else None,
+                    path=get_env("DBT_CLOUD_RATE_LIMIT_FILE", allow_none=True),
+                )
+                _rate_limiter_configured = True
+    return _rate_limiter
+
+
+def configure_rate_limiter(
+    rate: Optional[float], burst: Optional[int] = None, path: Optional[str] = None
+) -> Optional[TokenBucket]:
+    """Replaces the process-wide rate limiter. A falsy rate disables rate limiting."""
+    global _rate_limiter, _rate_limiter_configured
+    with _rate_limiter_lock:
+        _rate_limiter = create_rate_limiter(rate=rate, burst=burst, path=path)
+        _rate_limiter_configured = True
+    return _rate_limiter
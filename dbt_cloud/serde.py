@@ -1,9 +1,336 @@
 import json
+import os
+import re
+import threading
+from typing import Iterator, Optional, TextIO, Union
+from dbt_cloud.exc import DbtCloudException
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover (optional dependency)
+    orjson = None
+
+
+class JsonBackend:
+    """Encodes and decodes JSON with the json module of the standard library."""
+
+    name = "json"
+
+    def dumps(self, value, indent: bool = False) -> str:
+        if indent:
+            return json.dumps(value, indent=2)
+        return json.dumps(value, separators=(",", ":"))
+
+    def dumpb(self, value) -> bytes:
+        """Returns the compact encoding of value as bytes."""
+        return self.dumps(value).encode()
+
+    def loads(self, value: Union[str, bytes]):
+        return json.loads(value)
+
+
+class OrjsonBackend(JsonBackend):
+    """Encodes and decodes JSON with orjson, several times faster than json.
+
+    Values orjson cannot encode (e.g. integers over 64 bits or dicts with
+    non-string keys) are encoded by the json module, so the output is the same
+    except that non-ASCII characters are written as UTF-8 instead of escaped.
+    Unlike json, orjson decodes integers over 64 bits as floats.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise DbtCloudException(
+                "The orjson JSON backend requires the orjson package "
+                "(pip install 'dbt-cloud-cli[orjson]')"
+            )
+
+    def dumps(self, value, indent: bool = False) -> str:
+        try:
+            return orjson.dumps(
+                value, option=orjson.OPT_INDENT_2 if indent else 0
+            ).decode()
+        except TypeError:
+            return super().dumps(value, indent=indent)
+
+    def dumpb(self, value) -> bytes:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            return super().dumpb(value)
+
+    def loads(self, value: Union[str, bytes]):
+        try:
+            return orjson.loads(value)
+        except ValueError:
+            return super().loads(value)
+
+
+JSON_BACKENDS = {backend.name: backend for backend in (JsonBackend, OrjsonBackend)}
+
+_json_backend = None
+_json_backend_lock = threading.Lock()
+_compact_output = False
+
+
+def create_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """Creates a JSON backend by name ('json' or 'orjson').
+
+    Without a name (or with 'auto'), orjson is used when it is installed.
+    """
+    if not name or name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if name not in JSON_BACKENDS:
+        raise DbtCloudException(
+            f"Unknown JSON backend: {name} (choose from auto, {', '.join(JSON_BACKENDS)})"
+        )
+    return JSON_BACKENDS[name]()
+
+
+def get_json_backend() -> JsonBackend:
+    """Returns the JSON backend used to encode CLI output and decode responses.
+
+    The backend is chosen by the DBT_CLOUD_JSON_BACKEND environment variable
+    (auto, json or orjson; default: auto).
+    """
+    global _json_backend
+    if _json_backend is None:
+        with _json_backend_lock:
+            if _json_backend is None:
+                _json_backend = create_json_backend(
+                    os.environ.get("DBT_CLOUD_JSON_BACKEND")
+                )
+    return _json_backend
+
+
+def configure_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """Replaces the JSON backend (see create_json_backend)."""
+    global _json_backend
+    with _json_backend_lock:
+        _json_backend = create_json_backend(name)
+    return _json_backend
+
+
+def set_compact_output(compact: bool):
+    """Makes dict_to_json write compact JSON instead of indenting it."""
+    global _compact_output
+    _compact_output = compact
 
 
 def dict_to_json(value: dict) -> str:
-    return json.dumps(value, indent=2)
+    return get_json_backend().dumps(value, indent=not _compact_output)
+
+
+def dict_to_json_line(value: dict) -> str:
+    return get_json_backend().dumps(value)
+
+
+def dict_to_json_bytes(value: dict) -> bytes:
+    return get_json_backend().dumpb(value)
+
+
+def json_to_dict(value: Union[str, bytes]) -> dict:
+    return get_json_backend().loads(value)
+
+
+class ValueTooLargeError(ValueError):
+    """Raised when a value is larger than the size it is allowed to take."""
+
+
+_STRUCTURAL_CHAR = re.compile(r'["\[\]{}]')
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class JsonStreamReader:
+    """Reads a JSON document incrementally from a text file.
+
+    Objects and arrays can be iterated entry by entry with iter_object() and
+    iter_array(), and any value can be decoded with read_value() or skipped with
+    skip_value(), so that large documents (e.g. catalog.json or a long run list)
+    are processed one entry at a time without loading the whole file. Only the
+    value being decoded is held in memory, plus a read buffer of about
+    chunk_size characters.
+    """
+
+    WHITESPACE = " \t\n\r"
+
+    def __init__(self, file: TextIO, chunk_size: int = 64 * 1024):
+        self.file = file
+        self.chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int) -> bool:
+        """Reads at least size more characters unless at the end of the file."""
+        if self._eof:
+            return False
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        chunk = self.file.read(max(size, self.chunk_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character ('' at the end of file).
+
+        The character tells the type of the next value, e.g. '{' for an object.
+        """
+        while True:
+            while self._pos < len(self._buffer):
+                if self._buffer[self._pos] not in self.WHITESPACE:
+                    return self._buffer[self._pos]
+                self._pos += 1
+            if not self._fill(self.chunk_size):
+                return ""
+
+    def _expect(self, char: str):
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def read_value(self, max_size: Optional[int] = None):
+        """Decodes the next value.
+
+        If max_size is given and the JSON text of the value turns out to be longer
+        than max_size characters, the value is skipped without being decoded (or
+        buffered as a whole) and ValueTooLargeError is raised.
+        """
+        self.peek()
+        read_size = self.chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if max_size is not None and len(self._buffer) - self._pos > max_size:
+                    self.skip_value()
+                    raise ValueTooLargeError(
+                        f"The value is longer than {max_size} characters"
+                    )
+                # The value continues past the buffer, so read more of it. The
+                # read size doubles to keep large values linear to decode.
+                if not self._fill(read_size):
+                    raise
+                read_size *= 2
+                continue
+            # A number could continue in the next chunk, e.g. "12." or "1e"
+            # decode as 12 and 1 when the chunk ends there
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and (end == len(self._buffer) or self._buffer[end] in _NUMBER_CHARS)
+                and self._fill(read_size)
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterates the keys of the next object.
+
+        The value of every key must be consumed (with read_value or iter_object)
+        before the iteration continues.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise json.JSONDecodeError(
+                    "Expecting property name enclosed in double quotes",
+                    self._buffer,
+                    self._pos,
+                )
+            key = self.read_value()
+            self._expect(":")
+            yield key
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("}")
+            return
+
+    def iter_array(self) -> Iterator[int]:
+        """Iterates the indexes of the items of the next array.
+
+        Every item must be consumed (with read_value, skip_value, iter_object or
+        iter_array) before the iteration continues.
+        """
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("]")
+            return
+
+    def skip_value(self):
+        """Skips the next value without decoding it.
 
+        Strings, objects and arrays are only scanned for their end, which is much
+        faster than decoding them and does not hold them in memory. The skipped
+        value is not validated.
+        """
+        if self.peek() not in '{["':
+            self.read_value()
+            return
+        depth = 0
+        while True:
+            match = _STRUCTURAL_CHAR.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill(self.chunk_size):
+                    raise json.JSONDecodeError(
+                        "Unexpected end of document", self._buffer, self._pos
+                    )
+                continue
+            self._pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._skip_string()
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0:
+                return
 
-def json_to_dict(value: str) -> dict:
-    return json.loads(value)
+    def _skip_string(self):
+        """Skips the rest of a string whose opening quote has been consumed."""
+        while True:
+            end = self._buffer.find('"', self._pos)
+            if end == -1:
+                # The string continues in the next chunk. Trailing backslashes are
+                # kept as they may escape its first character.
+                end = len(self._buffer)
+                while end > self._pos and self._buffer[end - 1] == "\\":
+                    end -= 1
+                self._pos = end
+                if not self._fill(self.chunk_size):
+                    raise json.JSONDecodeError(
+                        "Unterminated string", self._buffer, self._pos
+                    )
+                continue
+            backslashes = 0
+            while (
+                end - backslashes > self._pos
+                and self._buffer[end - backslashes - 1] == "\\"
+            ):
+                backslashes += 1
+            self._pos = end + 1
+            if backslashes % 2 == 0:
+                return
@@ -14,14 +14,41 @@ Usage (Anthropic):
     from dbt_cloud.tools import get_anthropic_tools, execute_tool_call
     tools = get_anthropic_tools()
     result = execute_tool_call("job_get", {"account_id": 123, "job_id": 456})
+
+Usage (several tool calls of one turn in parallel):
+    from dbt_cloud.tools import execute_tool_calls
+    results = execute_tool_calls([("run_get", {...}), ("job_list", {...})])
+
+Usage (asyncio):
+    from dbt_cloud.tools import async_execute_tool_call
+    result = await async_execute_tool_call("run_get", {"account_id": 123, "run_id": 789})
 """
 
+import functools
+import io
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Union, get_args, get_origin
+from typing import (
+    Any,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from dbt_cloud.command.command import DEFAULT_POOL_SIZE
+from dbt_cloud.serde import (
+    JsonStreamReader,
+    ValueTooLargeError,
+    dict_to_json_bytes,
+    json_to_dict,
+)
 from dbt_cloud.command import (
     DbtCloudAccountGetCommand,
     DbtCloudAccountListCommand,
@@ -85,7 +112,13 @@ TOOL_REGISTRY: dict[str, type] = {
 }
 
 # Fields that are infrastructure concerns — injected at execute time, not by the agent.
-_INFRA_FIELDS = {"api_token", "dbt_cloud_host", "timeout"}
+_INFRA_FIELDS = {
+    "api_token",
+    "dbt_cloud_host",
+    "timeout",
+    "max_retries",
+    "retry_backoff",
+}
 
 
 def _annotation_to_json_schema(annotation: Any) -> dict:
@@ -161,62 +194,313 @@ def _model_to_json_schema(cls: type, strip_infra: bool = False) -> dict:
 def _get_tool_schema(command_cls: type) -> dict:
     """Return a cleaned JSON schema for the given command class.
 
-    Strips infrastructure fields (api_token, dbt_cloud_host, timeout) and
+    Strips infrastructure fields (api_token, dbt_cloud_host, timeout, retries) and
     fields marked exclude_from_click_options (auto-assigned by the API).
     """
     return _model_to_json_schema(command_cls, strip_infra=True)
 
 
+def _build_tool_definition(name: str, command_cls: type, tool_format: str) -> dict:
+    description = command_cls.get_description()
+    schema = _get_tool_schema(command_cls)
+    if tool_format == "openai":
+        return {
+            "type": "function",
+            "function": {
+                "name": name,
+                "description": description,
+                "parameters": schema,
+            },
+        }
+    return {"name": name, "description": description, "input_schema": schema}
+
+
+@functools.lru_cache(maxsize=64)
+def _get_pickled_tools(tool_format: str, tools: tuple[tuple[str, type], ...]) -> bytes:
+    """Build the tool definitions once per (format, tools) and return them pickled.
+
+    Unpickling is several times faster than generating the schemas from the
+    models (or deep-copying them), and every caller gets its own copy that it can
+    modify without affecting the cache.
+    """
+    return pickle.dumps(
+        [_build_tool_definition(name, cls, tool_format) for name, cls in tools],
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def _get_tools(tool_format: str, include: list[str] | None) -> list[dict]:
+    tools = tuple(
+        (name, cls)
+        for name, cls in TOOL_REGISTRY.items()
+        if include is None or name in include
+    )
+    return pickle.loads(_get_pickled_tools(tool_format, tools))
+
+
 def get_openai_tools(include: list[str] | None = None) -> list[dict]:
     """Return tool definitions in OpenAI function calling format.
 
+    The definitions are generated once per include-set and cached; every call
+    returns a fresh copy.
+
     Args:
         include: Optional list of tool names to include. Defaults to all tools.
 
     Returns:
         List of dicts with ``{"type": "function", "function": {...}}`` shape.
     """
-    tools = []
-    for name, cls in TOOL_REGISTRY.items():
-        if include is not None and name not in include:
-            continue
-        tools.append(
-            {
-                "type": "function",
-                "function": {
-                    "name": name,
-                    "description": cls.get_description(),
-                    "parameters": _get_tool_schema(cls),
-                },
-            }
-        )
-    return tools
+    return _get_tools("openai", include)
 
 
 def get_anthropic_tools(include: list[str] | None = None) -> list[dict]:
     """Return tool definitions in Anthropic tool use format.
 
+    The definitions are generated once per include-set and cached; every call
+    returns a fresh copy.
+
     Args:
         include: Optional list of tool names to include. Defaults to all tools.
 
     Returns:
         List of dicts with ``{"name": ..., "description": ..., "input_schema": {...}}`` shape.
     """
-    tools = []
-    for name, cls in TOOL_REGISTRY.items():
-        if include is not None and name not in include:
-            continue
-        tools.append(
-            {
-                "name": name,
-                "description": cls.get_description(),
-                "input_schema": _get_tool_schema(cls),
-            }
+    return _get_tools("anthropic", include)
+
+
+# Tools whose result is a file rather than a {"status", "data", "extra"} API response
+_FILE_RESULT_TOOLS = {"run_get_artifact"}
+
+
+class ResultShape(BaseModel):
+    """Limits the size of a tool result.
+
+    The shape applies to the ``data`` of the API response (or to the whole
+    result of tools that return a file, like run_get_artifact) and is applied
+    while the response is decoded. Fields that are not in ``fields`` and items
+    past max_items are skipped without being decoded. Under max_bytes, a field or
+    item is decoded only until it is known not to fit in the remaining bytes, and
+    the rest of it is skipped. When items or fields are dropped to stay within
+    max_items or max_bytes, the result gets a ``truncated`` entry that tells the
+    agent why.
+    """
+
+    fields: Optional[list[str]] = Field(
+        default=None,
+        description=(
+            "Fields to keep in the data object, or in every item of a data list. "
+            "Nested fields are given as paths, e.g. 'run_steps.name'."
+        ),
+    )
+    max_items: Optional[int] = Field(
+        default=None, gt=0, description="Maximum number of items of a data list."
+    )
+    max_bytes: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Maximum size of the data in bytes, encoded as compact JSON.",
+    )
+
+
+def _make_projection(fields: Optional[list[str]]) -> Optional[dict]:
+    """Turns field paths into a tree of keys to keep; None keeps a whole value."""
+    if fields is None:
+        return None
+    projection = {}
+    for field in fields:
+        node = projection
+        *parents, leaf = field.split(".")
+        for part in parents:
+            if part in node and node[part] is None:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[leaf] = None
+    return projection
+
+
+# The JSON text of a value is at most this many times longer than its compact
+# encoding, e.g. "\u0041" for "A".
+_MAX_ESCAPE_RATIO = 6
+
+
+def _encoded_size(value: Any) -> int:
+    return len(dict_to_json_bytes(value))
+
+
+def _skip_rest(reader: JsonStreamReader, entries: Iterator):
+    for _ in entries:
+        reader.skip_value()
+
+
+def _read_projected(
+    reader: JsonStreamReader,
+    projection: Optional[dict],
+    budget: Optional[int] = None,
+) -> tuple:
+    """Reads the next value, keeping only the fields of the projection.
+
+    Returns the value and the size of its compact JSON encoding, or None for the
+    size if no budget is given. If the encoded value is larger than budget bytes,
+    the rest of it is skipped as soon as that is known and ValueTooLargeError is
+    raised.
+    """
+    if budget is None and projection is None:
+        return reader.read_value(), None
+    char = reader.peek()
+    if char in "{[" and budget is not None and budget < 2:
+        reader.skip_value()
+        raise ValueTooLargeError(f"The value is larger than {budget} bytes")
+    if char == "{":
+        value, size = {}, 2
+        entries = reader.iter_object()
+        for key in entries:
+            if projection is not None and key not in projection:
+                reader.skip_value()
+                continue
+            if budget is None:
+                value[key], _ = _read_projected(reader, projection[key])
+                continue
+            # '"key":' plus a comma before every entry but the first
+            key_size = _encoded_size(key) + 1 + (1 if value else 0)
+            try:
+                value[key], value_size = _read_projected(
+                    reader,
+                    projection[key] if projection is not None else None,
+                    budget - size - key_size,
+                )
+            except ValueTooLargeError:
+                _skip_rest(reader, entries)
+                raise
+            size += key_size + value_size
+        return value, size if budget is not None else None
+    if char == "[":
+        value, size = [], 2
+        entries = reader.iter_array()
+        for _ in entries:
+            if budget is None:
+                value.append(_read_projected(reader, projection)[0])
+                continue
+            comma_size = 1 if value else 0
+            try:
+                item, item_size = _read_projected(
+                    reader, projection, budget - size - comma_size
+                )
+            except ValueTooLargeError:
+                _skip_rest(reader, entries)
+                raise
+            value.append(item)
+            size += comma_size + item_size
+        return value, size if budget is not None else None
+    if budget is None:
+        return reader.read_value(), None
+    value = reader.read_value(max_size=max(budget, 0) * _MAX_ESCAPE_RATIO)
+    size = _encoded_size(value)
+    if size > budget:
+        raise ValueTooLargeError(f"The value is larger than {budget} bytes")
+    return value, size
+
+
+def _read_shaped(reader: JsonStreamReader, shape: ResultShape) -> tuple:
+    """Reads the next value with the shape applied.
+
+    Returns the value and a description of what was truncated (or None).
+    """
+    projection = _make_projection(shape.fields)
+    char = reader.peek()
+    if char == "[":
+        items, size, truncated = [], 2, None
+        for index in reader.iter_array():
+            if truncated is not None:
+                reader.skip_value()
+            elif shape.max_items is not None and index >= shape.max_items:
+                truncated = {"reason": "max_items", "returned_items": len(items)}
+                reader.skip_value()
+            elif shape.max_bytes is None:
+                items.append(_read_projected(reader, projection)[0])
+            else:
+                # The item and the comma that separates it from the previous one
+                budget = shape.max_bytes - size - 1
+                try:
+                    item, item_size = _read_projected(reader, projection, budget)
+                except ValueTooLargeError:
+                    truncated = {"reason": "max_bytes", "returned_items": len(items)}
+                else:
+                    items.append(item)
+                    size += item_size + 1
+        return items, truncated
+    if char == "{":
+        value, size, omitted_fields = {}, 2, []
+        for key in reader.iter_object():
+            if projection is not None and key not in projection:
+                reader.skip_value()
+                continue
+            field_projection = projection[key] if projection is not None else None
+            if shape.max_bytes is None:
+                value[key], _ = _read_projected(reader, field_projection)
+                continue
+            # The size of '"key":value,' in the compact encoding of the object
+            key_size = _encoded_size(key) + 2
+            try:
+                field_value, field_size = _read_projected(
+                    reader, field_projection, shape.max_bytes - size - key_size
+                )
+            except ValueTooLargeError:
+                omitted_fields.append(key)
+            else:
+                value[key] = field_value
+                size += key_size + field_size
+        if omitted_fields:
+            return value, {"reason": "max_bytes", "omitted_fields": omitted_fields}
+        return value, None
+    return reader.read_value(), None
+
+
+def shape_result(file: io.TextIOBase, shape: ResultShape, is_file: bool = False):
+    """Decodes a JSON tool result from a text file, applying the shape.
+
+    Args:
+        file: The JSON document, e.g. a streamed response body.
+        shape: The limits to apply.
+        is_file: True if the document is a file (an artifact) rather than an API
+            response, in which case the shape applies to the whole document.
+    """
+    reader = JsonStreamReader(file)
+    if is_file:
+        value, truncated = _read_shaped(reader, shape)
+        if truncated is not None and isinstance(value, dict):
+            value["truncated"] = truncated
+        return value
+    result = {}
+    for key in reader.iter_object():
+        if key == "data":
+            result["data"], truncated = _read_shaped(reader, shape)
+            if truncated is not None:
+                result["truncated"] = truncated
+        else:
+            result[key] = reader.read_value()
+    return result
+
+
+def _create_command(tool_name: str, tool_input: dict):
+    cls = TOOL_REGISTRY.get(tool_name)
+    if cls is None:
+        raise ValueError(
+            f"Unknown tool: {tool_name!r}. Available tools: {sorted(TOOL_REGISTRY)}"
         )
-    return tools
+
+    kwargs = dict(tool_input)
+    kwargs.setdefault("api_token", os.environ.get("DBT_CLOUD_API_TOKEN", ""))
+    kwargs.setdefault(
+        "dbt_cloud_host",
+        os.environ.get("DBT_CLOUD_HOST", "https://cloud.getdbt.com"),
+    )
+    return cls(**kwargs)
 
 
-def execute_tool_call(tool_name: str, tool_input: dict) -> dict:
+def execute_tool_call(
+    tool_name: str, tool_input: dict, shape: Optional[ResultShape] = None
+) -> dict:
     """Execute a tool call and return the API response as a dict.
 
     Infrastructure fields (api_token, dbt_cloud_host) are injected from
@@ -225,6 +509,9 @@ def execute_tool_call(tool_name: str, tool_input: dict) -> dict:
     Args:
         tool_name: One of the keys in TOOL_REGISTRY (e.g. ``"job_run"``).
         tool_input: Dict of arguments for the command (excluding api_token etc.).
+        shape: Optional limits for the size of the result. The response is then
+            streamed and decoded incrementally, so that what is left out is never
+            held in memory.
 
     Returns:
         The parsed JSON response body from the dbt Cloud API.
@@ -233,20 +520,104 @@ def execute_tool_call(tool_name: str, tool_input: dict) -> dict:
         ValueError: If tool_name is not in TOOL_REGISTRY.
         requests.HTTPError: If the API returns a non-2xx status.
     """
-    cls = TOOL_REGISTRY.get(tool_name)
-    if cls is None:
-        raise ValueError(
-            f"Unknown tool: {tool_name!r}. Available tools: {sorted(TOOL_REGISTRY)}"
+    command = _create_command(tool_name, tool_input)
+    if shape is None:
+        response = command.execute()
+        response.raise_for_status()
+        return response.json()
+    with command.request(
+        **{**command.get_request_kwargs(), "stream": True}
+    ) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        body = io.TextIOWrapper(response.raw, encoding=response.encoding or "utf-8")
+        return shape_result(body, shape, is_file=tool_name in _FILE_RESULT_TOOLS)
+
+
+class ToolCallResult(NamedTuple):
+    """The outcome of one tool call executed by execute_tool_calls()."""
+
+    tool_name: str
+    result: Optional[dict] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _execute_tool_call_safely(call, shapes: dict) -> ToolCallResult:
+    tool_name, tool_input = call
+    try:
+        result = execute_tool_call(tool_name, tool_input, shape=shapes.get(tool_name))
+    except Exception as e:
+        return ToolCallResult(tool_name, error=e)
+    return ToolCallResult(tool_name, result=result)
+
+
+def execute_tool_calls(
+    calls: list[tuple[str, dict]],
+    max_workers: int = DEFAULT_POOL_SIZE,
+    shapes: Optional[dict[str, ResultShape]] = None,
+) -> list[ToolCallResult]:
+    """Execute several tool calls concurrently and return their results in order.
+
+    LLMs often request several tools in one turn; the calls are executed by at
+    most max_workers threads sharing the keep-alive connection pool of the
+    process (DBT_CLOUD_POOL_SIZE connections, 10 by default), so the turn takes
+    about as long as its slowest call.
+
+    A failing call does not stop the others: its exception (e.g. an unknown
+    tool, invalid arguments or a requests.HTTPError) is returned in the error
+    field of its result instead of being raised.
+
+    Args:
+        calls: List of (tool_name, tool_input) pairs, as for execute_tool_call().
+        max_workers: Maximum number of calls executed at the same time.
+        shapes: Optional ResultShape per tool name (see execute_tool_call).
+
+    Returns:
+        One ToolCallResult per call, in the order of calls.
+    """
+    if not calls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        return list(
+            executor.map(
+                functools.partial(_execute_tool_call_safely, shapes=shapes or {}),
+                calls,
+            )
         )
 
-    kwargs = dict(tool_input)
-    kwargs.setdefault("api_token", os.environ.get("DBT_CLOUD_API_TOKEN", ""))
-    kwargs.setdefault(
-        "dbt_cloud_host",
-        os.environ.get("DBT_CLOUD_HOST", "https://cloud.getdbt.com"),
-    )
 
-    command = cls(**kwargs)
-    response = command.execute()
+async def async_execute_tool_call(
+    tool_name: str, tool_input: dict, shape: Optional[ResultShape] = None
+) -> dict:
+    """Execute a tool call without blocking the event loop.
+
+    The async counterpart of execute_tool_call(). Requests are sent through an
+    httpx client shared by all tool calls in the running event loop, so many
+    concurrent agent sessions can be served from one loop without threads.
+    Requires the ``async`` extra (``pip install 'dbt-cloud-cli[async]'``).
+
+    Args:
+        tool_name: One of the keys in TOOL_REGISTRY (e.g. ``"job_run"``).
+        tool_input: Dict of arguments for the command (excluding api_token etc.).
+        shape: Optional limits for the size of the result. Unlike with
+            execute_tool_call, the response body is read before it is shaped.
+
+    Returns:
+        The parsed JSON response body from the dbt Cloud API.
+
+    Raises:
+        ValueError: If tool_name is not in TOOL_REGISTRY.
+        httpx.HTTPStatusError: If the API returns a non-2xx status.
+    """
+    command = _create_command(tool_name, tool_input)
+    response = await command.aexecute()
     response.raise_for_status()
-    return response.json()
+    if shape is None:
+        return json_to_dict(response.content)
+    return shape_result(
+        io.StringIO(response.text), shape, is_file=tool_name in _FILE_RESULT_TOOLS
+    )
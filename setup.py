@@ -25,6 +25,9 @@ setup(
         "test": ["pytest", "pytest-cov", "pytest-datadir", "requests-mock"],
         "lint": ["black"],
         "demo": ["inquirer", "art"],
+        "zstd": ["zstandard"],
+        "async": ["httpx"],
+        "orjson": ["orjson"],
     },
     scripts=[],
     entry_points={"console_scripts": ["dbt-cloud = dbt_cloud.cli:dbt_cloud"]},
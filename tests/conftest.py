@@ -39,6 +39,15 @@ JOB_ID = 43167
 RUN_ID = 36053848
 
 
+@pytest.fixture(autouse=True)
+def artifact_cache_dir(tmp_path, monkeypatch):
+    """Keeps the caches of each test in its own temporary directory."""
+    cache_dir = tmp_path / "artifact-cache"
+    monkeypatch.setenv("DBT_CLOUD_CACHE_DIR", str(cache_dir))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return cache_dir
+
+
 @pytest.fixture(scope="session")
 def account_id():
     return int(os.environ.get("DBT_CLOUD_ACCOUNT_ID", ACCOUNT_ID))
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+from dbt_cloud.command import DbtCloudJobRunCommand, DbtCloudRunGetCommand
+from dbt_cloud.command.command import close_async_client, get_async_client
+from dbt_cloud.ratelimit import configure_rate_limiter
+from dbt_cloud.tools import ResultShape, async_execute_tool_call
+from .conftest import COMMAND_TEST_CASES
+
+httpx = pytest.importorskip("httpx")
+
+
+def _run(coroutine_function, handler):
+    """Runs coroutine_function() with all async requests sent to handler.
+
+    Returns the result and the mocked asyncio.sleep.
+    """
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        try:
+            with patch(
+                "dbt_cloud.command.command.get_async_client", return_value=client
+            ):
+                return await coroutine_function()
+        finally:
+            await client.aclose()
+
+    with patch("dbt_cloud.command.command.asyncio.sleep", new=AsyncMock()) as sleep:
+        result = asyncio.run(main())
+    return result, sleep, requests
+
+
+@pytest.mark.parametrize(
+    "test_case_name,command,response,http_method", COMMAND_TEST_CASES
+)
+def test_aexecute(test_case_name, command, response, http_method):
+    def handler(request):
+        assert request.method == http_method.upper()
+        assert str(request.url.copy_with(query=None)) == command.api_url
+        assert request.headers["Authorization"] == f"Token {command.api_token}"
+        return httpx.Response(200, json=response)
+
+    actual_response, _, _ = _run(command.aexecute, handler)
+    assert actual_response.json() == response
+
+
+def test_aexecute_sends_same_request_as_execute():
+    command = DbtCloudJobRunCommand(
+        api_token="foo", account_id=123, job_id=1, cause="Async test"
+    )
+    _, _, requests = _run(
+        command.aexecute, lambda request: httpx.Response(200, json={})
+    )
+    assert json.loads(requests[0].content) == command.get_payload()
+
+
+def test_arequest_leaves_out_params_and_headers_set_to_none():
+    command = DbtCloudRunGetCommand(api_token="foo", account_id=123, run_id=1)
+    _, _, requests = _run(
+        lambda: command.arequest(
+            "get",
+            url=command.api_url,
+            params={"include_related": None, "limit": 1},
+            headers={"x-dbt-continuation-token": None},
+        ),
+        lambda request: httpx.Response(200, json={}),
+    )
+    assert dict(requests[0].url.params) == {"limit": "1"}
+    assert "x-dbt-continuation-token" not in requests[0].headers
+
+
+def test_arequest_retries_transient_errors_honoring_retry_after():
+    command = DbtCloudRunGetCommand(
+        api_token="foo", account_id=123, run_id=1, max_retries=2
+    )
+    responses = iter(
+        [
+            httpx.Response(503, headers={"Retry-After": "7"}),
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"data": {"id": 1}}),
+        ]
+    )
+    response, sleep, requests = _run(command.aexecute, lambda request: next(responses))
+    assert response.status_code == 200
+    assert len(requests) == 3
+    assert [c.args[0] for c in sleep.call_args_list] == [7.0, 3.0]
+
+
+def test_arequest_does_not_retry_non_idempotent_post_on_connection_error():
+    command = DbtCloudJobRunCommand(
+        api_token="foo", account_id=123, job_id=1, max_retries=3
+    )
+
+    def handler(request):
+        raise httpx.ReadError("connection reset")
+
+    with pytest.raises(httpx.ReadError):
+        _run(command.aexecute, handler)
+
+
+def test_arequest_waits_for_rate_limiter():
+    command = DbtCloudRunGetCommand(api_token="foo", account_id=123, run_id=1)
+    limiter = configure_rate_limiter(rate=10)
+    try:
+        with patch.object(limiter, "reserve", return_value=0.25) as reserve:
+            _, sleep, _ = _run(
+                command.aexecute, lambda request: httpx.Response(200, json={})
+            )
+        assert reserve.call_count == 1
+        assert [c.args[0] for c in sleep.call_args_list] == [0.25]
+    finally:
+        configure_rate_limiter(rate=None)
+
+
+def test_get_async_client_is_shared_per_event_loop():
+    async def get_clients():
+        clients = [get_async_client(), get_async_client()]
+        await close_async_client()
+        return clients
+
+    first, second = asyncio.run(get_clients())
+    assert first is second
+    assert first.is_closed
+    other, _ = asyncio.run(get_clients())
+    assert other is not first
+
+
+def test_async_execute_tool_call(monkeypatch):
+    monkeypatch.setenv("DBT_CLOUD_API_TOKEN", "env-token")
+    body = {"status": {"code": 200}, "data": {"id": 99}}
+
+    def handler(request):
+        assert request.headers["Authorization"] == "Token env-token"
+        return httpx.Response(200, json=body)
+
+    result, _, _ = _run(
+        lambda: async_execute_tool_call("run_get", {"account_id": 1, "run_id": 99}),
+        handler,
+    )
+    assert result == body
+
+
+def test_async_execute_tool_call_raises_on_http_error():
+    with pytest.raises(httpx.HTTPStatusError):
+        _run(
+            lambda: async_execute_tool_call(
+                "run_get", {"account_id": 1, "run_id": 99, "api_token": "tok"}
+            ),
+            lambda request: httpx.Response(401, json={}),
+        )
+
+
+def test_async_execute_tool_call_applies_shape():
+    body = {"data": [{"id": i, "logs": "x" * 100} for i in range(5)], "extra": {}}
+    result, _, _ = _run(
+        lambda: async_execute_tool_call(
+            "run_list",
+            {"account_id": 1, "api_token": "tok"},
+            shape=ResultShape(fields=["id"], max_items=2),
+        ),
+        lambda request: httpx.Response(200, json=body),
+    )
+    assert result == {
+        "data": [{"id": 0}, {"id": 1}],
+        "truncated": {"reason": "max_items", "returned_items": 2},
+        "extra": {},
+    }
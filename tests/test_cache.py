@@ -0,0 +1,56 @@
+import os
+import pytest
+from dbt_cloud.cache import ArtifactCache, get_artifact_cache
+
+
+def _put(cache, key, content):
+    with cache.writer(key) as f:
+        f.write(content)
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_cache_get_returns_written_content(tmp_path):
+    cache = ArtifactCache(str(tmp_path))
+    key = cache.make_key("cloud.getdbt.com", 1, 2, None, "manifest.json")
+    assert cache.get(key) is None
+    _put(cache, key, b"manifest")
+    assert _read(cache.get(key)) == b"manifest"
+
+
+def test_cache_stores_identical_content_once(tmp_path):
+    cache = ArtifactCache(str(tmp_path))
+    _put(cache, "a", b"same")
+    _put(cache, "b", b"same")
+    assert cache.get("a") == cache.get("b")
+    assert len(os.listdir(cache.objects_dir)) == 1
+
+
+def test_cache_discards_content_on_error(tmp_path):
+    cache = ArtifactCache(str(tmp_path))
+    with pytest.raises(RuntimeError):
+        with cache.writer("a") as f:
+            f.write(b"partial")
+            raise RuntimeError()
+    assert cache.get("a") is None
+    assert os.listdir(cache.objects_dir) == []
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ArtifactCache(str(tmp_path), max_size=10)
+    _put(cache, "a", b"aaaa")
+    _put(cache, "b", b"bbbb")
+    os.utime(cache.get("a"), (1, 1))
+    os.utime(cache.get("b"), (2, 2))
+    _put(cache, "c", b"cccc")
+    assert cache.get("a") is None
+    assert _read(cache.get("b")) == b"bbbb"
+    assert _read(cache.get("c")) == b"cccc"
+
+
+def test_get_artifact_cache_is_disabled_by_zero_max_size(monkeypatch):
+    monkeypatch.setenv("DBT_CLOUD_CACHE_MAX_SIZE", "0")
+    assert get_artifact_cache() is None
@@ -0,0 +1,203 @@
+import gzip
+import os
+import pickle
+import shutil
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from dbt_cloud.demo.catalog import (
+    Catalog,
+    CatalogExploreCommand,
+    CompactNode,
+    NodeType,
+    get_snapshot_path,
+    load_catalog_snapshot,
+    load_catalog_streaming,
+    save_catalog_snapshot,
+    tokenize,
+)
+
+CATALOG_PATH = Path(__file__).parent / "data" / "catalog.json"
+
+
+class Exploit:
+    def __reduce__(self):
+        return os.system, ("true",)
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    shutil.copyfile(CATALOG_PATH, path)
+    return path
+
+
+def test_get_catalog_parses_catalog_once(catalog_file):
+    command = CatalogExploreCommand(file=catalog_file, no_snapshot=True)
+    with patch.object(
+        Catalog, "model_validate_json", wraps=Catalog.model_validate_json
+    ) as model_validate_json:
+        catalog = command.get_catalog()
+        assert command.get_catalog() is catalog
+    assert model_validate_json.call_count == 1
+    assert not get_snapshot_path(catalog_file).exists()
+
+
+def test_get_catalog_reuses_snapshot(catalog_file):
+    catalog = CatalogExploreCommand(file=catalog_file).get_catalog()
+    assert get_snapshot_path(catalog_file).exists()
+    with patch.object(Catalog, "model_validate_json") as model_validate_json:
+        assert CatalogExploreCommand(file=catalog_file).get_catalog() == catalog
+    model_validate_json.assert_not_called()
+
+
+def test_snapshot_is_invalidated_by_catalog_changes(catalog_file):
+    catalog = CatalogExploreCommand(file=catalog_file).get_catalog()
+    assert load_catalog_snapshot(catalog_file) == catalog
+    catalog_file.write_text(catalog_file.read_text() + "\n")
+    assert load_catalog_snapshot(catalog_file) is None
+
+
+def test_unreadable_snapshot_is_ignored(catalog_file):
+    snapshot_path = get_snapshot_path(catalog_file)
+    snapshot_path.parent.mkdir(parents=True)
+    snapshot_path.write_bytes(b"not a pickle")
+    assert load_catalog_snapshot(catalog_file) is None
+    catalog = CatalogExploreCommand(file=catalog_file).get_catalog()
+    assert len(catalog.nodes) == 3
+    assert load_catalog_snapshot(catalog_file) == catalog
+
+
+def test_save_snapshot_leaves_no_temporary_files(catalog_file):
+    catalog = Catalog.model_validate_json(catalog_file.read_text())
+    save_catalog_snapshot(catalog_file, catalog)
+    assert not Path(f"{catalog_file}.snapshot").exists()
+    snapshot_path = get_snapshot_path(catalog_file)
+    assert os.listdir(snapshot_path.parent) == [snapshot_path.name]
+
+
+def test_snapshot_next_to_catalog_is_not_loaded(catalog_file):
+    with open(f"{catalog_file}.snapshot", "wb") as f:
+        pickle.dump(Exploit(), f)
+    with patch("os.system") as system:
+        CatalogExploreCommand(file=catalog_file).get_catalog()
+    system.assert_not_called()
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX file permissions")
+def test_snapshot_writable_by_others_is_ignored(catalog_file):
+    catalog = CatalogExploreCommand(file=catalog_file).get_catalog()
+    snapshot_path = get_snapshot_path(catalog_file)
+    assert load_catalog_snapshot(catalog_file) == catalog
+    os.chmod(snapshot_path, 0o666)
+    assert load_catalog_snapshot(catalog_file) is None
+
+
+def test_catalog_indexes_nodes_by_database_and_schema():
+    catalog = Catalog.model_validate_json(CATALOG_PATH.read_text())
+    assert catalog.get_databases(NodeType.NODE) == ["analytics"]
+    assert catalog.get_schemas(NodeType.NODE, "analytics") == [
+        "jaffle_shop",
+        "staging",
+    ]
+    assert [
+        node.name
+        for node in catalog.get_nodes(NodeType.NODE, "analytics", "jaffle_shop")
+    ] == ["customers", "orders"]
+    assert catalog.get_databases(NodeType.SOURCE) == ["raw"]
+
+
+def test_catalog_index_survives_snapshot(catalog_file):
+    CatalogExploreCommand(file=catalog_file).get_catalog()
+    catalog = load_catalog_snapshot(catalog_file)
+    assert catalog.get_schemas(NodeType.SOURCE, "raw") == ["jaffle_shop"]
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return Catalog.model_validate_json(CATALOG_PATH.read_text())
+
+
+@pytest.mark.parametrize(
+    "text, tokens",
+    [
+        ("lifetime_value", ["lifetime", "value"]),
+        ("Primary key of a Customer", ["primary", "key", "of", "a", "customer"]),
+        (None, []),
+    ],
+)
+def test_tokenize(text, tokens):
+    assert tokenize(text) == tokens
+
+
+def test_search_ranks_node_names_above_columns(catalog):
+    results = catalog.search("customers")
+    assert [result.node.name for result in results][:1] == ["customers"]
+
+
+def test_search_matches_column_names_and_comments(catalog):
+    results = catalog.search("payment method")
+    assert [result.node.name for result in results] == ["stg_payments"]
+    assert results[0].columns == ["payment_id", "payment_method"]
+    assert [result.node.name for result in catalog.search("bank transfer")] == [
+        "stg_payments"
+    ]
+
+
+def test_search_matches_prefixes_and_typos(catalog):
+    assert catalog.search("lifetim")[0].node.name == "customers"
+    assert catalog.search("lifetmie")[0].node.name == "customers"
+
+
+def test_search_includes_sources(catalog):
+    assert catalog.search("raw_orders")[0].node.unique_id == (
+        "source.jaffle_shop.raw.raw_orders"
+    )
+
+
+def test_search_requires_every_term(catalog):
+    assert catalog.search("orders zzzzzz") == []
+    assert catalog.search("") == []
+
+
+def test_search_limits_results(catalog):
+    assert len(catalog.search("id", limit=2)) == 2
+
+
+def test_load_catalog_streaming_matches_load_catalog(catalog):
+    compact_catalog = load_catalog_streaming(CATALOG_PATH)
+    assert compact_catalog.metadata == catalog.metadata
+    for field in ("nodes", "sources"):
+        nodes = getattr(catalog, field)
+        compact_nodes = getattr(compact_catalog, field)
+        assert list(compact_nodes) == list(nodes)
+        for unique_id, node in nodes.items():
+            compact_node = compact_nodes[unique_id]
+            assert str(compact_node) == str(node)
+            assert compact_node.metadata == node.metadata
+            assert [str(column) for column in compact_node.columns.values()] == [
+                str(column) for column in node.columns.values()
+            ]
+            assert compact_node.stats == node.stats
+    assert compact_catalog.get_schemas(NodeType.NODE, "analytics") == [
+        "jaffle_shop",
+        "staging",
+    ]
+    assert compact_catalog.search("lifetime")[0].node.name == "customers"
+
+
+def test_load_catalog_streaming_reads_compressed_catalog(tmp_path):
+    path = tmp_path / "catalog.json.gz"
+    path.write_bytes(gzip.compress(CATALOG_PATH.read_bytes()))
+    assert len(load_catalog_streaming(path).nodes) == 3
+
+
+def test_low_memory_snapshot_is_kept_apart(catalog_file):
+    CatalogExploreCommand(file=catalog_file).get_catalog()
+    assert load_catalog_snapshot(catalog_file, low_memory=True) is None
+    catalog = CatalogExploreCommand(file=catalog_file, low_memory=True).get_catalog()
+    assert isinstance(catalog.nodes["model.jaffle_shop.orders"], CompactNode)
+    snapshot = load_catalog_snapshot(catalog_file, low_memory=True)
+    assert snapshot.nodes["model.jaffle_shop.orders"].columns == (
+        catalog.nodes["model.jaffle_shop.orders"].columns
+    )
@@ -1,12 +1,17 @@
 """Tests for CLI-level behaviour: output routing, error handling, exit codes."""
 
+import click
+import gzip
 import json
 import pytest
+import subprocess
+import sys
 from unittest.mock import patch, MagicMock, call
 from click.testing import CliRunner
 from requests import HTTPError
 from requests.models import Response
 from dbt_cloud.cli import dbt_cloud as cli
+from dbt_cloud.serde import set_compact_output
 
 
 @pytest.fixture
@@ -28,6 +33,15 @@ def _mock_response(status_code, body):
     return resp
 
 
+def _patch_session(**responses):
+    """Patch the shared HTTP session to return a response per HTTP method."""
+
+    def request(method, url, **kwargs):
+        return responses[method.lower()]
+
+    return patch("requests.Session.request", side_effect=request)
+
+
 def _extract_json(output):
     """Parse the first complete JSON object from mixed output."""
     decoder = json.JSONDecoder()
@@ -51,7 +65,7 @@ ERROR_BODY = {
 class TestHttpErrorHandling:
     def test_exit_code_0_on_success(self, runner):
         mock_resp = _mock_response(200, SUCCESS_BODY)
-        with patch("dbt_cloud.command.job.get.requests.get", return_value=mock_resp):
+        with patch("requests.Session.request", return_value=mock_resp):
             result = runner.invoke(
                 cli,
                 [
@@ -69,7 +83,7 @@ class TestHttpErrorHandling:
 
     def test_exit_code_1_on_http_error(self, runner):
         mock_resp = _mock_response(401, ERROR_BODY)
-        with patch("dbt_cloud.command.job.get.requests.get", return_value=mock_resp):
+        with patch("requests.Session.request", return_value=mock_resp):
             result = runner.invoke(
                 cli,
                 [
@@ -87,7 +101,7 @@ class TestHttpErrorHandling:
 
     def test_json_body_present_on_error(self, runner):
         mock_resp = _mock_response(401, ERROR_BODY)
-        with patch("dbt_cloud.command.job.get.requests.get", return_value=mock_resp):
+        with patch("requests.Session.request", return_value=mock_resp):
             result = runner.invoke(
                 cli,
                 [
@@ -106,7 +120,7 @@ class TestHttpErrorHandling:
 
     def test_no_traceback_on_http_error(self, runner):
         mock_resp = _mock_response(500, ERROR_BODY)
-        with patch("dbt_cloud.command.job.get.requests.get", return_value=mock_resp):
+        with patch("requests.Session.request", return_value=mock_resp):
             result = runner.invoke(
                 cli,
                 [
@@ -130,7 +144,7 @@ class TestStatusMessagesRouteToStderr:
     def test_error_message_uses_err_true(self, runner):
         mock_resp = _mock_response(401, ERROR_BODY)
         with (
-            patch("dbt_cloud.command.job.get.requests.get", return_value=mock_resp),
+            patch("requests.Session.request", return_value=mock_resp),
             patch("dbt_cloud.cli.click.echo") as mock_echo,
         ):
             runner.invoke(
@@ -158,10 +172,7 @@ class TestStatusMessagesRouteToStderr:
         delete_resp = _mock_response(200, delete_body)
 
         with (
-            patch("dbt_cloud.command.job.list.requests.get", return_value=list_resp),
-            patch(
-                "dbt_cloud.command.job.delete.requests.delete", return_value=delete_resp
-            ),
+            _patch_session(get=list_resp, delete=delete_resp),
             patch("dbt_cloud.cli.click.echo") as mock_echo,
         ):
             runner.invoke(
@@ -195,8 +206,7 @@ class TestStatusMessagesRouteToStderr:
         success_resp = _mock_response(200, success_body)
 
         with (
-            patch("dbt_cloud.command.job.run.requests.post", return_value=trigger_resp),
-            patch("dbt_cloud.command.run.get.requests.get", return_value=success_resp),
+            _patch_session(post=trigger_resp, get=success_resp),
             patch("dbt_cloud.cli.click.echo") as mock_echo,
         ):
             runner.invoke(
@@ -317,7 +327,7 @@ class TestReadonlyMode:
 
     def test_readonly_allows_job_get(self, runner):
         mock_resp = _mock_response(200, SUCCESS_BODY)
-        with patch("dbt_cloud.command.job.get.requests.get", return_value=mock_resp):
+        with patch("requests.Session.request", return_value=mock_resp):
             result = self._invoke_readonly(
                 runner,
                 [
@@ -336,7 +346,7 @@ class TestReadonlyMode:
     def test_readonly_allows_job_list(self, runner):
         list_body = {"status": {"code": 200}, "data": []}
         mock_resp = _mock_response(200, list_body)
-        with patch("dbt_cloud.command.job.list.requests.get", return_value=mock_resp):
+        with patch("requests.Session.request", return_value=mock_resp):
             result = self._invoke_readonly(
                 runner,
                 ["job", "list", "--api-token", "tok", "--account-id", "1"],
@@ -346,7 +356,7 @@ class TestReadonlyMode:
     def test_readonly_false_allows_mutating(self, runner):
         """DBT_CLOUD_READONLY=false must not block commands."""
         mock_resp = _mock_response(200, SUCCESS_BODY)
-        with patch("dbt_cloud.command.job.get.requests.get", return_value=mock_resp):
+        with patch("requests.Session.request", return_value=mock_resp):
             result = runner.invoke(
                 cli,
                 [
@@ -362,3 +372,427 @@ class TestReadonlyMode:
                 env={"DBT_CLOUD_READONLY": "false"},
             )
         assert result.exit_code == 0
+
+
+class TestRunListPaginate:
+    RUNS = [{"id": run_id} for run_id in range(5)]
+
+    def _page(self, method, url, params, **kwargs):
+        # The API may return fewer items than requested; pages follow its count
+        offset = params["offset"]
+        data = self.RUNS[offset : offset + 2]
+        return _mock_response(
+            200,
+            {
+                "status": {"code": 200},
+                "data": data,
+                "extra": {
+                    "pagination": {"count": len(data), "total_count": len(self.RUNS)}
+                },
+            },
+        )
+
+    def _invoke(self, runner, *args):
+        with patch("requests.Session.request", side_effect=self._page):
+            return runner.invoke(
+                cli,
+                ["run", "list", "--api-token", "tok", "--account-id", "1", *args],
+            )
+
+    def test_paginate_json_merges_pages(self, runner):
+        result = self._invoke(runner, "--paginate", "--concurrency", "2")
+        assert result.exit_code == 0, result.output
+        response = json.loads(result.output)
+        assert response["data"] == self.RUNS
+        assert response["extra"]["pagination"]["count"] == len(self.RUNS)
+
+    def test_paginate_ndjson_prints_one_run_per_line(self, runner):
+        result = self._invoke(runner, "--paginate", "--output", "ndjson")
+        assert result.exit_code == 0, result.output
+        lines = result.output.splitlines()
+        assert [json.loads(line) for line in lines] == self.RUNS
+
+    def test_paginate_without_pagination_info(self, runner):
+        body = {"data": self.RUNS, "extra": {"filters": {}}}
+        with _patch_session(get=_mock_response(200, body)):
+            result = runner.invoke(
+                cli,
+                [
+                    *("project", "list", "--api-token", "tok"),
+                    *("--account-id", "1", "--paginate"),
+                ],
+            )
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output) == body
+
+
+class TestJobRunMany:
+    def _request(self, method, url, **kwargs):
+        if method == "POST":
+            job_id = int(url.rstrip("/").split("/")[-2])
+            if job_id == 3:
+                return _mock_response(500, ERROR_BODY)
+            return _mock_response(
+                200,
+                {"data": {"id": job_id * 10, "job_definition_id": job_id, "status": 1}},
+            )
+        runs = [
+            {"id": 20, "job_definition_id": 2, "status": 10},
+            {"id": 10, "job_definition_id": 1, "status": 10},
+        ]
+        return _mock_response(200, {"data": runs})
+
+    def _invoke(self, runner, *args, input=None):
+        with patch("requests.Session.request", side_effect=self._request):
+            return runner.invoke(
+                cli,
+                ["job", "run-many", "--api-token", "tok", "--account-id", "1", *args],
+                input=input,
+            )
+
+    def test_triggers_and_waits_for_all_jobs(self, runner):
+        result = self._invoke(runner, "--job-ids", "[1, 2]", "--wait")
+        assert result.exit_code == 0, result.output
+        runs = json.loads(result.stdout)
+        assert [(run["id"], run["status"]) for run in runs] == [(10, 10), (20, 10)]
+        assert "Job 2 run 20: SUCCESS" in result.output
+
+    def test_reads_job_ids_from_file_and_continues_past_failures(self, runner):
+        result = self._invoke(runner, "--job-ids-file", "-", input="1\n3\n")
+        assert result.exit_code == 1
+        assert "Job 3 could not be triggered" in result.output
+        assert "Job 1 run 10: triggered" in result.output
+
+    def test_reports_polling_errors_and_writes_runs_seen(self, runner):
+        def request(method, url, **kwargs):
+            if method == "GET":
+                return _mock_response(503, ERROR_BODY)
+            return self._request(method, url, **kwargs)
+
+        with patch("requests.Session.request", side_effect=request):
+            result = runner.invoke(
+                cli,
+                [
+                    *("job", "run-many", "--api-token", "tok", "--account-id", "1"),
+                    *("--job-ids", "[1, 2]", "--wait"),
+                ],
+            )
+        assert result.exit_code == 1
+        assert "Traceback" not in result.output
+        assert "503 Client Error" in result.stderr
+        runs = json.loads(result.stdout)
+        assert [(run["id"], run["status"]) for run in runs] == [(10, 1), (20, 1)]
+
+    def test_rejects_invalid_job_ids_file(self, runner):
+        result = self._invoke(runner, "--job-ids-file", "-", input="1\nabc\n")
+        assert result.exit_code == 2
+        assert "'abc' is not a job ID" in result.output
+
+    def test_reports_runs_that_are_not_found(self, runner):
+        def request(method, url, **kwargs):
+            if method == "GET" and url.rstrip("/").endswith("/runs"):
+                runs = [{"id": 10, "job_definition_id": 1, "status": 10}]
+                return _mock_response(200, {"data": runs})
+            if method == "GET":
+                return _mock_response(404, ERROR_BODY)
+            return self._request(method, url, **kwargs)
+
+        with patch("requests.Session.request", side_effect=request):
+            result = runner.invoke(
+                cli,
+                [
+                    *("job", "run-many", "--api-token", "tok", "--account-id", "1"),
+                    *("--job-ids", "[1, 2]", "--wait"),
+                ],
+            )
+        assert result.exit_code == 1
+        assert "Job 2 run 20: Run not found." in result.stderr
+        runs = json.loads(result.stdout)
+        assert [run.get("error") for run in runs] == [None, "Run not found."]
+
+    def test_rejects_zero_poll_interval(self, runner):
+        result = self._invoke(runner, "--job-ids", "[1]", "--wait", "--poll-min", "0")
+        assert result.exit_code == 2
+        assert "Invalid value for '--poll-min'" in result.output
+
+    def test_accepts_single_job_id(self, runner):
+        result = self._invoke(runner, "--job-ids", "1")
+        assert result.exit_code == 0, result.output
+        assert [run["id"] for run in json.loads(result.stdout)] == [10]
+
+    def test_rejects_invalid_job_ids(self, runner):
+        result = self._invoke(runner, "--job-ids", "[1, 'abc']")
+        assert result.exit_code == 2
+        assert "Invalid value for '--job-ids'" in result.output
+        assert "'abc' is not a job ID" in result.output
+
+
+class TestJobDeleteAll:
+    def _request(self, method, url, params=None, **kwargs):
+        if method == "GET":
+            jobs = [{"id": 1}, {"id": 2}, {"id": 3}]
+            return _mock_response(200, {"data": jobs[: params.get("limit")]})
+        job_id = int(url.rstrip("/").split("/")[-1])
+        if job_id == 2:
+            return _mock_response(404, ERROR_BODY)
+        return _mock_response(200, {"status": {"code": 200}, "data": {"id": job_id}})
+
+    def test_continues_past_failures_and_reports_each_job(self, runner):
+        with patch("requests.Session.request", side_effect=self._request):
+            result = runner.invoke(
+                cli,
+                [
+                    "job",
+                    "delete-all",
+                    "--api-token",
+                    "tok",
+                    "--account-id",
+                    "1",
+                    "--keep-jobs",
+                    "[]",
+                    "--yes",
+                    "--concurrency",
+                    "3",
+                ],
+            )
+        assert result.exit_code == 1
+        results = sorted(json.loads(result.stdout), key=lambda r: r["job_id"])
+        assert [(r["job_id"], r["is_success"]) for r in results] == [
+            (1, True),
+            (2, False),
+            (3, True),
+        ]
+        assert results[1]["response"] == ERROR_BODY
+        assert "Job 2 could not be deleted" in result.stderr
+        assert "Job 3 was deleted." in result.stderr
+
+    def test_deletes_only_the_selected_page_with_limit(self, runner):
+        with patch(
+            "requests.Session.request", side_effect=self._request
+        ) as mock_request:
+            result = runner.invoke(
+                cli,
+                [
+                    "job",
+                    "delete-all",
+                    "--api-token",
+                    "tok",
+                    "--account-id",
+                    "1",
+                    "--keep-jobs",
+                    "[]",
+                    "--limit",
+                    "1",
+                    "--yes",
+                ],
+            )
+        assert result.exit_code == 0, result.output
+        methods = [c.args[0] for c in mock_request.call_args_list]
+        assert methods == ["GET", "DELETE"]
+        assert mock_request.call_args_list[0].kwargs["params"]["limit"] == 1
+        assert [r["job_id"] for r in json.loads(result.stdout)] == [1]
+
+
+class TestRunCancelAll:
+    RUNS = [{"id": run_id} for run_id in range(1, 6)]
+
+    def _request(self, method, url, params=None, **kwargs):
+        if method == "GET":
+            offset = params["offset"]
+            data = self.RUNS[offset : offset + 2]
+            pagination = {"count": len(data), "total_count": len(self.RUNS)}
+            return _mock_response(
+                200, {"data": data, "extra": {"pagination": pagination}}
+            )
+        run_id = int(url.rstrip("/").split("/")[-2])
+        return _mock_response(200, {"status": {"code": 200}, "data": {"id": run_id}})
+
+    def test_cancels_runs_from_all_pages(self, runner):
+        with patch("requests.Session.request", side_effect=self._request):
+            result = runner.invoke(
+                cli,
+                [
+                    "run",
+                    "cancel-all",
+                    "--api-token",
+                    "tok",
+                    "--account-id",
+                    "1",
+                    "--yes",
+                    "--output",
+                    "ndjson",
+                ],
+            )
+        assert result.exit_code == 0, result.output
+        results = [json.loads(line) for line in result.stdout.splitlines()]
+        assert sorted(r["run_id"] for r in results) == [1, 2, 3, 4, 5]
+        assert all(r["is_success"] for r in results)
+        assert "[5/5] Run" in result.stderr
+
+    def test_has_no_limit_and_offset_options(self, runner):
+        result = runner.invoke(cli, ["run", "cancel-all", "--help"])
+        assert result.exit_code == 0
+        assert "--status" in result.output
+        assert "--limit" not in result.output
+        assert "--offset" not in result.output
+
+
+class TestRunDownloadArtifacts:
+    BASE_URL = "https://cloud.getdbt.com/api/v2/accounts/1/runs/7/artifacts"
+    PATHS = ["manifest.json", "run/jaffle_shop/models/orders.sql", "run_results.json"]
+
+    def _invoke(self, runner, requests_mock, tmp_path, *args):
+        requests_mock.get(
+            self.BASE_URL, json={"status": {"code": 200}, "data": self.PATHS}
+        )
+        requests_mock.get(
+            "https://cloud.getdbt.com/api/v2/accounts/1/runs/7",
+            json={"data": {"id": 7, "status": 10}},
+        )
+        for path in self.PATHS:
+            requests_mock.get(f"{self.BASE_URL}/{path}", content=path.encode())
+        return runner.invoke(
+            cli,
+            [
+                "run",
+                "download-artifacts",
+                "--api-token",
+                "tok",
+                "--account-id",
+                "1",
+                "--run-id",
+                "7",
+                "--output-dir",
+                str(tmp_path),
+                *args,
+            ],
+        )
+
+    def test_downloads_all_artifacts_preserving_layout(
+        self, runner, requests_mock, tmp_path
+    ):
+        result = self._invoke(runner, requests_mock, tmp_path)
+        assert result.exit_code == 0, result.output
+        for path in self.PATHS:
+            assert (tmp_path / path).read_bytes() == path.encode()
+        results = json.loads(result.stdout)
+        assert [r["path"] for r in results] == self.PATHS
+        assert all(r["is_success"] for r in results)
+
+    def test_include_filters_paths(self, runner, requests_mock, tmp_path):
+        result = self._invoke(runner, requests_mock, tmp_path, "--include", "*.json")
+        assert result.exit_code == 0, result.output
+        assert [r["path"] for r in json.loads(result.stdout)] == [
+            "manifest.json",
+            "run_results.json",
+        ]
+        assert not (tmp_path / "run").exists()
+
+    def test_step_applies_to_listing_and_downloads(
+        self, runner, requests_mock, tmp_path
+    ):
+        result = self._invoke(
+            runner, requests_mock, tmp_path, "--step", "2", "--no-cache"
+        )
+        assert result.exit_code == 0, result.output
+        artifact_requests = [
+            request
+            for request in requests_mock.request_history
+            if request.path.startswith("/api/v2/accounts/1/runs/7/artifacts")
+        ]
+        assert len(artifact_requests) == 1 + len(self.PATHS)
+        assert all(request.qs["step"] == ["2"] for request in artifact_requests)
+
+    def test_exit_code_1_on_failed_listing(self, runner, requests_mock, tmp_path):
+        requests_mock.get(self.BASE_URL, status_code=404, json=ERROR_BODY)
+        result = runner.invoke(
+            cli,
+            [
+                *("run", "download-artifacts", "--api-token", "tok"),
+                *("--account-id", "1", "--run-id", "7"),
+                *("--output-dir", str(tmp_path)),
+            ],
+        )
+        assert result.exit_code == 1
+        assert "404 Client Error" in result.stderr
+        assert result.stdout == ""
+
+    def test_compress_writes_compressed_files(self, runner, requests_mock, tmp_path):
+        result = self._invoke(
+            runner, requests_mock, tmp_path, "--include", "*.json", "--compress", "gzip"
+        )
+        assert result.exit_code == 0, result.output
+        assert gzip.decompress((tmp_path / "manifest.json.gz").read_bytes()) == (
+            b"manifest.json"
+        )
+        assert not (tmp_path / "manifest.json").exists()
+
+    def test_exit_code_1_on_failed_download(self, runner, requests_mock, tmp_path):
+        requests_mock.get(f"{self.BASE_URL}/manifest.json", status_code=404)
+        requests_mock.get(
+            "https://cloud.getdbt.com/api/v2/accounts/1/runs/7",
+            json={"data": {"id": 7, "status": 10}},
+        )
+        requests_mock.get(
+            self.BASE_URL, json={"status": {"code": 200}, "data": self.PATHS}
+        )
+        result = runner.invoke(
+            cli,
+            [
+                "run",
+                "download-artifacts",
+                "--api-token",
+                "tok",
+                "--account-id",
+                "1",
+                "--run-id",
+                "7",
+                "--output-dir",
+                str(tmp_path),
+                "--include",
+                "manifest.json",
+            ],
+        )
+        assert result.exit_code == 1
+        assert not (tmp_path / "manifest.json").exists()
+        assert "manifest.json could not be downloaded" in result.stderr
+
+
+class TestLazySubcommands:
+    def test_import_does_not_load_commands(self):
+        code = (
+            "import sys, dbt_cloud.cli; "
+            "print(sorted(m for m in sys.modules if m.split('.')[0] in "
+            "('requests', 'pydantic') or m.startswith('dbt_cloud.command')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "[]"
+
+    @pytest.mark.parametrize(
+        "group", [group for group in cli.commands.values() if group.name != "demo"]
+    )
+    def test_lazy_subcommands_load(self, group):
+        for name in group.list_commands(None):
+            command = group.get_command(None, name)
+            assert isinstance(command, click.Command)
+            assert command.name == name
+
+
+class TestCompactOutput:
+    ARGS = ["job", "get", "--api-token", "tok", "--account-id", "1", "--job-id", "1"]
+
+    @pytest.fixture(autouse=True)
+    def reset_compact_output(self):
+        yield
+        set_compact_output(False)
+
+    def test_compact_flag_prints_json_on_one_line(self, runner):
+        with _patch_session(get=_mock_response(200, SUCCESS_BODY)):
+            indented = runner.invoke(cli, self.ARGS)
+            compact = runner.invoke(cli, ["--compact", *self.ARGS])
+        assert compact.exit_code == 0
+        assert compact.output.strip() == json.dumps(SUCCESS_BODY, separators=(",", ":"))
+        assert json.loads(indented.output) == SUCCESS_BODY
+        assert indented.output.count("\n") > 1
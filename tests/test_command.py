@@ -1,6 +1,34 @@
+import gzip
+import io
 import pytest
+import requests
 from typing import Optional
-from dbt_cloud.command.command import translate_click_options, DbtCloudCommand
+from unittest.mock import patch
+from dbt_cloud.command.command import (
+    translate_click_options,
+    DbtCloudCommand,
+    DEFAULT_POOL_SIZE,
+    MAX_BACKOFF,
+    JsonHTTPAdapter,
+    JsonResponse,
+    configure_session,
+    get_session,
+    parse_retry_after,
+)
+from dbt_cloud.command import (
+    DbtCloudAuditLogGetCommand,
+    DbtCloudConnectionListCommand,
+    DbtCloudEnvironmentListCommand,
+    DbtCloudJobListCommand,
+    DbtCloudJobRunCommand,
+    DbtCloudRunGetArtifactCommand,
+    DbtCloudProjectListCommand,
+    DbtCloudRunGetCommand,
+    DbtCloudRunListCommand,
+)
+from dbt_cloud.cache import get_artifact_cache
+from dbt_cloud.command.run.get_artifact import parse_content_range
+from dbt_cloud.exc import DbtCloudException, IncompleteDownloadError
 from .conftest import COMMAND_TEST_CASES
 
 
@@ -48,6 +76,8 @@ class PayloadCommand(DbtCloudCommand):
                 "api_token": "123",
                 "dbt_cloud_host": "https://cloud.getdbt.com",
                 "timeout": 30,
+                "max_retries": 0,
+                "retry_backoff": 1.0,
                 "id": 12345,
             },
         ),
@@ -61,6 +91,8 @@ class PayloadCommand(DbtCloudCommand):
                 "api_token": "123",
                 "dbt_cloud_host": "https://cloud.getdbt.com",
                 "timeout": 30,
+                "max_retries": 0,
+                "retry_backoff": 1.0,
             },
         ),
     ],
@@ -68,3 +100,416 @@ class PayloadCommand(DbtCloudCommand):
 def test_dbt_cloud_command_get_payload(kwargs, expected):
     command = PayloadCommand(**kwargs)
     assert command.get_payload(exclude=[], exclude_empty=True) == expected
+
+
+def test_get_session_is_shared():
+    assert get_session() is get_session()
+
+
+def test_configure_session_pool_size():
+    session = configure_session(pool_size=3)
+    try:
+        assert get_session() is session
+        assert session.get_adapter("https://cloud.getdbt.com")._pool_maxsize == 3
+    finally:
+        configure_session(pool_size=DEFAULT_POOL_SIZE)
+
+
+def test_session_decodes_responses_with_json_backend():
+    from urllib3 import HTTPResponse
+
+    raw = HTTPResponse(
+        body=io.BytesIO(b'{"data": {"id": 1}}'), status=200, preload_content=False
+    )
+    request = requests.Request("GET", "https://cloud.getdbt.com/api").prepare()
+    response = JsonHTTPAdapter().build_response(request, raw)
+    assert isinstance(response, JsonResponse)
+    with patch(
+        "dbt_cloud.command.command.json_to_dict", return_value={"decoded": True}
+    ) as json_to_dict:
+        assert response.json() == {"decoded": True}
+    json_to_dict.assert_called_once_with(b'{"data": {"id": 1}}')
+    assert response.json() == {"data": {"id": 1}}
+
+
+def test_json_response_raises_requests_json_decode_error():
+    response = JsonResponse()
+    response._content = b"<html>Bad gateway</html>"
+    with pytest.raises(requests.JSONDecodeError):
+        response.json()
+
+
+def _paginated_api(items):
+    def page(request, context):
+        offset = int(request.qs["offset"][0])
+        limit = int(request.qs["limit"][0])
+        data = items[offset : offset + limit]
+        return {
+            "data": data,
+            "extra": {"pagination": {"count": len(data), "total_count": len(items)}},
+        }
+
+    return page
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        DbtCloudRunListCommand(api_token="foo", account_id=123),
+        DbtCloudJobListCommand(api_token="foo", account_id=123),
+        DbtCloudProjectListCommand(api_token="foo", account_id=123),
+        DbtCloudEnvironmentListCommand(api_token="foo", account_id=123, project_id=1),
+        DbtCloudConnectionListCommand(api_token="foo", account_id=123, project_id=1),
+        DbtCloudAuditLogGetCommand(api_token="foo", account_id=123),
+    ],
+)
+def test_iter_pages_returns_pages_in_api_order(command, requests_mock):
+    items = [{"id": item_id} for item_id in range(250)]
+    requests_mock.get(command.api_url, json=_paginated_api(items))
+    pages = list(command.iter_pages(concurrency=3))
+    assert len(pages) == 3
+    assert list(command.iter_items(concurrency=2)) == items
+
+
+def test_iter_pages_requires_offset_and_limit():
+    command = DbtCloudRunGetCommand(api_token="foo", account_id=123, run_id=1)
+    with pytest.raises(DbtCloudException):
+        next(command.iter_pages())
+
+
+def test_request_retries_transient_errors_honoring_retry_after(requests_mock):
+    command = DbtCloudRunGetCommand(
+        api_token="foo", account_id=123, run_id=1, max_retries=2
+    )
+    requests_mock.get(
+        command.api_url,
+        [
+            {"status_code": 503, "headers": {"Retry-After": "7"}},
+            {"status_code": 429, "headers": {"Retry-After": "3"}},
+            {"status_code": 200, "json": {"data": {"id": 1}}},
+        ],
+    )
+    with patch("dbt_cloud.command.command.time.sleep") as sleep:
+        response = command.execute()
+    assert response.status_code == 200
+    assert [c.args[0] for c in sleep.call_args_list] == [7.0, 3.0]
+
+
+def test_request_caps_retry_after(requests_mock):
+    command = DbtCloudRunGetCommand(
+        api_token="foo", account_id=123, run_id=1, max_retries=1
+    )
+    requests_mock.get(
+        command.api_url,
+        [
+            {"status_code": 429, "headers": {"Retry-After": "3600"}},
+            {"status_code": 200, "json": {"data": {"id": 1}}},
+        ],
+    )
+    with patch("dbt_cloud.command.command.time.sleep") as sleep:
+        response = command.execute()
+    assert response.status_code == 200
+    sleep.assert_called_once_with(MAX_BACKOFF)
+
+
+def test_request_gives_up_after_max_retries(requests_mock):
+    command = DbtCloudRunGetCommand(
+        api_token="foo", account_id=123, run_id=1, max_retries=2, retry_backoff=0.5
+    )
+    requests_mock.get(command.api_url, status_code=502)
+    with patch("dbt_cloud.command.command.time.sleep") as sleep:
+        response = command.execute()
+    assert response.status_code == 502
+    assert requests_mock.call_count == 3
+    assert sleep.call_args_list[0].args[0] <= 0.5
+    assert sleep.call_args_list[1].args[0] <= 1.0
+
+
+def test_request_does_not_retry_non_idempotent_post_on_server_error(requests_mock):
+    command = DbtCloudJobRunCommand(
+        api_token="foo", account_id=123, job_id=1, max_retries=3
+    )
+    requests_mock.post(command.api_url, status_code=503)
+    with patch("dbt_cloud.command.command.time.sleep"):
+        response = command.execute()
+    assert response.status_code == 503
+    assert requests_mock.call_count == 1
+
+
+def test_request_retries_non_idempotent_post_when_rate_limited(requests_mock):
+    command = DbtCloudJobRunCommand(
+        api_token="foo", account_id=123, job_id=1, max_retries=3
+    )
+    requests_mock.post(
+        command.api_url,
+        [{"status_code": 429}, {"status_code": 200, "json": {"data": {"id": 2}}}],
+    )
+    with patch("dbt_cloud.command.command.time.sleep"):
+        response = command.execute()
+    assert response.status_code == 200
+    assert requests_mock.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(None, None), ("", None), ("12", 12.0), ("-1", 0.0), ("soon", None)],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+@pytest.mark.run
+def test_get_artifact_download_streams_chunks(requests_mock, tmp_path):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    content = b"x" * 2500
+    requests_mock.get(
+        command.api_url, content=content, headers={"Content-Length": "2500"}
+    )
+    progress = []
+    with open(tmp_path / "manifest.json", "wb") as f:
+        command.download(
+            f,
+            chunk_size=1000,
+            on_progress=lambda *args: progress.append(args),
+            use_cache=False,
+        )
+    assert (tmp_path / "manifest.json").read_bytes() == content
+    assert progress == [(1000, 2500), (2000, 2500), (2500, 2500)]
+    assert requests_mock.last_request.stream
+
+
+@pytest.mark.run
+@pytest.mark.parametrize(
+    "status, is_cached",
+    [(10, True), (20, True), (30, True), (3, False)],
+)
+def test_get_artifact_download_caches_artifacts_of_completed_runs(
+    requests_mock, tmp_path, status, is_cached
+):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    run_mock = requests_mock.get(
+        "https://cloud.getdbt.com/api/v2/accounts/123/runs/1",
+        json={"data": {"id": 1, "status": status}},
+    )
+    artifact_mock = requests_mock.get(command.api_url, content=b"{}")
+    for i in range(2):
+        with open(tmp_path / f"manifest_{i}.json", "wb") as f:
+            command.download(f)
+        assert (tmp_path / f"manifest_{i}.json").read_bytes() == b"{}"
+    assert artifact_mock.call_count == (1 if is_cached else 2)
+    assert run_mock.call_count == (1 if is_cached else 2)
+
+
+@pytest.mark.run
+def test_get_artifact_download_does_not_cache_failed_downloads(requests_mock, tmp_path):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    requests_mock.get(
+        "https://cloud.getdbt.com/api/v2/accounts/123/runs/1",
+        json={"data": {"id": 1, "status": 10}},
+    )
+    requests_mock.get(command.api_url, status_code=404)
+    with pytest.raises(requests.HTTPError):
+        command.download(io.BytesIO())
+    assert get_artifact_cache().get(command.cache_key) is None
+
+
+ARTIFACT_CONTENT = b"0123456789"
+ARTIFACT_ETAG = '"v1"'
+
+
+def _range_response(request, context):
+    range_header = request.headers.get("Range")
+    start = int(range_header[len("bytes=") : -1]) if range_header else 0
+    if request.headers.get("If-Range", ARTIFACT_ETAG) != ARTIFACT_ETAG:
+        start = 0
+    context.headers["ETag"] = ARTIFACT_ETAG
+    if start:
+        context.status_code = 206
+        context.headers["Content-Range"] = (
+            f"bytes {start}-{len(ARTIFACT_CONTENT) - 1}/{len(ARTIFACT_CONTENT)}"
+        )
+    context.headers["Content-Length"] = str(len(ARTIFACT_CONTENT) - start)
+    return ARTIFACT_CONTENT[start:]
+
+
+@pytest.mark.run
+def test_get_artifact_download_to_path_resumes_partial_file(requests_mock, tmp_path):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    path = tmp_path / "manifest.json"
+    _interrupt_download(command, requests_mock, path)
+    artifact_mock = requests_mock.get(command.api_url, content=_range_response)
+    command.download_to_path(str(path), use_cache=False)
+    assert path.read_bytes() == ARTIFACT_CONTENT
+    assert not (tmp_path / "manifest.json.part").exists()
+    assert not (tmp_path / "manifest.json.part.meta").exists()
+    assert artifact_mock.last_request.headers["Range"] == "bytes=4-"
+    assert artifact_mock.last_request.headers["If-Range"] == ARTIFACT_ETAG
+    assert artifact_mock.last_request.headers["Accept-Encoding"] == "identity"
+
+
+def _interrupt_download(command, requests_mock, path, etag=ARTIFACT_ETAG):
+    """Leaves a .part file with the first 4 bytes of the artifact at path."""
+    requests_mock.get(
+        command.api_url,
+        content=ARTIFACT_CONTENT[:4],
+        headers={"Content-Length": str(len(ARTIFACT_CONTENT)), "ETag": etag},
+    )
+    with pytest.raises(IncompleteDownloadError):
+        command.download_to_path(str(path), use_cache=False)
+
+
+@pytest.mark.run
+def test_get_artifact_download_to_path_does_not_resume_other_run(
+    requests_mock, tmp_path
+):
+    path = tmp_path / "manifest.json"
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    _interrupt_download(command, requests_mock, path)
+    (tmp_path / "manifest.json.part").write_bytes(b"AABB")
+    other_command = command.model_copy(update={"run_id": 2})
+    artifact_mock = requests_mock.get(other_command.api_url, content=_range_response)
+    other_command.download_to_path(str(path), use_cache=False)
+    assert path.read_bytes() == ARTIFACT_CONTENT
+    assert "Range" not in artifact_mock.last_request.headers
+
+
+@pytest.mark.run
+def test_get_artifact_download_to_path_restarts_changed_artifact(
+    requests_mock, tmp_path
+):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    path = tmp_path / "manifest.json"
+    _interrupt_download(command, requests_mock, path, etag='"v0"')
+    (tmp_path / "manifest.json.part").write_bytes(b"AABB")
+    artifact_mock = requests_mock.get(command.api_url, content=_range_response)
+    command.download_to_path(str(path), use_cache=False)
+    assert path.read_bytes() == ARTIFACT_CONTENT
+    assert artifact_mock.last_request.headers["If-Range"] == '"v0"'
+
+
+@pytest.mark.run
+def test_get_artifact_download_to_path_discards_part_file_without_meta(
+    requests_mock, tmp_path
+):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    artifact_mock = requests_mock.get(command.api_url, content=_range_response)
+    path = tmp_path / "manifest.json"
+    (tmp_path / "manifest.json.part").write_bytes(b"AABB")
+    command.download_to_path(str(path), use_cache=False)
+    assert path.read_bytes() == ARTIFACT_CONTENT
+    assert "Range" not in artifact_mock.last_request.headers
+
+
+@pytest.mark.run
+def test_get_artifact_download_to_path_falls_back_to_full_download(
+    requests_mock, tmp_path
+):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    requests_mock.get(command.api_url, content=ARTIFACT_CONTENT)
+    path = tmp_path / "manifest.json"
+    (tmp_path / "manifest.json.part").write_bytes(b"stale")
+    command.download_to_path(str(path), use_cache=False)
+    assert path.read_bytes() == ARTIFACT_CONTENT
+
+
+@pytest.mark.run
+def test_get_artifact_download_to_path_resumes_interrupted_download(
+    requests_mock, tmp_path
+):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo",
+        account_id=123,
+        run_id=1,
+        path="manifest.json",
+        max_retries=1,
+        retry_backoff=0,
+    )
+    artifact_mock = requests_mock.get(
+        command.api_url,
+        [
+            {
+                "content": ARTIFACT_CONTENT[:4],
+                "headers": {
+                    "Content-Length": str(len(ARTIFACT_CONTENT)),
+                    "ETag": ARTIFACT_ETAG,
+                },
+            },
+            {"content": _range_response},
+        ],
+    )
+    path = tmp_path / "manifest.json"
+    command.download_to_path(str(path), use_cache=False)
+    assert path.read_bytes() == ARTIFACT_CONTENT
+    assert artifact_mock.call_count == 2
+    assert artifact_mock.last_request.headers["Range"] == "bytes=4-"
+
+
+@pytest.mark.run
+def test_get_artifact_download_to_path_keeps_part_file_of_incomplete_download(
+    requests_mock, tmp_path
+):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    requests_mock.get(
+        command.api_url,
+        content=ARTIFACT_CONTENT[:4],
+        headers={"Content-Length": str(len(ARTIFACT_CONTENT))},
+    )
+    path = tmp_path / "manifest.json"
+    with pytest.raises(IncompleteDownloadError):
+        command.download_to_path(str(path), use_cache=False)
+    assert not path.exists()
+    assert (tmp_path / "manifest.json.part").read_bytes() == ARTIFACT_CONTENT[:4]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("bytes 100-199/200", (100, 200)), ("bytes 0-9/*", (0, None))],
+)
+def test_parse_content_range(value, expected):
+    assert parse_content_range(value) == expected
+
+
+@pytest.mark.parametrize("value", [None, "", "items 0-9/10", "bytes x-9/10"])
+def test_parse_content_range_raises_on_invalid_header(value):
+    with pytest.raises(IncompleteDownloadError):
+        parse_content_range(value)
+
+
+@pytest.mark.run
+def test_get_artifact_download_to_path_compresses_on_disk(requests_mock, tmp_path):
+    command = DbtCloudRunGetArtifactCommand(
+        api_token="foo", account_id=123, run_id=1, path="manifest.json"
+    )
+    body = gzip.compress(ARTIFACT_CONTENT)
+    artifact_mock = requests_mock.get(
+        command.api_url,
+        content=body,
+        headers={"Content-Encoding": "gzip", "Content-Length": str(len(body))},
+    )
+    path = tmp_path / "manifest.json.gz"
+    command.download_to_path(str(path), use_cache=False, compression="gzip")
+    assert gzip.decompress(path.read_bytes()) == ARTIFACT_CONTENT
+    assert list(tmp_path.iterdir()) == [path]
+    assert "gzip" in artifact_mock.last_request.headers["Accept-Encoding"]
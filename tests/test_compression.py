@@ -0,0 +1,46 @@
+import gzip
+import io
+import pytest
+from dbt_cloud.compression import (
+    compress_file,
+    compressed_writer,
+    open_artifact,
+    read_artifact,
+)
+
+CONTENT = b'{"metadata": {}, "nodes": {}, "sources": {}}' * 100
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_compress_file_roundtrip(tmp_path, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    source = tmp_path / "catalog.json"
+    source.write_bytes(CONTENT)
+    target = tmp_path / "catalog.json.compressed"
+    compress_file(str(source), str(target), compression)
+    assert read_artifact(str(target)) == CONTENT
+    if compression is not None:
+        assert target.stat().st_size < len(CONTENT)
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == ".tmp"] == []
+
+
+def test_compressed_writer_leaves_file_open():
+    file = io.BytesIO()
+    with compressed_writer(file, "gzip") as writer:
+        writer.write(CONTENT)
+    assert not file.closed
+    assert gzip.decompress(file.getvalue()) == CONTENT
+
+
+def test_open_artifact_reads_uncompressed_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_bytes(CONTENT)
+    with open_artifact(str(path)) as f:
+        assert f.read() == CONTENT
+
+
+def test_compressed_writer_raises_on_unknown_compression():
+    with pytest.raises(ValueError):
+        with compressed_writer(io.BytesIO(), "lzma"):
+            pass
@@ -0,0 +1,120 @@
+import pytest
+from unittest.mock import patch
+from dbt_cloud.command import DbtCloudRunListCommand
+from dbt_cloud.polling import (
+    MIN_POLL_INTERVAL,
+    AdaptivePollInterval,
+    get_expected_duration,
+    parse_duration,
+    wait_for_runs,
+)
+
+pytestmark = pytest.mark.run
+
+
+def test_poll_interval_backs_off_as_run_ages():
+    poll_interval = AdaptivePollInterval(poll_min=1, poll_max=30)
+    intervals = [poll_interval.next_interval(elapsed) for elapsed in (0, 50, 1000)]
+    assert intervals == [1, 5, 30]
+
+
+def test_poll_interval_has_a_floor():
+    poll_interval = AdaptivePollInterval(poll_min=0, poll_max=0)
+    assert poll_interval.next_interval(0) == MIN_POLL_INTERVAL
+
+
+def test_poll_interval_polls_at_expected_finish_and_speeds_up_after():
+    poll_interval = AdaptivePollInterval(poll_min=1, poll_max=30, expected_duration=600)
+    assert poll_interval.next_interval(100) == 10
+    assert poll_interval.next_interval(590) == 10
+    assert poll_interval.next_interval(600) == 1
+    assert poll_interval.next_interval(700) == 10
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("00:01:50", 110), ("02:00:00.5", 7200.5), ("1 day, 00:00:10", 86410)],
+)
+def test_parse_duration(value, expected):
+    assert parse_duration(value) == expected
+
+
+def test_get_expected_duration_is_median_of_successful_runs(requests_mock):
+    command = DbtCloudRunListCommand(api_token="foo", account_id=123, job_id="1")
+    durations = ["00:01:00", "00:10:00", "00:02:00"]
+    requests_mock.get(
+        command.api_url, json={"data": [{"duration": d} for d in durations]}
+    )
+    assert get_expected_duration(command) == 120
+    assert requests_mock.last_request.qs["status"] == ["10"]
+
+
+def test_get_expected_duration_without_history(requests_mock):
+    command = DbtCloudRunListCommand(api_token="foo", account_id=123, job_id="1")
+    requests_mock.get(command.api_url, status_code=500)
+    assert get_expected_duration(command) is None
+
+
+def test_wait_for_runs_batches_status_lookups(requests_mock):
+    command = DbtCloudRunListCommand(api_token="foo", account_id=123)
+    requests_mock.get(
+        command.api_url,
+        [
+            {"json": {"data": [{"id": 13, "status": 10}, {"id": 12, "status": 3}]}},
+            {"json": {"data": [{"id": 11, "status": 1}, {"id": 10, "status": 10}]}},
+            {"json": {"data": [{"id": 12, "status": 10}, {"id": 11, "status": 20}]}},
+        ],
+    )
+    updates = []
+    with patch("dbt_cloud.polling.time.sleep") as sleep:
+        runs = wait_for_runs(
+            command,
+            run_ids=[11, 12],
+            poll_interval=AdaptivePollInterval(poll_min=1, poll_max=1),
+            on_update=lambda run: updates.append((run["id"], run["status"])),
+        )
+    assert requests_mock.call_count == 3
+    assert sleep.call_count == 1
+    assert {run_id: run["status"] for run_id, run in runs.items()} == {11: 20, 12: 10}
+    assert updates == [(12, 3), (11, 1), (12, 10), (11, 20)]
+    assert requests_mock.request_history[1].qs["offset"] == ["2"]
+
+
+def test_wait_for_runs_stops_waiting_for_runs_that_are_not_found(requests_mock):
+    command = DbtCloudRunListCommand(api_token="foo", account_id=123)
+    requests_mock.get(
+        command.api_url,
+        json={"data": [{"id": 13, "status": 10}, {"id": 11, "status": 10}]},
+    )
+    updates = []
+    with patch("dbt_cloud.polling.time.sleep") as sleep:
+        runs = wait_for_runs(
+            command,
+            run_ids=[11, 12],
+            poll_interval=AdaptivePollInterval(poll_min=1, poll_max=1),
+            on_update=lambda run: updates.append(run),
+        )
+    sleep.assert_not_called()
+    assert runs[11]["status"] == 10
+    assert runs[12] == {"id": 12, "error": "Run not found."}
+    assert updates[-1] == runs[12]
+
+
+def test_wait_for_runs_looks_up_runs_beyond_page_limit(requests_mock):
+    command = DbtCloudRunListCommand(api_token="foo", account_id=123)
+    list_mock = requests_mock.get(
+        command.api_url,
+        json={"data": [{"id": 100, "status": 1}, {"id": 99, "status": 1}]},
+    )
+    requests_mock.get(f"{command.api_url}/10", json={"data": {"id": 10, "status": 10}})
+    requests_mock.get(f"{command.api_url}/11", status_code=404)
+    with patch("dbt_cloud.polling.time.sleep") as sleep:
+        runs = wait_for_runs(
+            command,
+            run_ids=[10, 11],
+            poll_interval=AdaptivePollInterval(poll_min=1, poll_max=1),
+        )
+    sleep.assert_not_called()
+    assert list_mock.call_count == 2
+    assert runs[10]["status"] == 10
+    assert runs[11]["error"] == "Run not found."
@@ -0,0 +1,61 @@
+from unittest.mock import patch
+from dbt_cloud.ratelimit import (
+    TokenBucket,
+    FileTokenBucket,
+    configure_rate_limiter,
+    create_rate_limiter,
+    get_rate_limiter,
+)
+
+
+def test_token_bucket_spaces_out_requests_after_burst():
+    with patch("dbt_cloud.ratelimit.time.monotonic", return_value=100.0):
+        bucket = TokenBucket(rate=2, burst=2)
+        delays = [bucket.reserve() for _ in range(5)]
+    assert delays == [0.0, 0.0, 0.5, 1.0, 1.5]
+
+
+def test_token_bucket_refills_over_time():
+    with patch("dbt_cloud.ratelimit.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=1, burst=1)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 1.0
+        monotonic.return_value = 103.0
+        assert bucket.reserve() == 0.0
+
+
+def test_file_token_bucket_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "ratelimit.json")
+    with patch("dbt_cloud.ratelimit.time.time", return_value=100.0):
+        first = FileTokenBucket(path=path, rate=1, burst=1)
+        second = FileTokenBucket(path=path, rate=1, burst=1)
+        assert first.reserve() == 0.0
+        assert second.reserve() == 1.0
+        assert first.reserve() == 2.0
+
+
+def test_create_rate_limiter_is_disabled_without_rate(tmp_path):
+    assert create_rate_limiter(rate=None) is None
+    assert create_rate_limiter(rate=0) is None
+    assert isinstance(create_rate_limiter(rate=5), TokenBucket)
+    assert isinstance(
+        create_rate_limiter(rate=5, path=str(tmp_path / "ratelimit.json")),
+        FileTokenBucket,
+    )
+
+
+def test_requests_wait_for_rate_limiter(requests_mock):
+    from dbt_cloud.command import DbtCloudRunGetCommand
+
+    command = DbtCloudRunGetCommand(api_token="foo", account_id=123, run_id=1)
+    requests_mock.get(command.api_url, json={"data": {}})
+    limiter = configure_rate_limiter(rate=10)
+    try:
+        with patch.object(limiter, "acquire") as acquire:
+            command.execute()
+            command.execute()
+        assert acquire.call_count == 2
+    finally:
+        configure_rate_limiter(rate=None)
+    assert get_rate_limiter() is None
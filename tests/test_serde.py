@@ -0,0 +1,199 @@
+import io
+import json
+import pytest
+from unittest.mock import patch
+from dbt_cloud import serde
+from dbt_cloud.exc import DbtCloudException
+from dbt_cloud.serde import (
+    JsonStreamReader,
+    configure_json_backend,
+    create_json_backend,
+    dict_to_json,
+    dict_to_json_bytes,
+    dict_to_json_line,
+    json_to_dict,
+    set_compact_output,
+)
+
+BACKENDS = [
+    "json",
+    pytest.param(
+        "orjson",
+        marks=pytest.mark.skipif(serde.orjson is None, reason="orjson not installed"),
+    ),
+]
+
+DOCUMENT = {
+    "metadata": {"generated_at": "2024-01-01T00:00:00Z"},
+    "nodes": {
+        "model.a": {"columns": {"id": {"index": 1, "comment": "} not the end"}}},
+        "model.b": {"columns": {}},
+    },
+    "count": 12345678901234567890,
+    "errors": None,
+}
+
+
+def _read(reader: JsonStreamReader) -> dict:
+    result = {}
+    for key in reader.iter_object():
+        if key == "nodes":
+            result[key] = {
+                unique_id: reader.read_value() for unique_id in reader.iter_object()
+            }
+        else:
+            result[key] = reader.read_value()
+    return result
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64 * 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_stream_reader_reads_document_in_chunks(chunk_size, indent):
+    text = json.dumps(DOCUMENT, indent=indent)
+    reader = JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+    assert _read(reader) == DOCUMENT
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+def test_json_stream_reader_reads_numbers_split_across_chunks(chunk_size):
+    document = {"a": 12.5, "b": -1e-07, "c": 3.25e10, "d": [0.5, 120, -7.125]}
+    for offset in range(chunk_size):
+        text = " " * offset + json.dumps(document)
+        reader = JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+        result = {}
+        for key in reader.iter_object():
+            if key == "c":
+                reader.skip_value()
+            else:
+                result[key] = reader.read_value()
+        assert result == {"a": 12.5, "b": -1e-07, "d": [0.5, 120, -7.125]}
+
+
+def test_json_stream_reader_reads_number_at_default_chunk_boundary():
+    prefix = '{"pad": "'
+    suffix = '", "v": 12.'
+    padding = "x" * (64 * 1024 - len(prefix) - len(suffix))
+    text = prefix + padding + suffix + "5}"
+    reader = JsonStreamReader(io.StringIO(text))
+    assert {key: reader.read_value() for key in reader.iter_object()} == {
+        "pad": padding,
+        "v": 12.5,
+    }
+
+
+def test_json_stream_reader_reads_empty_object():
+    reader = JsonStreamReader(io.StringIO(" { } "))
+    assert list(reader.iter_object()) == []
+
+
+@pytest.mark.parametrize("text", ['{"a": 1', '{"a" 1}', "[1, 2]", '{"a": {"b": }}'])
+def test_json_stream_reader_raises_on_invalid_json(text):
+    reader = JsonStreamReader(io.StringIO(text), chunk_size=2)
+    with pytest.raises(json.JSONDecodeError):
+        _read(reader)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64 * 1024])
+def test_json_stream_reader_iterates_and_skips_array_items(chunk_size):
+    items = [
+        {"id": 1, "logs": 'a "quoted" ]} \\ line\nand more'},
+        [["[", {}], "\\\\"],
+        "tail \\",
+        None,
+        {"id": 5},
+    ]
+    text = json.dumps({"data": items, "extra": {"count": 5}, "empty": []})
+    reader = JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+    result = {}
+    for key in reader.iter_object():
+        if key == "data":
+            result[key] = []
+            for index in reader.iter_array():
+                if index % 2:
+                    reader.skip_value()
+                else:
+                    result[key].append(reader.read_value())
+        else:
+            result[key] = reader.read_value()
+    assert result == {
+        "data": [items[0], items[2], items[4]],
+        "extra": {"count": 5},
+        "empty": [],
+    }
+
+
+def test_json_stream_reader_skip_value_does_not_decode_values():
+    # Skipped values are only scanned for their end, so invalid content is ignored
+    reader = JsonStreamReader(io.StringIO('{"a": [tru, {"b": x}], "c": 1}'))
+    result = {}
+    for key in reader.iter_object():
+        if key == "a":
+            reader.skip_value()
+        else:
+            result[key] = reader.read_value()
+    assert result == {"c": 1}
+
+
+@pytest.mark.parametrize("text", ['{"a": "unterminated', '{"a": [1, {"b": 2}'])
+def test_json_stream_reader_skip_value_raises_at_end_of_document(text):
+    reader = JsonStreamReader(io.StringIO(text), chunk_size=2)
+    with pytest.raises(json.JSONDecodeError):
+        for _ in reader.iter_object():
+            reader.skip_value()
+
+
+@pytest.fixture
+def json_backend(request):
+    configure_json_backend(request.param)
+    yield request.param
+    configure_json_backend(None)
+
+
+@pytest.mark.parametrize("json_backend", BACKENDS, indirect=True)
+class TestJsonBackend:
+    VALUE = {"data": [{"id": 1, "name": "run", "ok": True, "x": 1.5, "n": None}]}
+
+    def test_encodes_like_json_module(self, json_backend):
+        assert dict_to_json(self.VALUE) == json.dumps(self.VALUE, indent=2)
+        assert dict_to_json_line(self.VALUE) == json.dumps(
+            self.VALUE, separators=(",", ":")
+        )
+        assert dict_to_json_bytes(self.VALUE) == dict_to_json_line(self.VALUE).encode()
+
+    def test_decodes_str_and_bytes(self, json_backend):
+        text = json.dumps(self.VALUE)
+        assert json_to_dict(text) == self.VALUE
+        assert json_to_dict(text.encode()) == self.VALUE
+
+    def test_handles_values_beyond_fast_path(self, json_backend):
+        value = {"big": 2**70, "nested": {1: "non-string key"}}
+        assert json_to_dict(dict_to_json(value)) == {
+            "big": 2**70,
+            "nested": {"1": "non-string key"},
+        }
+
+    def test_raises_json_decode_error(self, json_backend):
+        with pytest.raises(json.JSONDecodeError):
+            json_to_dict(b'{"a": ')
+
+    def test_compact_output(self, json_backend):
+        set_compact_output(True)
+        try:
+            assert dict_to_json(self.VALUE) == dict_to_json_line(self.VALUE)
+        finally:
+            set_compact_output(False)
+
+
+def test_create_json_backend_prefers_orjson_when_installed():
+    assert create_json_backend("json").name == "json"
+    with patch.object(serde, "orjson", None):
+        assert create_json_backend("auto").name == "json"
+        with pytest.raises(DbtCloudException, match="requires the orjson package"):
+            create_json_backend("orjson")
+    if serde.orjson is not None:
+        assert create_json_backend(None).name == "orjson"
+
+
+def test_create_json_backend_rejects_unknown_backend():
+    with pytest.raises(DbtCloudException, match="Unknown JSON backend"):
+        create_json_backend("simplejson")
@@ -1,19 +1,26 @@
 """Tests for dbt_cloud/tools.py — AI agent tool definitions."""
 
+import json
 import os
 import pytest
+import threading
+import time
 from unittest.mock import MagicMock, patch
 from requests.models import Response
 from requests import HTTPError
+from pydantic import ValidationError
 
 from dbt_cloud.tools import (
     TOOL_REGISTRY,
     get_openai_tools,
     get_anthropic_tools,
     execute_tool_call,
+    execute_tool_calls,
+    ResultShape,
     _get_tool_schema,
 )
 from dbt_cloud.command import DbtCloudJobGetCommand, DbtCloudJobRunCommand
+from dbt_cloud.serde import JsonStreamReader
 
 
 class TestToolRegistry:
@@ -131,6 +138,35 @@ class TestGetAnthropicTools:
         assert openai_names == anthropic_names
 
 
+class TestToolDefinitionCache:
+    def test_schemas_are_generated_once(self):
+        get_openai_tools(include=["job_get", "job_list"])
+        with patch("dbt_cloud.tools._model_to_json_schema") as mock_schema:
+            get_openai_tools(include=["job_get", "job_list"])
+            get_openai_tools(include=["job_list", "job_get"])
+        mock_schema.assert_not_called()
+
+    def test_returns_independent_copies(self):
+        tools = get_anthropic_tools(include=["job_get"])
+        tools[0]["input_schema"]["properties"].clear()
+        tools.append({"name": "extra"})
+        fresh = get_anthropic_tools(include=["job_get"])
+        assert len(fresh) == 1
+        assert "job_id" in fresh[0]["input_schema"]["properties"]
+
+    def test_cached_matches_generated(self):
+        tools = get_openai_tools(include=["job_get"])
+        assert tools[0]["function"]["parameters"] == _get_tool_schema(
+            DbtCloudJobGetCommand
+        )
+
+    def test_registry_changes_are_picked_up(self):
+        with patch.dict(TOOL_REGISTRY, {"job_get_alias": DbtCloudJobGetCommand}):
+            names = {t["name"] for t in get_anthropic_tools()}
+        assert "job_get_alias" in names
+        assert "job_get_alias" not in {t["name"] for t in get_anthropic_tools()}
+
+
 class TestExecuteToolCall:
     def _mock_response(self, body):
         resp = MagicMock(spec=Response)
@@ -146,9 +182,7 @@ class TestExecuteToolCall:
         resp = self._mock_response({"status": {"code": 200}, "data": {"id": 1}})
         with (
             patch.dict(os.environ, {"DBT_CLOUD_API_TOKEN": "env-token"}),
-            patch(
-                "dbt_cloud.command.job.get.requests.get", return_value=resp
-            ) as mock_get,
+            patch("requests.Session.request", return_value=resp) as mock_get,
         ):
             execute_tool_call("job_get", {"account_id": 1, "job_id": 42})
 
@@ -166,7 +200,7 @@ class TestExecuteToolCall:
         resp = self._mock_response({"status": {"code": 200}, "data": {}})
         with (
             patch.dict(os.environ, {"DBT_CLOUD_API_TOKEN": "env-token"}),
-            patch("dbt_cloud.command.job.get.requests.get", return_value=resp),
+            patch("requests.Session.request", return_value=resp),
         ):
             # Should not raise even with explicit token
             result = execute_tool_call(
@@ -180,7 +214,7 @@ class TestExecuteToolCall:
         resp = self._mock_response(body)
         with (
             patch.dict(os.environ, {"DBT_CLOUD_API_TOKEN": "tok"}),
-            patch("dbt_cloud.command.job.get.requests.get", return_value=resp),
+            patch("requests.Session.request", return_value=resp),
         ):
             result = execute_tool_call("job_get", {"account_id": 1, "job_id": 99})
         assert result == body
@@ -191,7 +225,246 @@ class TestExecuteToolCall:
         resp.raise_for_status.side_effect = HTTPError("401 Unauthorized")
         with (
             patch.dict(os.environ, {"DBT_CLOUD_API_TOKEN": "tok"}),
-            patch("dbt_cloud.command.job.get.requests.get", return_value=resp),
+            patch("requests.Session.request", return_value=resp),
         ):
             with pytest.raises(HTTPError):
                 execute_tool_call("job_get", {"account_id": 1, "job_id": 99})
+
+
+class TestExecuteToolCalls:
+    def _mock_request(self, bodies: dict, delays: dict = None, barrier=None):
+        """Returns a Session.request mock answering by run or job ID in the URL."""
+
+        def request(method, url, **kwargs):
+            key = url.rstrip("/").rsplit("/", 1)[-1]
+            if barrier is not None:
+                barrier.wait(timeout=5)
+            time.sleep((delays or {}).get(key, 0))
+            resp = MagicMock(spec=Response)
+            status_code, body = bodies[key]
+            resp.status_code = status_code
+            resp.json.return_value = body
+            if status_code >= 400:
+                resp.raise_for_status.side_effect = HTTPError(f"{status_code} Error")
+            else:
+                resp.raise_for_status.return_value = None
+            return resp
+
+        return request
+
+    def test_returns_results_in_input_order(self):
+        bodies = {str(i): (200, {"data": {"id": i}}) for i in range(1, 5)}
+        delays = {"1": 0.05, "2": 0.0, "3": 0.03, "4": 0.01}
+        calls = [("run_get", {"account_id": 1, "run_id": i}) for i in range(1, 5)]
+        with (
+            patch.dict(os.environ, {"DBT_CLOUD_API_TOKEN": "tok"}),
+            patch(
+                "requests.Session.request",
+                side_effect=self._mock_request(bodies, delays),
+            ),
+        ):
+            results = execute_tool_calls(calls)
+        assert [r.result["data"]["id"] for r in results] == [1, 2, 3, 4]
+        assert all(r.ok and r.tool_name == "run_get" for r in results)
+
+    def test_executes_calls_concurrently(self):
+        bodies = {"1": (200, {}), "2": (200, {}), "3": (200, {})}
+        barrier = threading.Barrier(3)
+        calls = [
+            ("run_get", {"account_id": 1, "run_id": 1}),
+            ("run_get", {"account_id": 1, "run_id": 2}),
+            ("job_get", {"account_id": 1, "job_id": 3}),
+        ]
+        with (
+            patch.dict(os.environ, {"DBT_CLOUD_API_TOKEN": "tok"}),
+            patch(
+                "requests.Session.request",
+                side_effect=self._mock_request(bodies, barrier=barrier),
+            ),
+        ):
+            results = execute_tool_calls(calls, max_workers=3)
+        assert all(r.ok for r in results)
+
+    def test_captures_errors_per_call(self):
+        bodies = {"1": (200, {"data": {"id": 1}}), "2": (404, {})}
+        calls = [
+            ("run_get", {"account_id": 1, "run_id": 1}),
+            ("run_get", {"account_id": 1, "run_id": 2}),
+            ("not_a_real_tool", {}),
+            ("run_get", {"account_id": 1}),
+        ]
+        with (
+            patch.dict(os.environ, {"DBT_CLOUD_API_TOKEN": "tok"}),
+            patch("requests.Session.request", side_effect=self._mock_request(bodies)),
+        ):
+            results = execute_tool_calls(calls)
+        assert results[0].ok and results[0].result == {"data": {"id": 1}}
+        assert isinstance(results[1].error, HTTPError)
+        assert isinstance(results[2].error, ValueError)
+        assert results[2].tool_name == "not_a_real_tool"
+        assert isinstance(results[3].error, ValidationError)
+        assert [r.ok for r in results] == [True, False, False, False]
+
+    def test_empty_calls(self):
+        assert execute_tool_calls([]) == []
+
+
+RUNS = [
+    {
+        "id": i,
+        "status": 10,
+        "trigger": {"cause": f"cause {i}", "git_sha": None},
+        "run_steps": [{"name": "dbt run", "logs": "x" * 1000}],
+    }
+    for i in range(1, 6)
+]
+RUN_LIST_BODY = {
+    "status": {"code": 200},
+    "data": RUNS,
+    "extra": {"pagination": {"count": 5, "total_count": 50}},
+}
+
+
+class TestResultShape:
+    @pytest.fixture(autouse=True)
+    def api_env(self, monkeypatch):
+        monkeypatch.setenv("DBT_CLOUD_API_TOKEN", "tok")
+        monkeypatch.setenv("DBT_CLOUD_HOST", "cloud.getdbt.com")
+
+    @pytest.fixture
+    def run_list(self, requests_mock):
+        return requests_mock.get(
+            "https://cloud.getdbt.com/api/v2/accounts/1/runs", json=RUN_LIST_BODY
+        )
+
+    def test_without_shape_returns_full_response(self, run_list):
+        assert execute_tool_call("run_list", {"account_id": 1}) == RUN_LIST_BODY
+
+    def test_projects_fields_of_list_items(self, run_list):
+        result = execute_tool_call(
+            "run_list",
+            {"account_id": 1},
+            shape=ResultShape(fields=["id", "trigger.cause", "run_steps.name"]),
+        )
+        assert result["data"][0] == {
+            "id": 1,
+            "trigger": {"cause": "cause 1"},
+            "run_steps": [{"name": "dbt run"}],
+        }
+        assert result["extra"] == RUN_LIST_BODY["extra"]
+        assert "truncated" not in result
+
+    def test_max_items_keeps_rest_of_response(self, run_list):
+        result = execute_tool_call(
+            "run_list", {"account_id": 1}, shape=ResultShape(max_items=2)
+        )
+        assert result["data"] == RUNS[:2]
+        assert result["truncated"] == {"reason": "max_items", "returned_items": 2}
+        assert result["extra"] == RUN_LIST_BODY["extra"]
+
+    def test_max_bytes_limits_list_items(self, run_list):
+        result = execute_tool_call(
+            "run_list", {"account_id": 1}, shape=ResultShape(max_bytes=2500)
+        )
+        assert result["data"] == RUNS[:2]
+        assert result["truncated"] == {"reason": "max_bytes", "returned_items": 2}
+        assert len(json.dumps(result["data"], separators=(",", ":"))) <= 2500
+
+    def test_max_bytes_omits_fields_of_object(self, requests_mock):
+        requests_mock.get(
+            "https://cloud.getdbt.com/api/v2/accounts/1/runs/1",
+            json={"status": {"code": 200}, "data": RUNS[0]},
+        )
+        result = execute_tool_call(
+            "run_get", {"account_id": 1, "run_id": 1}, shape=ResultShape(max_bytes=200)
+        )
+        assert result["data"] == {
+            "id": 1,
+            "status": 10,
+            "trigger": RUNS[0]["trigger"],
+        }
+        assert result["truncated"] == {
+            "reason": "max_bytes",
+            "omitted_fields": ["run_steps"],
+        }
+
+    @pytest.fixture
+    def decoded_values(self, monkeypatch):
+        values = []
+        read_value = JsonStreamReader.read_value
+
+        def recording_read_value(self, *args, **kwargs):
+            value = read_value(self, *args, **kwargs)
+            values.append(value)
+            return value
+
+        monkeypatch.setattr(JsonStreamReader, "read_value", recording_read_value)
+        return values
+
+    def test_max_bytes_does_not_decode_oversized_values(
+        self, requests_mock, decoded_values
+    ):
+        logs = "x" * 1_000_000
+        run = {**RUNS[0], "run_steps": [{"name": "dbt run", "logs": logs}]}
+        requests_mock.get(
+            "https://cloud.getdbt.com/api/v2/accounts/1/runs/1",
+            json={"status": {"code": 200}, "data": run},
+        )
+        requests_mock.get(
+            "https://cloud.getdbt.com/api/v2/accounts/1/runs",
+            json={"data": [RUNS[0], run, RUNS[1]]},
+        )
+        result = execute_tool_call(
+            "run_get", {"account_id": 1, "run_id": 1}, shape=ResultShape(max_bytes=2000)
+        )
+        assert result["truncated"]["omitted_fields"] == ["run_steps"]
+        result = execute_tool_call(
+            "run_list", {"account_id": 1}, shape=ResultShape(max_bytes=20_000)
+        )
+        assert result["data"] == RUNS[:1]
+        assert all(logs not in json.dumps(value) for value in decoded_values)
+
+    def test_max_bytes_counts_size_of_compact_encoding(self, run_list):
+        # The item plus '[', ']' and a separating comma
+        size = len(json.dumps(RUNS[0], separators=(",", ":"))) + 3
+        for max_bytes, returned_items in [(size - 1, 0), (size, 1)]:
+            result = execute_tool_call(
+                "run_list", {"account_id": 1}, shape=ResultShape(max_bytes=max_bytes)
+            )
+            assert len(result["data"]) == returned_items
+
+    def test_shapes_whole_artifact(self, requests_mock):
+        requests_mock.get(
+            "https://cloud.getdbt.com/api/v2/accounts/1/runs/1/artifacts/manifest.json",
+            json={"metadata": {"dbt_version": "1.7.0"}, "nodes": {"a": {}}},
+        )
+        result = execute_tool_call(
+            "run_get_artifact",
+            {"account_id": 1, "run_id": 1, "path": "manifest.json"},
+            shape=ResultShape(fields=["metadata"]),
+        )
+        assert result == {"metadata": {"dbt_version": "1.7.0"}}
+
+    def test_raises_on_http_error(self, requests_mock):
+        requests_mock.get(
+            "https://cloud.getdbt.com/api/v2/accounts/1/runs", status_code=401
+        )
+        with pytest.raises(HTTPError):
+            execute_tool_call(
+                "run_list", {"account_id": 1}, shape=ResultShape(max_items=1)
+            )
+
+    def test_execute_tool_calls_applies_shapes_per_tool(self, run_list, requests_mock):
+        requests_mock.get(
+            "https://cloud.getdbt.com/api/v2/accounts/1/jobs", json={"data": [1, 2]}
+        )
+        results = execute_tool_calls(
+            [("run_list", {"account_id": 1}), ("job_list", {"account_id": 1})],
+            shapes={"run_list": ResultShape(fields=["id"], max_items=1)},
+        )
+        assert results[0].result["data"] == [{"id": 1}]
+        assert results[1].result == {"data": [1, 2]}
+
+    def test_limits_must_be_positive(self):
+        with pytest.raises(ValidationError):
+            ResultShape(max_items=0)